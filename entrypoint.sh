@@ -8,5 +8,10 @@ mkdir -p /app/data/podcasts
 
 # Run the application with gunicorn (production WSGI server)
 # cd to src directory so relative imports work correctly
+# --keep-alive: hold idle connections long enough for dashboard polling to reuse them
+# --worker-tmp-dir: keep worker heartbeat files on tmpfs instead of the container disk
 cd /app/src
-exec gunicorn --bind 0.0.0.0:8000 --workers 2 --threads 8 --access-logfile - main:app
+exec gunicorn --bind 0.0.0.0:8000 --workers 2 --threads 8 \
+    --keep-alive "${GUNICORN_KEEPALIVE:-5}" \
+    --worker-tmp-dir /dev/shm \
+    --access-logfile - main:app
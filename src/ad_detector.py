@@ -1,13 +1,17 @@
 """Ad detection using Claude API with configurable prompts and model."""
+import hashlib
 import logging
 import json
+import os
 import re
 import time
 import random
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from llm_client import (
-    get_llm_client, get_api_key, LLMClient, FALLBACK_MODELS,
-    is_retryable_error, is_rate_limit_error
+    get_llm_client, get_api_key, LLMClient, LLMResponse, FALLBACK_MODELS,
+    is_retryable_error, is_rate_limit_error,
+    run_with_episode_tracking, add_episode_token_totals
 )
 from utils.time import parse_timestamp, first_not_none
 
@@ -18,7 +22,9 @@ from config import (
     BOUNDARY_EXTENSION_WINDOW, BOUNDARY_EXTENSION_MAX,
     AD_CONTENT_URL_PATTERNS, AD_CONTENT_PROMO_PHRASES,
     LOW_CONFIDENCE, CONTENT_DURATION_THRESHOLD, LOW_EVIDENCE_WARN_THRESHOLD,
-    MIN_KEYWORD_LENGTH, MIN_UNCOVERED_TAIL_DURATION
+    MIN_KEYWORD_LENGTH, MIN_UNCOVERED_TAIL_DURATION,
+    AD_PREFILTER_PHRASES, PREFILTER_MAX_CANDIDATE_RATIO,
+    MIN_DETECTION_TRANSCRIPT_DURATION
 )
 from utils.constants import (
     INVALID_SPONSOR_VALUES, STRUCTURAL_FIELDS,
@@ -39,6 +45,20 @@ Episode: {episode_title}
 Transcript:
 {transcript}"""
 
+# Submit all windows of an episode through the Message Batches API instead of
+# one synchronous call per window. Batches cost 50% less but can take minutes.
+LLM_BATCH_DETECTION = os.environ.get('LLM_BATCH_DETECTION', 'false').lower() == 'true'
+LLM_BATCH_MAX_WAIT = float(os.environ.get('LLM_BATCH_MAX_WAIT', '1800'))
+
+# Maximum number of detection windows sent to the LLM at the same time
+LLM_MAX_CONCURRENCY = int(os.environ.get('LLM_MAX_CONCURRENCY', '4'))
+
+# Days to keep cached window responses keyed by prompt hash (0 disables the cache)
+AD_DETECTION_CACHE_DAYS = int(os.environ.get('AD_DETECTION_CACHE_DAYS', '7'))
+
+# Skip first-pass windows with no sponsor cue in text or audio signals
+AD_DETECTION_PREFILTER = os.environ.get('AD_DETECTION_PREFILTER', 'false').lower() == 'true'
+
 # Retry configuration for transient API errors
 RETRY_CONFIG = {
     'max_retries': 3,
@@ -906,6 +926,7 @@ def create_windows(segments: List[Dict], window_size: float = WINDOW_SIZE_SECOND
             - 'start': window start time (absolute)
             - 'end': window end time (absolute)
             - 'segments': list of segments in this window
+            - 'segment_indices': positions of those segments in the input list
     """
     if not segments:
         return []
@@ -921,17 +942,19 @@ def create_windows(segments: List[Dict], window_size: float = WINDOW_SIZE_SECOND
         window_end = min(window_start + window_size, total_duration)
 
         # Find segments that overlap with this window
-        window_segments = []
-        for seg in segments:
-            # Segment overlaps if it starts before window ends AND ends after window starts
-            if seg['start'] < window_end and seg['end'] > window_start:
-                window_segments.append(seg)
+        # Segment overlaps if it starts before window ends AND ends after window starts
+        window_indices = [
+            i for i, seg in enumerate(segments)
+            if seg['start'] < window_end and seg['end'] > window_start
+        ]
+        window_segments = [segments[i] for i in window_indices]
 
         if window_segments:
             windows.append({
                 'start': window_start,
                 'end': window_end,
-                'segments': window_segments
+                'segments': window_segments,
+                'segment_indices': window_indices
             })
 
         window_start += step_size
@@ -940,6 +963,16 @@ def create_windows(segments: List[Dict], window_size: float = WINDOW_SIZE_SECOND
     return windows
 
 
+def format_transcript_lines(segments: List[Dict]) -> List[str]:
+    """Format each segment as a '[start - end] text' prompt line.
+
+    Called once per detection pass; windows join their slice of the result
+    via 'segment_indices' so segments shared by overlapping windows are not
+    formatted twice.
+    """
+    return [f"[{s['start']:.1f}s - {s['end']:.1f}s] {s['text']}" for s in segments]
+
+
 def deduplicate_window_ads(all_ads: List[Dict], merge_threshold: float = 5.0) -> List[Dict]:
     """Deduplicate and merge ads detected across multiple windows.
 
@@ -996,6 +1029,29 @@ def deduplicate_window_ads(all_ads: List[Dict], merge_threshold: float = 5.0) ->
     return merged
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def iter_json_arrays(text: str):
+    """Yield each top-level JSON array embedded in free-form text.
+
+    Scans forward from every '[' and decodes in place with raw_decode, so
+    the text is walked once with no regex backtracking or substring copies.
+    After a successful decode the scan resumes past the decoded array;
+    brackets that do not start valid JSON (e.g. "[00:01:23]") are skipped.
+    """
+    idx = text.find('[')
+    while idx != -1:
+        try:
+            value, end = _JSON_DECODER.raw_decode(text, idx)
+        except json.JSONDecodeError:
+            idx = text.find('[', idx + 1)
+            continue
+        if isinstance(value, list):
+            yield value
+        idx = text.find('[', end)
+
+
 class AdDetector:
     """Detect advertisements in podcast transcripts using Claude API.
 
@@ -1231,7 +1287,7 @@ class AdDetector:
         Tries 4 strategies in order:
         0. Direct JSON parse (handles various wrapper object structures)
         1. Markdown code block extraction
-        2. Regex scan for JSON arrays (uses last valid match)
+        2. Incremental scan for embedded JSON arrays (uses last valid match)
         3. Bracket-delimited fallback (first '[' to last ']')
 
         Returns (ads_list, extraction_method) or (None, None) if no valid JSON found.
@@ -1288,26 +1344,23 @@ class AdDetector:
             except json.JSONDecodeError:
                 pass
 
-        # Strategy 2: Regex scan for JSON arrays (use last valid match)
+        # Strategy 2: Incremental scan for embedded JSON arrays (use last valid match)
         last_valid_ads = None
-        for match in re.finditer(r'\[(?:[^\[\]]*|\[(?:[^\[\]]*|\[[^\[\]]*\])*\])*\]', response_text):
-            try:
-                potential_ads = json.loads(match.group())
-                if isinstance(potential_ads, list):
-                    if not potential_ads or (potential_ads and isinstance(potential_ads[0], dict) and 'start' in potential_ads[0]):
-                        last_valid_ads = potential_ads
-            except json.JSONDecodeError:
-                continue
+        for potential_ads in iter_json_arrays(response_text):
+            if not potential_ads or (isinstance(potential_ads[0], dict) and 'start' in potential_ads[0]):
+                last_valid_ads = potential_ads
         if last_valid_ads is not None:
-            return last_valid_ads, "regex_json_array"
-
-        # Strategy 3: Bracket-delimited fallback
-        clean_response = re.sub(r'```json\s*', '', response_text)
-        clean_response = re.sub(r'```\s*', '', clean_response)
-        start_idx = clean_response.find('[')
-        end_idx = clean_response.rfind(']') + 1
-        if start_idx >= 0 and end_idx > start_idx:
-            json_str = clean_response[start_idx:end_idx]
+            return last_valid_ads, "scanned_json_array"
+
+        # Strategy 3: Bracket-delimited fallback (first '[' to last ']').
+        # partition/rpartition split in one pass each; code fences only need
+        # stripping when they fall inside the bracketed region.
+        _, open_bracket, rest = response_text.partition('[')
+        body, close_bracket, _ = rest.rpartition(']')
+        if open_bracket and close_bracket:
+            json_str = f"[{body}]"
+            if '```' in json_str:
+                json_str = re.sub(r'```(?:json)?\s*', '', json_str)
             try:
                 return json.loads(json_str), "bracket_fallback"
             except json.JSONDecodeError as e:
@@ -1325,6 +1378,16 @@ class AdDetector:
         Returns:
             List of validated ad dicts with start, end, confidence, reason, end_text
         """
+        return self._parse_ads_with_status(response_text, slug, episode_id)[0]
+
+    def _parse_ads_with_status(self, response_text: str, slug: str = None,
+                               episode_id: str = None) -> Tuple[List[Dict], bool]:
+        """Parse ad segments and report whether the response held a JSON array.
+
+        Returns:
+            (ads, parsed) where parsed is False when no ads array could be
+            extracted, so callers can tell a malformed reply from "no ads".
+        """
         def get_valid_value(value):
             if not value:
                 return None
@@ -1378,6 +1441,9 @@ class AdDetector:
                     return sponsor
             return None
 
+        priority_lower = {f.lower() for f in SPONSOR_PRIORITY_FIELDS}
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         def extract_sponsor_name(ad: dict) -> str:
             """Extract sponsor/advertiser name using priority fields, keywords, and dynamic scanning."""
             for field in SPONSOR_PRIORITY_FIELDS:
@@ -1393,7 +1459,6 @@ class AdDetector:
                         if value:
                             return value
 
-            priority_lower = {f.lower() for f in SPONSOR_PRIORITY_FIELDS}
             for key, val in ad.items():
                 key_lower = key.lower()
                 if key_lower in STRUCTURAL_FIELDS or key_lower in priority_lower:
@@ -1418,14 +1483,15 @@ class AdDetector:
 
             if ads is None or not isinstance(ads, list):
                 logger.warning(f"[{slug}:{episode_id}] No valid JSON array found in response")
-                return []
+                return [], False
 
             # Validate and normalize ads - handle various field name patterns
             valid_ads = []
             for ad in ads:
                 if isinstance(ad, dict):
-                    # Log raw ad object for debugging
-                    logger.debug(f"[{slug}:{episode_id}] Raw ad from LLM: {json.dumps(ad, default=str)[:500]}")
+                    # Log raw ad object for debugging (skip the dump when DEBUG is off)
+                    if debug_enabled:
+                        logger.debug(f"[{slug}:{episode_id}] Raw ad from LLM: {json.dumps(ad, default=str)[:500]}")
                     # Try various field name patterns for start/end times
                     # Use first_not_none instead of `or` to avoid dropping 0.0 (pre-roll ads)
                     start_val = first_not_none(
@@ -1460,7 +1526,8 @@ class AdDetector:
                                 # Extract sponsor/advertiser name using priority fields + pattern matching
                                 # Try extract_sponsor_name first for a real sponsor name.
                                 # If it returns the default, fall back to Claude's raw reason.
-                                reason = extract_sponsor_name(ad)
+                                sponsor_name = extract_sponsor_name(ad)
+                                reason = sponsor_name
                                 existing_reason = ad.get('reason')
                                 if reason == 'Advertisement detected':
                                     if existing_reason and isinstance(existing_reason, str) and len(existing_reason) > 3:
@@ -1553,7 +1620,6 @@ class AdDetector:
                                     'end_text': ad.get('end_text') or ''
                                 }
                                 # Store sponsor name separately for UI display
-                                sponsor_name = extract_sponsor_name(ad)
                                 if sponsor_name and sponsor_name != 'Advertisement detected':
                                     ad_entry['sponsor'] = sponsor_name
                                 valid_ads.append(ad_entry)
@@ -1561,11 +1627,11 @@ class AdDetector:
                             logger.warning(f"[{slug}:{episode_id}] Skipping ad with invalid timestamp: {e}")
                             continue
 
-            return valid_ads
+            return valid_ads, True
 
         except json.JSONDecodeError as e:
             logger.error(f"[{slug}:{episode_id}] Failed to parse JSON: {e}")
-            return []
+            return [], False
 
     def detect_ads(self, segments: List[Dict], podcast_name: str = "Unknown",
                    episode_title: str = "Unknown", slug: str = None,
@@ -1582,6 +1648,19 @@ class AdDetector:
             podcast_description: Podcast-level description for context
             progress_callback: Optional callback(stage, percent) to report progress
         """
+        # Too short to hold an ad break alongside any content: skip the LLM entirely
+        span = segments[-1]['end'] - segments[0]['start'] if segments else 0.0
+        if span < MIN_DETECTION_TRANSCRIPT_DURATION:
+            logger.info(f"[{slug}:{episode_id}] Skipping LLM detection - transcript spans "
+                       f"{span:.0f}s (< {MIN_DETECTION_TRANSCRIPT_DURATION:.0f}s)")
+            return {
+                "ads": [],
+                "status": "success",
+                "raw_response": "",
+                "prompt": "Skipped: transcript too short",
+                "model": "skipped-too-short"
+            }
+
         if not self.api_key:
             logger.warning("Skipping ad detection - no API key")
             return {"ads": [], "status": "failed", "error": "No API key", "retryable": False}
@@ -1597,6 +1676,7 @@ class AdDetector:
 
             # Create overlapping windows from transcript
             windows = create_windows(segments)
+            segment_lines = format_transcript_lines(segments)
             total_duration = segments[-1]['end'] if segments else 0
 
             logger.info(f"[{slug}:{episode_id}] Processing {len(windows)} windows "
@@ -1626,9 +1706,17 @@ class AdDetector:
                 description_section += sponsor_history
                 logger.info(f"[{slug}:{episode_id}] Including sponsor history: {sponsor_history.strip()}")
 
+            # Everything before the transcript is identical for every window of
+            # this episode; it becomes a second prompt-cache breakpoint.
+            episode_prefix = user_prompt_template.format(
+                podcast_name=podcast_name,
+                episode_title=episode_title,
+                description_section=description_section,
+                transcript=""
+            )
+
             all_window_ads = []
             all_raw_responses = []
-            max_retries = RETRY_CONFIG['max_retries']
 
             # Instantiate audio signal formatter if audio analysis available
             audio_enforcer = None
@@ -1636,23 +1724,15 @@ class AdDetector:
                 from audio_enforcer import AudioEnforcer
                 audio_enforcer = AudioEnforcer()
 
-            # Process each window
+            # Build prompts for every window up front so they can be batched
+            window_prompts = []
+            windows_with_audio = set()
             for i, window in enumerate(windows):
-                # Report progress for each window (keeps UI indicator alive)
-                if progress_callback:
-                    # First pass: 50-80% range (detecting phase)
-                    progress = 50 + int((i / max(len(windows), 1)) * 30)
-                    progress_callback(f"detecting:{i+1}/{len(windows)}", progress)
-
-                window_segments = window['segments']
                 window_start = window['start']
                 window_end = window['end']
 
                 # Build transcript for this window (segments have absolute timestamps)
-                transcript_lines = []
-                for seg in window_segments:
-                    transcript_lines.append(f"[{seg['start']:.1f}s - {seg['end']:.1f}s] {seg['text']}")
-                transcript = "\n".join(transcript_lines)
+                transcript = "\n".join(segment_lines[k] for k in window['segment_indices'])
 
                 # Add audio context if available for this window
                 audio_context = ""
@@ -1670,54 +1750,77 @@ class AdDetector:
 - If an ad extends past this window, use {window_end:.1f} with note "continues in next"
 """
 
-                prompt = user_prompt_template.format(
+                if audio_context:
+                    windows_with_audio.add(i)
+
+                window_prompts.append(user_prompt_template.format(
                     podcast_name=podcast_name,
                     episode_title=episode_title,
                     description_section=description_section,
                     transcript=transcript
-                ) + audio_context + window_context
+                ) + audio_context + window_context)
 
-                logger.info(f"[{slug}:{episode_id}] Window {i+1}/{len(windows)}: "
-                           f"{window_start/60:.1f}-{window_end/60:.1f}min, {len(window_segments)} segments")
+            # Reuse stored responses for windows whose exact prompt was already
+            # answered (reprocessing, retries, cross-posted episodes)
+            cache_keys = [
+                self._detection_cache_key(model, system_prompt, prompt)
+                for prompt in window_prompts
+            ]
+            responses = self._get_cached_window_responses(cache_keys, model, slug, episode_id)
+            cached_windows = set(responses)
 
-                # Call Claude API with retry logic
-                response = None
-                last_error = None
+            skipped_windows = set()
+            if AD_DETECTION_PREFILTER:
+                skipped_windows = self._prefilter_windows(
+                    windows, windows_with_audio, slug, episode_id
+                )
+            pending = [i for i in range(len(windows))
+                       if i not in responses and i not in skipped_windows]
 
-                for attempt in range(max_retries + 1):
-                    try:
-                        response = self._llm_client.messages_create(
-                            model=model,
-                            max_tokens=2000,
-                            temperature=0.0,
-                            system=system_prompt,
-                            messages=[{"role": "user", "content": prompt}],
-                            timeout=120.0,
-                            response_format={"type": "json_object"}
-                        )
-                        break
-                    except Exception as e:
-                        last_error = e
-                        if self._is_retryable_error(e) and attempt < max_retries:
-                            if is_rate_limit_error(e):
-                                delay = 60.0
-                                logger.warning(f"[{slug}:{episode_id}] Window {i+1} rate limit, waiting {delay:.0f}s")
-                            else:
-                                delay = self._calculate_backoff(attempt)
-                                logger.warning(f"[{slug}:{episode_id}] Window {i+1} API error: {e}. Retrying in {delay:.1f}s")
-                            time.sleep(delay)
-                            continue
-                        else:
-                            logger.error(f"[{slug}:{episode_id}] Window {i+1} failed: {e}")
-                            return {
-                                "ads": [],
-                                "status": "failed",
-                                "error": str(e),
-                                "error_type": type(e).__name__,
-                                "retryable": self._is_retryable_error(e),
-                                "prompt": f"Failed at window {i+1}"
-                            }
+            # Optionally submit the remaining windows as one Message Batch (half
+            # price, higher latency). Windows without a batch result use the sync path.
+            if (LLM_BATCH_DETECTION and len(pending) > 1
+                    and self._llm_client.supports_batches()):
+                if progress_callback:
+                    progress_callback("detecting:batch", 50)
+                responses.update(self._detect_windows_batch(
+                    window_prompts, model, system_prompt, slug, episode_id,
+                    indices=pending, cache_prefix=episode_prefix
+                ))
+                pending = [i for i in pending if i not in responses]
+
+            # Fetch the remaining windows, up to LLM_MAX_CONCURRENCY at once
+            if pending:
+                window_responses, failure = self._call_windows_concurrently(
+                    pending, window_prompts, model, system_prompt,
+                    slug, episode_id, progress_callback, total=len(windows),
+                    cache_prefix=episode_prefix
+                )
+                if failure:
+                    i, e = failure
+                    return {
+                        "ads": [],
+                        "status": "failed",
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                        "retryable": self._is_retryable_error(e),
+                        "prompt": f"Failed at window {i+1}"
+                    }
+                responses.update(window_responses)
+
+            # Process each window in order
+            for i, window in enumerate(windows):
+                if i in skipped_windows:
+                    continue
+
+                window_segments = window['segments']
+                window_start = window['start']
+                window_end = window['end']
+
+                logger.info(f"[{slug}:{episode_id}] Window {i+1}/{len(windows)}: "
+                           f"{window_start/60:.1f}-{window_end/60:.1f}min, {len(window_segments)} segments")
 
+                response = responses.get(i)
                 if response is None:
                     logger.error(f"[{slug}:{episode_id}] Window {i+1} - no response after retries")
                     continue
@@ -1727,7 +1830,14 @@ class AdDetector:
                 all_raw_responses.append(f"=== Window {i+1} ({window_start/60:.1f}-{window_end/60:.1f}min) ===\n{response_text}")
 
                 # Parse ads from response
-                window_ads = self._parse_ads_from_response(response_text, slug, episode_id)
+                window_ads, parsed = self._parse_ads_with_status(response_text, slug, episode_id)
+
+                # Only replay replies that held an ads array; a truncated or
+                # refused reply must not stick around for retries
+                if parsed and i not in cached_windows:
+                    self._save_cached_window_response(cache_keys[i], model, response_text)
+                elif not parsed and i in cached_windows:
+                    self._evict_cached_window_response(cache_keys[i])
 
                 # Validate timestamps against actual transcript content
                 # (catches Claude hallucinating ad positions)
@@ -1787,6 +1897,215 @@ class AdDetector:
             logger.error(f"[{slug}:{episode_id}] Ad detection failed: {e}")
             return {"ads": [], "status": "failed", "error": str(e), "retryable": self._is_retryable_error(e)}
 
+    def _call_window(self, window_num: int, prompt: str, model: str,
+                     system_prompt: str, slug: str = None,
+                     episode_id: str = None, cache_prefix: str = None):
+        """Call the LLM for one detection window with retry/backoff.
+
+        Returns the LLMResponse, or None if retries ran out. Non-retryable
+        errors are re-raised.
+        """
+        max_retries = RETRY_CONFIG['max_retries']
+        for attempt in range(max_retries + 1):
+            try:
+                return self._llm_client.messages_create(
+                    model=model,
+                    max_tokens=2000,
+                    temperature=0.0,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": prompt}],
+                    timeout=120.0,
+                    response_format={"type": "json_object"},
+                    cache_system=True,
+                    cache_prefix=cache_prefix
+                )
+            except Exception as e:
+                if self._is_retryable_error(e) and attempt < max_retries:
+                    if is_rate_limit_error(e):
+                        delay = 60.0
+                        logger.warning(f"[{slug}:{episode_id}] Window {window_num} rate limit, waiting {delay:.0f}s")
+                    else:
+                        delay = self._calculate_backoff(attempt)
+                        logger.warning(f"[{slug}:{episode_id}] Window {window_num} API error: {e}. Retrying in {delay:.1f}s")
+                    time.sleep(delay)
+                    continue
+                logger.error(f"[{slug}:{episode_id}] Window {window_num} failed: {e}")
+                raise
+        return None
+
+    def _call_windows_concurrently(self, indices: List[int], window_prompts: List[str],
+                                   model: str, system_prompt: str, slug: str = None,
+                                   episode_id: str = None, progress_callback=None,
+                                   total: int = None, cache_prefix: str = None):
+        """Run _call_window for the given window indices on a bounded thread pool.
+
+        Returns (responses, failure) where responses maps window index ->
+        LLMResponse (or None) and failure is (index, exception) for the
+        earliest window that failed, or None.
+        """
+        total = total or len(indices)
+        responses = {}
+        failure = None
+        workers = max(1, min(LLM_MAX_CONCURRENCY, len(indices)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    run_with_episode_tracking, self._call_window,
+                    i + 1, window_prompts[i], model, system_prompt, slug, episode_id,
+                    cache_prefix
+                ): i
+                for i in indices
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    response, tokens = future.result()
+                    add_episode_token_totals(tokens)
+                    responses[i] = response
+                except Exception as e:
+                    if failure is None or i < failure[0]:
+                        failure = (i, e)
+                    for other in futures:
+                        other.cancel()
+
+                # Report progress as windows complete (keeps UI indicator alive)
+                if progress_callback:
+                    # First pass: 50-80% range (detecting phase)
+                    progress = 50 + int((done / max(len(indices), 1)) * 30)
+                    progress_callback(f"detecting:{total - len(indices) + done}/{total}", progress)
+
+        return responses, failure
+
+    def _prefilter_windows(self, windows: List[Dict], windows_with_audio: set,
+                           slug: str = None, episode_id: str = None) -> set:
+        """Pick first-pass windows that can skip the LLM call.
+
+        A window is kept when it is the first or last window (pre/post-roll),
+        has audio signals, or its text contains a sponsor cue: a known sponsor
+        name, an ad URL/promo phrase, or AD_PREFILTER_PHRASES. If at least
+        PREFILTER_MAX_CANDIDATE_RATIO of windows are kept, nothing is skipped.
+
+        Returns the set of window indices to skip.
+        """
+        sponsor_names = set()
+        try:
+            sponsor_names = {
+                name.lower() for name in self.sponsor_service.get_sponsor_names()
+                if len(name) >= MIN_KEYWORD_LENGTH
+            }
+        except Exception as e:
+            logger.warning(f"[{slug}:{episode_id}] Pre-filter could not load sponsors: {e}")
+
+        last = len(windows) - 1
+        skipped = set()
+        for i, window in enumerate(windows):
+            if i in (0, last) or i in windows_with_audio:
+                continue
+            text = " ".join(seg['text'] for seg in window['segments']).lower()
+            if _text_has_ad_content(text, sponsor_names):
+                continue
+            if any(phrase in text for phrase in AD_PREFILTER_PHRASES):
+                continue
+            skipped.add(i)
+
+        kept = len(windows) - len(skipped)
+        if not skipped or kept >= len(windows) * PREFILTER_MAX_CANDIDATE_RATIO:
+            return set()
+
+        logger.info(f"[{slug}:{episode_id}] Pre-filter: skipping {len(skipped)}/{len(windows)} "
+                   f"windows with no sponsor cues: {sorted(i + 1 for i in skipped)}")
+        return skipped
+
+    @staticmethod
+    def _detection_cache_key(model: str, system_prompt: str, prompt: str) -> str:
+        """Hash everything that determines a window's LLM response."""
+        return hashlib.sha256(
+            f"{model}|{system_prompt}|{prompt}".encode('utf-8')
+        ).hexdigest()
+
+    def _get_cached_window_responses(self, cache_keys: List[str], model: str,
+                                     slug: str = None,
+                                     episode_id: str = None) -> Dict[int, LLMResponse]:
+        """Look up cached responses for each window key.
+
+        Returns a dict of window index -> LLMResponse for cache hits. The
+        cache is skipped entirely when AD_DETECTION_CACHE_DAYS is 0.
+        """
+        if AD_DETECTION_CACHE_DAYS <= 0:
+            return {}
+        hits = {}
+        try:
+            for i, key in enumerate(cache_keys):
+                text = self.db.get_detection_cache(key)
+                if text:
+                    hits[i] = LLMResponse(content=text, model=model, usage={})
+        except Exception as e:
+            logger.warning(f"[{slug}:{episode_id}] Detection cache lookup failed: {e}")
+            return {}
+        if hits:
+            logger.info(f"[{slug}:{episode_id}] Detection cache: {len(hits)}/{len(cache_keys)} windows reused")
+        return hits
+
+    def _save_cached_window_response(self, cache_key: str, model: str, response_text: str):
+        """Store a window response for later reuse (best effort)."""
+        if AD_DETECTION_CACHE_DAYS <= 0:
+            return
+        try:
+            self.db.save_detection_cache(cache_key, model, response_text)
+        except Exception as e:
+            logger.warning(f"Failed to store detection cache entry: {e}")
+
+    def _evict_cached_window_response(self, cache_key: str):
+        """Drop a cached window response that no longer parses (best effort)."""
+        try:
+            self.db.delete_detection_cache(cache_key)
+        except Exception as e:
+            logger.warning(f"Failed to evict detection cache entry: {e}")
+
+    def _detect_windows_batch(self, window_prompts: List[str], model: str,
+                              system_prompt: str, slug: str = None,
+                              episode_id: str = None,
+                              indices: List[int] = None,
+                              cache_prefix: str = None) -> Dict[int, object]:
+        """Run detection windows through the provider's batch API.
+
+        Only the windows in indices are submitted (all windows by default).
+
+        Returns a dict of window index -> LLMResponse for windows that
+        succeeded. Any failure returns an empty dict so the caller falls back
+        to per-window synchronous calls.
+        """
+        requests = [
+            {
+                'custom_id': f"window-{i}",
+                'model': model,
+                'max_tokens': 2000,
+                'temperature': 0.0,
+                'system': system_prompt,
+                'messages': [{"role": "user", "content": prompt}],
+                'response_format': {"type": "json_object"},
+                'cache_system': True,
+                'cache_prefix': cache_prefix,
+            }
+            for i, prompt in enumerate(window_prompts)
+            if indices is None or i in indices
+        ]
+        try:
+            logger.info(f"[{slug}:{episode_id}] Submitting {len(requests)} windows as message batch")
+            results = self._llm_client.messages_batch_create(
+                requests, max_wait=LLM_BATCH_MAX_WAIT
+            )
+        except Exception as e:
+            logger.warning(f"[{slug}:{episode_id}] Batch detection failed, using per-window calls: {e}")
+            return {}
+
+        return {
+            int(custom_id.split('-', 1)[1]): response
+            for custom_id, response in results.items()
+            if response is not None
+        }
+
     def process_transcript(self, segments: List[Dict], podcast_name: str = "Unknown",
                           episode_title: str = "Unknown", slug: str = None,
                           episode_id: str = None, episode_description: str = None,
@@ -2350,6 +2669,7 @@ class AdDetector:
             self.initialize_client()
 
             windows = create_windows(segments)
+            segment_lines = format_transcript_lines(segments)
             total_duration = segments[-1]['end'] if segments else 0
 
             logger.info(f"[{slug}:{episode_id}] Verification: Processing {len(windows)} windows "
@@ -2374,6 +2694,13 @@ class AdDetector:
             if sponsor_history:
                 description_section += sponsor_history
 
+            episode_prefix = USER_PROMPT_TEMPLATE.format(
+                podcast_name=podcast_name,
+                episode_title=episode_title,
+                description_section=description_section,
+                transcript=""
+            )
+
             all_window_ads = []
             all_raw_responses = []
             max_retries = RETRY_CONFIG['max_retries']
@@ -2389,14 +2716,10 @@ class AdDetector:
                     progress = 85 + int((i / max(len(windows), 1)) * 10)
                     progress_callback(f"detecting:{i+1}/{len(windows)}", progress)
 
-                window_segments = window['segments']
                 window_start = window['start']
                 window_end = window['end']
 
-                transcript_lines = []
-                for seg in window_segments:
-                    transcript_lines.append(f"[{seg['start']:.1f}s - {seg['end']:.1f}s] {seg['text']}")
-                transcript = "\n".join(transcript_lines)
+                transcript = "\n".join(segment_lines[k] for k in window['segment_indices'])
 
                 # Add audio context if available for this window
                 audio_context = ""
@@ -2433,7 +2756,9 @@ class AdDetector:
                             system=system_prompt,
                             messages=[{"role": "user", "content": prompt}],
                             timeout=120.0,
-                            response_format={"type": "json_object"}
+                            response_format={"type": "json_object"},
+                            cache_system=True,
+                            cache_prefix=episode_prefix
                         )
                         break
                     except Exception as e:
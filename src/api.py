@@ -5,21 +5,28 @@ import math
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional
-from flask import Blueprint, jsonify, request, Response, session
+from flask import Blueprint, jsonify, request, Response, send_file, session
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from functools import wraps
+from functools import lru_cache, wraps
 from werkzeug.security import generate_password_hash, check_password_hash
 
-from utils.time import parse_timestamp
-from utils.text import extract_text_in_range
+from utils.json import orjson, json_loads
+from utils.text import extract_text_in_range, parse_transcript_segments
 from utils.url import validate_url, SSRFError
 from sponsor_service import SponsorService
 
 logger = logging.getLogger('podcast.api')
 
+# Environment-derived settings are fixed for the life of the process
+BASE_URL = os.environ.get('BASE_URL', 'http://localhost:8000')
+WHISPER_MODEL = os.environ.get('WHISPER_MODEL', 'small')
+WHISPER_DEVICE = os.environ.get('WHISPER_DEVICE', 'cuda')
+RETENTION_PERIOD = os.environ.get('RETENTION_PERIOD')
+
 # Track server start time for uptime calculation
 # Stored in shared file so all gunicorn workers report the same uptime
 def _init_server_start_time():
@@ -119,18 +126,40 @@ def check_auth():
     return None
 
 
+_storage = None
+
+
 def get_storage():
-    """Get storage instance."""
-    from storage import Storage
-    return Storage()
+    """Get the shared storage instance, creating it on first use."""
+    global _storage
+    if _storage is None:
+        from storage import Storage
+        _storage = Storage()
+    return _storage
 
 
 def get_database():
-    """Get database instance."""
+    """Get database instance (Database is a process-wide singleton)."""
     from database import Database
     return Database()
 
 
+# Runs initial RSS fetches for newly added feeds off the request thread
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='feed-refresh')
+
+
+def refresh_feed_in_background(slug: str, source_url: str):
+    """Queue refresh_rss_feed for a feed without blocking the request."""
+    def run():
+        try:
+            from main import refresh_rss_feed
+            refresh_rss_feed(slug, source_url)
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {slug}: {e}")
+
+    _refresh_executor.submit(run)
+
+
 def log_request(f):
     """Decorator to log API requests with detailed info (IP, user-agent, response time)."""
     @wraps(f)
@@ -153,9 +182,30 @@ def log_request(f):
 
 
 def json_response(data, status=200):
-    """Create JSON response with proper headers."""
-    response = jsonify(data)
-    response.status_code = status
+    """Create JSON response with proper headers.
+
+    Serializes with orjson when available; payloads orjson rejects fall back
+    to Flask's jsonify. Successful GET responses carry an ETag and answer a
+    matching If-None-Match with 304 Not Modified.
+    """
+    response = None
+    if orjson is not None:
+        try:
+            response = Response(
+                orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+                status=status,
+                mimetype='application/json'
+            )
+        except TypeError:
+            pass
+    if response is None:
+        response = jsonify(data)
+        response.status_code = status
+
+    if status == 200 and request.method in ('GET', 'HEAD'):
+        response.add_etag()
+        response.headers['Cache-Control'] = 'no-cache'
+        response.make_conditional(request)
     return response
 
 
@@ -189,33 +239,18 @@ def extract_sponsor_from_text(ad_text: str) -> str:
 @api.route('/feeds', methods=['GET'])
 @log_request
 def list_feeds():
-    """List all podcast feeds with metadata."""
-    db = get_database()
-    storage = get_storage()
-
-    podcasts = db.get_all_podcasts()
+    """List all podcast feeds with metadata.
 
-    feeds = []
-    for podcast in podcasts:
-        # Build feed URL
-        base_url = os.environ.get('BASE_URL', 'http://localhost:8000')
-        feed_url = f"{base_url}/{podcast['slug']}"
-
-        feeds.append({
-            'slug': podcast['slug'],
-            'title': podcast['title'] or podcast['slug'],
-            'sourceUrl': podcast['source_url'],
-            'feedUrl': feed_url,
-            'artworkUrl': f"/api/v1/feeds/{podcast['slug']}/artwork" if podcast.get('artwork_cached') else podcast.get('artwork_url'),
-            'episodeCount': podcast.get('episode_count', 0),
-            'processedCount': podcast.get('processed_count', 0),
-            'lastRefreshed': podcast.get('last_checked_at'),
-            'createdAt': podcast.get('created_at'),
-            'lastEpisodeDate': podcast.get('last_episode_date'),
-            'networkId': podcast.get('network_id'),
-            'daiPlatform': podcast.get('dai_platform')
-        })
+    The feed list is cached for a few seconds to collapse dashboard polling;
+    feed add/update/delete invalidates it.
+    """
+    from main import _feed_list_cache
+    cached = _feed_list_cache.get('feeds')
+    if cached is not None:
+        return json_response({'feeds': cached})
 
+    feeds = get_database().get_feed_list(BASE_URL)
+    _feed_list_cache.set('feeds', feeds)
     return json_response({'feeds': feeds})
 
 
@@ -292,18 +327,12 @@ def add_feed():
         invalidate_feed_cache()
 
         # Trigger initial refresh in background
-        try:
-            from main import refresh_rss_feed
-            refresh_rss_feed(slug, source_url)
-        except Exception as e:
-            logger.warning(f"Initial refresh failed for {slug}: {e}")
-
-        base_url = os.environ.get('BASE_URL', 'http://localhost:8000')
+        refresh_feed_in_background(slug, source_url)
 
         return json_response({
             'slug': slug,
             'sourceUrl': source_url,
-            'feedUrl': f"{base_url}/{slug}",
+            'feedUrl': f"{BASE_URL}/{slug}",
             'message': 'Feed added successfully'
         }, 201)
 
@@ -425,15 +454,9 @@ def import_opml():
         from main import invalidate_feed_cache
         invalidate_feed_cache()
 
-        # Trigger refresh for imported feeds
-        try:
-            from main import refresh_rss_feed
-            for feed in imported[:5]:  # Limit to first 5 to avoid overload
-                podcast = db.get_podcast_by_slug(feed['slug'])
-                if podcast:
-                    refresh_rss_feed(feed['slug'], podcast['source_url'])
-        except Exception as e:
-            logger.warning(f"OPML import: Failed to trigger refreshes: {e}")
+        # Trigger refresh for imported feeds (executor bounds concurrency)
+        for feed in imported:
+            refresh_feed_in_background(feed['slug'], feed['url'])
 
     logger.info(
         f"OPML import complete: {len(imported)} imported, "
@@ -462,8 +485,7 @@ def get_feed(slug):
     if not podcast:
         return error_response('Feed not found', 404)
 
-    base_url = os.environ.get('BASE_URL', 'http://localhost:8000')
-    feed_url = f"{base_url}/{slug}"
+    feed_url = f"{BASE_URL}/{slug}"
 
     # Convert auto_process_override from string to boolean/null
     auto_process_override_value = podcast.get('auto_process_override')
@@ -542,15 +564,13 @@ def update_feed(slug):
 
         # Return updated feed data
         podcast = db.get_podcast_by_slug(slug)
-        base_url = os.environ.get('BASE_URL', 'http://localhost:8000')
-
         return json_response({
             'slug': podcast['slug'],
             'title': podcast['title'] or podcast['slug'],
             'networkId': podcast.get('network_id'),
             'daiPlatform': podcast.get('dai_platform'),
             'networkIdOverride': podcast.get('network_id_override'),
-            'feedUrl': f"{base_url}/{slug}"
+            'feedUrl': f"{BASE_URL}/{slug}"
         })
     except Exception as e:
         logger.error(f"Failed to update feed {slug}: {e}")
@@ -694,8 +714,11 @@ def get_artwork(slug):
     if not artwork:
         return error_response('Artwork not found', 404)
 
-    image_data, content_type = artwork
-    return Response(image_data, mimetype=content_type)
+    # conditional=True answers If-None-Match/If-Modified-Since with 304 and
+    # lets Werkzeug stream the file instead of reading it into memory
+    artwork_path, content_type = artwork
+    return send_file(artwork_path, mimetype=content_type, conditional=True,
+                     max_age=86400)
 
 
 # ========== Episode Endpoints ==========
@@ -779,14 +802,12 @@ def get_episode(slug, episode_id):
     if not episode:
         return error_response('Episode not found', 404)
 
-    base_url = os.environ.get('BASE_URL', 'http://localhost:8000')
-
     # Parse ad markers if present, separating by validation decision
     ad_markers = []
     rejected_ad_markers = []
     if episode.get('ad_markers_json'):
         try:
-            all_markers = json.loads(episode['ad_markers_json'])
+            all_markers = json_loads(episode['ad_markers_json'])
             # Separate by validation decision and cut status
             # Only actually-removed ads go in adMarkers; everything else is rejected
             for marker in all_markers:
@@ -837,7 +858,7 @@ def get_episode(slug, episode_id):
         'originalDuration': episode['original_duration'],
         'newDuration': episode['new_duration'],
         'originalUrl': episode['original_url'],
-        'processedUrl': f"{base_url}/episodes/{slug}/{episode_id}.mp3",
+        'processedUrl': f"{BASE_URL}/episodes/{slug}/{episode_id}.mp3",
         'adsRemoved': episode['ads_removed'],
         'adsRemovedFirstPass': episode.get('ads_removed_firstpass', 0),
         'adsRemovedVerification': episode.get('ads_removed_secondpass', 0),
@@ -1163,23 +1184,7 @@ def retry_ad_detection(slug, episode_id):
         from llm_client import start_episode_token_tracking, get_episode_token_totals
 
         # Parse transcript back into segments
-        segments = []
-        for line in transcript.split('\n'):
-            if line.strip() and line.startswith('['):
-                try:
-                    # Parse format: [HH:MM:SS.mmm --> HH:MM:SS.mmm] text
-                    time_part, text_part = line.split('] ', 1)
-                    time_range = time_part.strip('[')
-                    start_str, end_str = time_range.split(' --> ')
-
-                    # Uses utils.time.parse_timestamp imported at module level
-                    segments.append({
-                        'start': parse_timestamp(start_str),
-                        'end': parse_timestamp(end_str),
-                        'text': text_part
-                    })
-                except Exception:
-                    continue
+        segments = parse_transcript_segments(transcript)
 
         if not segments:
             return error_response('Could not parse transcript into segments', 400)
@@ -1470,7 +1475,7 @@ def get_settings():
     verification_model = settings.get('verification_model', {}).get('value', DEFAULT_MODEL)
 
     # Get whisper model setting (defaults to env var or 'small')
-    default_whisper_model = os.environ.get('WHISPER_MODEL', 'small')
+    default_whisper_model = WHISPER_MODEL
     whisper_model = settings.get('whisper_model', {}).get('value', default_whisper_model)
 
     # Get auto-process setting (defaults to true)
@@ -1527,7 +1532,7 @@ def get_settings():
             'value': min_cut_confidence,
             'isDefault': settings.get('min_cut_confidence', {}).get('is_default', True)
         },
-        'retentionPeriodMinutes': int(os.environ.get('RETENTION_PERIOD') or settings.get('retention_period_minutes', {}).get('value', '1440')),
+        'retentionPeriodMinutes': int(RETENTION_PERIOD or settings.get('retention_period_minutes', {}).get('value', '1440')),
         'defaults': {
             'systemPrompt': DEFAULT_SYSTEM_PROMPT,
             'verificationPrompt': DEFAULT_VERIFICATION_PROMPT,
@@ -1790,7 +1795,7 @@ def get_system_status():
     storage_stats = storage.get_storage_stats()
 
     # Get retention setting - env var takes precedence
-    retention = int(os.environ.get('RETENTION_PERIOD') or
+    retention = int(RETENTION_PERIOD or
                     db.get_setting('retention_period_minutes') or '1440')
 
     return json_response({
@@ -1810,9 +1815,9 @@ def get_system_status():
         },
         'settings': {
             'retentionPeriodMinutes': retention,
-            'whisperModel': os.environ.get('WHISPER_MODEL', 'small'),
-            'whisperDevice': os.environ.get('WHISPER_DEVICE', 'cuda'),
-            'baseUrl': os.environ.get('BASE_URL', 'http://localhost:8000')
+            'whisperModel': WHISPER_MODEL,
+            'whisperDevice': WHISPER_DEVICE,
+            'baseUrl': BASE_URL
         },
         'stats': {
             'totalTimeSaved': db.get_total_time_saved(),
@@ -1846,6 +1851,7 @@ def trigger_cleanup():
     db = get_database()
 
     deleted_count, freed_mb = db.cleanup_old_episodes(force_all=True)
+    db.prune_detection_cache()
 
     logger.info(f"Manual cleanup: {deleted_count} episodes deleted, {freed_mb:.1f} MB freed")
     return json_response({
@@ -1884,8 +1890,9 @@ def clear_queue():
     })
 
 
+@lru_cache(maxsize=1)
 def _get_version():
-    """Get application version."""
+    """Get application version (cached; it cannot change while running)."""
     try:
         import sys
         from pathlib import Path
@@ -11,12 +11,12 @@ import os
 from typing import Dict, List, Optional, Any, Tuple, Callable
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
-from .base import AudioSegmentSignal, AudioAnalysisResult, SignalType
+from .base import AudioSegmentSignal, AudioAnalysisResult, LoudnessFrames, SignalType
 from .volume_analyzer import VolumeAnalyzer
 from .transition_detector import TransitionDetector
 
 # Import from utils for consistent audio duration implementation
-from utils.audio import get_audio_duration
+from utils.audio import AudioMetadata
 
 logger = logging.getLogger('podcast.audio_analysis')
 
@@ -165,7 +165,7 @@ class AudioAnalyzer:
         logger.info(f"Starting audio analysis: {audio_path}")
 
         # Get audio duration for timeout calculation
-        duration = get_audio_duration(audio_path)
+        duration = AudioMetadata.get_duration(audio_path)
         if duration:
             timeouts = calculate_component_timeouts(duration)
             logger.info(f"Audio duration: {duration/60:.1f} min, "
@@ -177,7 +177,7 @@ class AudioAnalyzer:
         signals = []
         errors = []
         baseline = None
-        frames = []
+        frames = LoudnessFrames.empty()
 
         # Volume analysis
         if status_callback:
@@ -185,7 +185,7 @@ class AudioAnalyzer:
 
         vol_result, error = self._run_component_with_timeout(
             'volume',
-            lambda: self.volume_analyzer.analyze(audio_path),
+            lambda: self.volume_analyzer.analyze(audio_path, duration=duration),
             timeouts['volume']
         )
 
@@ -2,10 +2,16 @@
 Base data structures for audio analysis.
 """
 
+import bisect
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from enum import Enum
 
+import numpy as np
+
+from utils.json import json_dumps
+
 
 class SignalType(Enum):
     """Types of audio signals that can be detected."""
@@ -14,7 +20,7 @@ class SignalType(Enum):
     DAI_TRANSITION_PAIR = "dai_transition_pair"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSegmentSignal:
     """
     Represents an audio signal detected in a time range.
@@ -31,11 +37,16 @@ class AudioSegmentSignal:
     signal_type: str
     confidence: float
     details: Dict[str, Any] = field(default_factory=dict)
+    _duration: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Signals are not mutated after construction, so cache the duration
+        self._duration = self.end - self.start
 
     @property
     def duration(self) -> float:
         """Duration of this signal in seconds."""
-        return self.end - self.start
+        return self._duration
 
     def overlaps(self, other: 'AudioSegmentSignal', tolerance: float = 0) -> bool:
         """Check if this signal overlaps with another."""
@@ -48,7 +59,7 @@ class AudioSegmentSignal:
             'end': self.end,
             'signal_type': self.signal_type,
             'confidence': self.confidence,
-            'duration': self.duration,
+            'duration': self._duration,
             'details': self.details
         }
 
@@ -64,7 +75,7 @@ class AudioSegmentSignal:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LoudnessFrame:
     """
     Loudness measurement for a single analysis frame.
@@ -81,7 +92,58 @@ class LoudnessFrame:
     peak_dbfs: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
+class LoudnessFrames:
+    """
+    Struct-of-arrays store for a sequence of loudness frames.
+
+    Holds one contiguous array per field so analysis passes can work on
+    whole columns at once. Indexing or iterating yields LoudnessFrame views
+    for callers that still want per-frame objects.
+
+    Attributes:
+        start: Frame start times in seconds
+        end: Frame end times in seconds
+        loudness_lufs: Mean momentary loudness per frame in LUFS
+        peak_dbfs: Sample peak per frame in dBFS
+    """
+    start: np.ndarray
+    end: np.ndarray
+    loudness_lufs: np.ndarray
+    peak_dbfs: np.ndarray
+
+    @classmethod
+    def empty(cls) -> 'LoudnessFrames':
+        """Create a store with no frames."""
+        return cls(*(np.empty(0, dtype=np.float64) for _ in range(4)))
+
+    @classmethod
+    def from_frames(cls, frames: List[LoudnessFrame]) -> 'LoudnessFrames':
+        """Create from a list of LoudnessFrame objects."""
+        count = len(frames)
+        return cls(
+            start=np.fromiter((f.start for f in frames), dtype=np.float64, count=count),
+            end=np.fromiter((f.end for f in frames), dtype=np.float64, count=count),
+            loudness_lufs=np.fromiter((f.loudness_lufs for f in frames), dtype=np.float64, count=count),
+            peak_dbfs=np.fromiter((f.peak_dbfs for f in frames), dtype=np.float64, count=count),
+        )
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __getitem__(self, index: int) -> LoudnessFrame:
+        return LoudnessFrame(
+            start=float(self.start[index]),
+            end=float(self.end[index]),
+            loudness_lufs=float(self.loudness_lufs[index]),
+            peak_dbfs=float(self.peak_dbfs[index]),
+        )
+
+    def __iter__(self) -> Iterator[LoudnessFrame]:
+        return (self[i] for i in range(len(self)))
+
+
+@dataclass(slots=True)
 class AudioAnalysisResult:
     """
     Combined results from all audio analyzers.
@@ -95,20 +157,59 @@ class AudioAnalysisResult:
     """
     signals: List[AudioSegmentSignal] = field(default_factory=list)
     loudness_baseline: Optional[float] = None
-    loudness_frames: List[LoudnessFrame] = field(default_factory=list)
+    loudness_frames: LoudnessFrames = field(default_factory=LoudnessFrames.empty)
     analysis_time_seconds: float = 0.0
     errors: List[str] = field(default_factory=list)
+    _range_index: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _type_index: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def _get_range_index(self) -> tuple:
+        """
+        Signal positions sorted by start time, plus the longest duration.
+
+        Built lazily and rebuilt if the signals list is replaced or grows.
+        """
+        signals = self.signals
+        index = self._range_index
+        if index is None or index[0] is not signals or index[1] != len(signals):
+            order = sorted(range(len(signals)), key=lambda i: signals[i].start)
+            starts = [signals[i].start for i in order]
+            max_duration = max((s.duration for s in signals), default=0.0)
+            index = (signals, len(signals), order, starts, max_duration)
+            self._range_index = index
+        return index
 
     def get_signals_in_range(self, start: float, end: float) -> List[AudioSegmentSignal]:
-        """Get all signals that overlap with the given time range."""
-        return [
-            s for s in self.signals
-            if s.start < end and s.end > start
-        ]
+        """
+        Get all signals that overlap with the given time range.
+
+        Only signals starting within (start - longest duration, end) can
+        overlap, so that slice is located by bisecting the sorted starts.
+        Results keep the order of self.signals.
+        """
+        signals = self.signals
+        _, _, order, starts, max_duration = self._get_range_index()
+        lo = bisect.bisect_left(starts, start - max_duration)
+        hi = bisect.bisect_left(starts, end)
+        hits = sorted(i for i in order[lo:hi] if signals[i].end > start)
+        return [signals[i] for i in hits]
 
     def get_signals_by_type(self, signal_type: str) -> List[AudioSegmentSignal]:
-        """Get all signals of a specific type."""
-        return [s for s in self.signals if s.signal_type == signal_type]
+        """
+        Get all signals of a specific type.
+
+        Signals are grouped by type once and the grouping is reused until
+        the signals list is replaced or grows.
+        """
+        signals = self.signals
+        index = self._type_index
+        if index is None or index[0] is not signals or index[1] != len(signals):
+            by_type = defaultdict(list)
+            for s in signals:
+                by_type[s.signal_type].append(s)
+            index = (signals, len(signals), by_type)
+            self._type_index = index
+        return list(index[2].get(signal_type, ()))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -119,6 +220,10 @@ class AudioAnalysisResult:
             'errors': self.errors
         }
 
+    def to_json(self) -> str:
+        """Serialize to a JSON string, using orjson when available."""
+        return json_dumps(self.to_dict())
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AudioAnalysisResult':
         """Create from dictionary."""
@@ -9,7 +9,9 @@ import logging
 from dataclasses import dataclass
 from typing import List
 
-from .base import AudioSegmentSignal, LoudnessFrame, SignalType
+import numpy as np
+
+from .base import AudioSegmentSignal, LoudnessFrames, SignalType
 
 logger = logging.getLogger('podcast.audio_analysis.transition')
 
@@ -59,31 +61,32 @@ class TransitionDetector:
         self.min_ad_duration = min_ad_duration
         self.max_ad_duration = max_ad_duration
 
-    def detect_transitions(self, frames: List[LoudnessFrame]) -> List[TransitionPoint]:
+    def detect_transitions(self, frames: LoudnessFrames) -> List[TransitionPoint]:
         """Find abrupt loudness transitions between adjacent frames."""
         if len(frames) < 2:
             return []
 
-        transitions = []
-        for i in range(1, len(frames)):
-            prev = frames[i - 1]
-            curr = frames[i]
-
-            # Skip silence frames
-            if prev.loudness_lufs < -70 or curr.loudness_lufs < -70:
-                continue
+        lufs = frames.loudness_lufs
+        prev_lufs, curr_lufs = lufs[:-1], lufs[1:]
+        deltas = curr_lufs - prev_lufs
 
-            delta = curr.loudness_lufs - prev.loudness_lufs
+        # Skip pairs involving silence frames
+        candidates = np.flatnonzero(
+            (prev_lufs >= -70) & (curr_lufs >= -70)
+            & (np.abs(deltas) >= self.transition_threshold_db)
+        )
 
-            if abs(delta) >= self.transition_threshold_db:
-                direction = 'up' if delta > 0 else 'down'
-                transitions.append(TransitionPoint(
-                    time=curr.start,
-                    delta_db=abs(delta),
-                    direction=direction,
-                    from_lufs=prev.loudness_lufs,
-                    to_lufs=curr.loudness_lufs,
-                ))
+        transitions = []
+        for i in candidates:
+            delta = float(deltas[i])
+            direction = 'up' if delta > 0 else 'down'
+            transitions.append(TransitionPoint(
+                time=float(frames.start[i + 1]),
+                delta_db=abs(delta),
+                direction=direction,
+                from_lufs=float(prev_lufs[i]),
+                to_lufs=float(curr_lufs[i]),
+            ))
 
         logger.debug(f"Found {len(transitions)} raw transitions "
                     f"(threshold={self.transition_threshold_db}dB)")
@@ -103,6 +106,9 @@ class TransitionDetector:
 
         pairs = []
         used = set()
+        # Hoisted out of the nested pairing loop
+        min_ad_duration = self.min_ad_duration
+        max_ad_duration = self.max_ad_duration
 
         for i, start_t in enumerate(transitions):
             if i in used:
@@ -121,9 +127,9 @@ class TransitionDetector:
                     continue
 
                 # Duration must be in valid ad range
-                if duration < self.min_ad_duration:
+                if duration < min_ad_duration:
                     continue
-                if duration > self.max_ad_duration:
+                if duration > max_ad_duration:
                     break  # No point looking further for this start
 
                 avg_delta = (start_t.delta_db + end_t.delta_db) / 2.0
@@ -174,7 +180,7 @@ class TransitionDetector:
             ))
         return signals
 
-    def detect_and_pair(self, frames: List[LoudnessFrame]) -> List[AudioSegmentSignal]:
+    def detect_and_pair(self, frames: LoudnessFrames) -> List[AudioSegmentSignal]:
         """Full pipeline: detect transitions, pair them, return signals."""
         transitions = self.detect_transitions(frames)
         pairs = self.find_transition_pairs(transitions)
@@ -8,15 +8,101 @@ more compression than host content, causing noticeable volume changes.
 import subprocess
 import json
 import logging
+import math
 import re
 from typing import List, Tuple, Optional
 import os
 
-from .base import AudioSegmentSignal, LoudnessFrame, SignalType
+import numpy as np
+
+from .base import AudioSegmentSignal, LoudnessFrames, SignalType
 from utils.audio import get_audio_duration
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger('podcast.audio_analysis.volume')
 
+# One ebur128 verbose framelog line, matched directly on ffmpeg's stderr bytes
+# Example: [Parsed_ebur128_0 @ 0x...] t: 0.1  TARGET:-23 LUFS    M: -23.5 S: -22.1 ... SPK: -5.2 ...
+# Note: TARGET field appears between t: and M: in verbose output
+EBUR128_LINE_RE = re.compile(
+    rb'\[Parsed_ebur128_0[^\]\n]*\][ \t]+t:[ \t]*([\d.]+)[ \t]+'
+    rb'[^\n]*?'                          # Allow TARGET and other fields between t: and M:
+    rb'M:[ \t]*([-\d.]+)[ \t]+'          # Momentary loudness
+    rb'S:[ \t]*([-\d.]+)'                # Short-term loudness
+    rb'(?:[^\n]*?SPK:[ \t]*([-\d.]+))?',  # Sample peak, if present on the line
+    re.IGNORECASE
+)
+
+# Anomaly direction code -> (signal type, details label)
+ANOMALY_DIRECTIONS = {
+    1: (SignalType.VOLUME_INCREASE.value, 'increase'),
+    -1: (SignalType.VOLUME_DECREASE.value, 'decrease'),
+}
+
+
+def _anomaly_runs_numpy(starts, boundaries, deviations, threshold, min_duration):
+    """
+    Locate runs of frames whose |deviation| exceeds threshold.
+
+    Returns (run_starts, run_ends, directions) arrays, with run_ends
+    exclusive, keeping only runs that last at least min_duration seconds.
+    A run ending at index e ends at boundaries[e] (next frame start or
+    audio end). Directions are +1/-1 from the sign of the run's first frame.
+    """
+    # Pad with False on both sides so every run has a rising and falling edge
+    above = np.concatenate(([False], np.abs(deviations) > threshold, [False]))
+    edges = np.diff(above.astype(np.int8))
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+
+    keep = boundaries[run_ends] - starts[run_starts] >= min_duration
+    run_starts, run_ends = run_starts[keep], run_ends[keep]
+    directions = np.where(deviations[run_starts] > 0, 1, -1).astype(np.int8)
+    return run_starts, run_ends, directions
+
+
+def _anomaly_runs_loop(starts, boundaries, deviations, threshold, min_duration):
+    """
+    Single-pass scalar equivalent of _anomaly_runs_numpy.
+
+    Written for Numba: no intermediate arrays beyond the preallocated
+    outputs, so the JIT-compiled version fuses everything into one loop.
+    """
+    n = deviations.shape[0]
+    out_starts = np.empty(n, dtype=np.int64)
+    out_ends = np.empty(n, dtype=np.int64)
+    out_directions = np.empty(n, dtype=np.int8)
+    count = 0
+    run_start = -1
+
+    # Index n acts as a sentinel in-threshold frame, closing any run still
+    # open at end of audio through the same path as every other run
+    for i in range(n + 1):
+        if i < n and abs(deviations[i]) > threshold:
+            if run_start < 0:
+                run_start = i
+        elif run_start >= 0:
+            if boundaries[i] - starts[run_start] >= min_duration:
+                out_starts[count] = run_start
+                out_ends[count] = i
+                out_directions[count] = 1 if deviations[run_start] > 0 else -1
+                count += 1
+            run_start = -1
+
+    return out_starts[:count], out_ends[:count], out_directions[:count]
+
+
+# Use the JIT-compiled scan when numba is installed, else the NumPy version
+if NUMBA_AVAILABLE:
+    _anomaly_runs = njit(cache=True)(_anomaly_runs_loop)
+else:
+    _anomaly_runs = _anomaly_runs_numpy
+
 
 class VolumeAnalyzer:
     """
@@ -44,25 +130,32 @@ class VolumeAnalyzer:
         self.anomaly_threshold_db = anomaly_threshold_db
         self.min_anomaly_duration = min_anomaly_duration
 
-    def analyze(self, audio_path: str) -> Tuple[List[AudioSegmentSignal], Optional[float], List]:
+    def analyze(
+        self,
+        audio_path: str,
+        duration: Optional[float] = None
+    ) -> Tuple[List[AudioSegmentSignal], Optional[float], LoudnessFrames]:
         """
         Analyze audio for volume anomalies using single-pass ebur128.
 
         Args:
             audio_path: Path to the audio file
+            duration: Audio duration in seconds if the caller already probed it;
+                otherwise it is read with ffprobe
 
         Returns:
             Tuple of (list of volume anomaly signals, baseline loudness in LUFS, raw loudness frames)
         """
         if not os.path.exists(audio_path):
             logger.error(f"Audio file not found: {audio_path}")
-            return [], None, []
+            return [], None, LoudnessFrames.empty()
 
-        # Get audio duration
-        duration = self._get_duration(audio_path)
+        # Get audio duration (skips the ffprobe subprocess when already known)
+        if duration is None:
+            duration = self._get_duration(audio_path)
         if duration is None or duration < self.frame_duration:
             logger.warning(f"Audio too short for volume analysis: {duration}s")
-            return [], None, []
+            return [], None, LoudnessFrames.empty()
 
         logger.info(f"Analyzing volume for {duration:.1f}s audio ({duration/60:.1f} min)")
 
@@ -70,19 +163,14 @@ class VolumeAnalyzer:
         frames = self._measure_loudness_single_pass(audio_path, duration)
         if not frames:
             logger.warning("No loudness frames extracted")
-            return [], None, []
+            return [], None, LoudnessFrames.empty()
 
         # Calculate baseline
-        loudness_values = [f.loudness_lufs for f in frames if f.loudness_lufs > -70]
-        if not loudness_values:
+        baseline = self._compute_baseline(frames)
+        if baseline is None:
             logger.warning("No valid loudness measurements")
             return [], None, frames
 
-        # Use median as baseline (robust to outliers)
-        loudness_values.sort()
-        mid = len(loudness_values) // 2
-        baseline = loudness_values[mid]
-
         logger.info(f"Loudness baseline: {baseline:.1f} LUFS, {len(frames)} frames analyzed")
 
         # Find anomalies
@@ -91,6 +179,21 @@ class VolumeAnalyzer:
         logger.info(f"Found {len(anomalies)} volume anomalies")
         return anomalies, baseline, frames
 
+    @staticmethod
+    def _compute_baseline(frames: LoudnessFrames) -> Optional[float]:
+        """
+        Median loudness of non-silent frames, used as the episode baseline.
+
+        Uses the upper median (robust to outliers) selected with
+        np.partition, which is linear time instead of a full sort.
+        """
+        loudness_values = frames.loudness_lufs[frames.loudness_lufs > -70]
+        if not loudness_values.size:
+            return None
+
+        mid = loudness_values.size // 2
+        return float(np.partition(loudness_values, mid)[mid])
+
     def _get_duration(self, audio_path: str) -> Optional[float]:
         """Get audio duration using ffprobe.
 
@@ -102,7 +205,7 @@ class VolumeAnalyzer:
         self,
         audio_path: str,
         total_duration: float
-    ) -> List[LoudnessFrame]:
+    ) -> LoudnessFrames:
         """
         Measure loudness using single-pass ebur128 filter.
 
@@ -113,9 +216,12 @@ class VolumeAnalyzer:
             # Run ebur128 with verbose framelog to get per-frame measurements
             # Output format: [Parsed_ebur128_0 @ ...] t: 0.3     M: -23.5 S: -22.1 ...
             # Note: -v verbose is needed for filter output to appear in stderr
+            # -vn/-sn/-dn keep embedded cover art and other non-audio streams out
+            # of the decode, and -nostats drops the progress line from stderr
             cmd = [
-                'ffmpeg', '-v', 'verbose',
+                'ffmpeg', '-v', 'verbose', '-nostats',
                 '-i', audio_path,
+                '-vn', '-sn', '-dn',
                 '-af', 'ebur128=framelog=verbose:peak=sample',
                 '-f', 'null', '-'
             ]
@@ -124,24 +230,20 @@ class VolumeAnalyzer:
             timeout = max(300, int(total_duration / 60) * 60 + 120)
             logger.debug(f"Running ebur128 analysis with {timeout}s timeout")
 
-            # Don't use text=True - FFMPEG can output non-UTF-8 characters
-            # which would cause UnicodeDecodeError
+            # Don't use text=True - FFMPEG can output non-UTF-8 characters,
+            # and the framelog is parsed straight from the raw bytes
             result = subprocess.run(
                 cmd, capture_output=True, timeout=timeout
             )
 
-            # Safely decode stderr, replacing any non-UTF-8 characters
-            try:
-                stderr_text = result.stderr.decode('utf-8', errors='replace')
-            except Exception:
-                stderr_text = str(result.stderr)[:10000]
-
             # Parse ebur128 output from stderr
             # Lines look like: [Parsed_ebur128_0 @ 0x...] t: 5.0    M: -23.5 S: -22.1 ...
-            raw_measurements = self._parse_ebur128_output(stderr_text)
+            raw_measurements = self._parse_ebur128_output(result.stderr)
 
             if not raw_measurements:
                 logger.warning("No ebur128 measurements found in output")
+                # Safely decode stderr for diagnostics, replacing any non-UTF-8 characters
+                stderr_text = result.stderr.decode('utf-8', errors='replace')
                 # Log ffmpeg return code and lines containing ebur128 data patterns
                 stderr_lines = stderr_text.split('\n')
                 # Find lines that look like ebur128 output (contain "t:" and "M:")
@@ -159,7 +261,7 @@ class VolumeAnalyzer:
                         f"ffmpeg ebur128 - returncode={result.returncode}, "
                         f"no ebur128 data lines found in {len(stderr_lines)} lines:\n{sample}"
                     )
-                return []
+                return LoudnessFrames.empty()
 
             logger.debug(f"Parsed {len(raw_measurements)} raw measurements")
 
@@ -170,53 +272,33 @@ class VolumeAnalyzer:
 
         except subprocess.TimeoutExpired:
             logger.error(f"ebur128 analysis timeout after {timeout}s")
-            return []
+            return LoudnessFrames.empty()
         except Exception as e:
             logger.error(f"Single-pass loudness measurement failed: {e}")
-            return []
+            return LoudnessFrames.empty()
 
-    def _parse_ebur128_output(self, stderr: str) -> List[Tuple[float, float, float]]:
+    def _parse_ebur128_output(self, stderr: bytes) -> List[Tuple[float, float, float]]:
         """
         Parse ebur128 verbose output to extract measurements.
 
+        Scans the raw stderr bytes once with EBUR128_LINE_RE, without
+        decoding or splitting into lines.
+
         Returns list of (timestamp, momentary_lufs, sample_peak) tuples.
         """
         measurements = []
 
-        # Pattern for ebur128 output lines
-        # Example: [Parsed_ebur128_0 @ 0x...] t: 0.1  TARGET:-23 LUFS    M: -23.5 S: -22.1 ...
-        # Note: TARGET field appears between t: and M: in verbose output
-        pattern = re.compile(
-            r'\[Parsed_ebur128_0.*?\]\s+t:\s*([\d.]+)\s+'
-            r'.*?'                # Allow TARGET and other fields between t: and M:
-            r'M:\s*([-\d.]+)\s+'  # Momentary loudness
-            r'S:\s*([-\d.]+)',    # Short-term loudness
-            re.IGNORECASE
-        )
-
-        # Also try to capture peak if available
-        peak_pattern = re.compile(
-            r'\[Parsed_ebur128_0.*?\]\s+.*?SPK:\s*([-\d.]+)',
-            re.IGNORECASE
-        )
-
-        for line in stderr.split('\n'):
-            match = pattern.search(line)
-            if match:
-                try:
-                    timestamp = float(match.group(1))
-                    momentary = float(match.group(2))
-                    # Use momentary loudness (M) as it's most responsive to changes
-                    peak = -1.0  # Default peak
-
-                    # Try to get peak from same line
-                    peak_match = peak_pattern.search(line)
-                    if peak_match:
-                        peak = float(peak_match.group(1))
-
-                    measurements.append((timestamp, momentary, peak))
-                except (ValueError, IndexError):
-                    continue
+        for match in EBUR128_LINE_RE.finditer(stderr):
+            timestamp, momentary, _short_term, peak = match.groups()
+            try:
+                # Use momentary loudness (M) as it's most responsive to changes
+                measurements.append((
+                    float(timestamp),
+                    float(momentary),
+                    float(peak) if peak is not None else -1.0  # Default peak
+                ))
+            except ValueError:
+                continue
 
         return measurements
 
@@ -224,122 +306,92 @@ class VolumeAnalyzer:
         self,
         measurements: List[Tuple[float, float, float]],
         total_duration: float
-    ) -> List[LoudnessFrame]:
+    ) -> LoudnessFrames:
         """
         Group raw measurements into frames of frame_duration seconds.
 
-        Takes average loudness within each frame window.
+        Takes average loudness and max peak within each frame window. Each
+        measurement is bucketed by frame index in one vectorized pass, and
+        frames with no measurements are dropped.
         """
         if not measurements:
-            return []
-
-        frames = []
-        frame_start = 0.0
+            return LoudnessFrames.empty()
+
+        frame_duration = self.frame_duration
+        n_frames = int(math.ceil(total_duration / frame_duration))
+
+        raw = np.asarray(measurements, dtype=np.float64)
+        timestamps, momentary, peak = raw[:, 0], raw[:, 1], raw[:, 2]
+        in_range = (timestamps >= 0) & (timestamps < total_duration)
+        idx = (timestamps[in_range] // frame_duration).astype(np.intp)
+
+        counts = np.bincount(idx, minlength=n_frames)
+        loudness_sums = np.bincount(idx, weights=momentary[in_range], minlength=n_frames)
+        peaks = np.full(n_frames, -np.inf)
+        np.maximum.at(peaks, idx, peak[in_range])
+
+        present = np.flatnonzero(counts)
+        starts = present * frame_duration
+        return LoudnessFrames(
+            start=starts,
+            end=np.minimum(starts + frame_duration, total_duration),
+            loudness_lufs=loudness_sums[present] / counts[present],
+            peak_dbfs=peaks[present],
+        )
 
-        while frame_start < total_duration:
-            frame_end = min(frame_start + self.frame_duration, total_duration)
+    def _find_anomalies(
+        self,
+        frames: LoudnessFrames,
+        baseline: float
+    ) -> List[AudioSegmentSignal]:
+        """
+        Find regions where volume deviates significantly from baseline.
 
-            # Get measurements within this frame
-            frame_measurements = [
-                (m[1], m[2]) for m in measurements
-                if frame_start <= m[0] < frame_end
-            ]
+        Runs of consecutive frames beyond the threshold are located by
+        _anomaly_runs (Numba-compiled when available, NumPy otherwise). An
+        anomaly spans from its first frame's start to the start of the next
+        in-threshold frame (or the end of the last frame if it runs to end
+        of audio).
+        """
+        if not frames:
+            return []
 
-            if frame_measurements:
-                # Average loudness for the frame
-                avg_loudness = sum(m[0] for m in frame_measurements) / len(frame_measurements)
-                max_peak = max(m[1] for m in frame_measurements)
+        starts = frames.start
+        deviations = frames.loudness_lufs - baseline
+        abs_deviations = np.abs(deviations)
 
-                frames.append(LoudnessFrame(
-                    start=frame_start,
-                    end=frame_end,
-                    loudness_lufs=avg_loudness,
-                    peak_dbfs=max_peak
-                ))
+        # Boundary time for a run ending at index e: next frame's start, or audio end
+        boundaries = np.append(starts, frames.end[-1])
 
-            frame_start = frame_end
+        # Thresholds are passed as plain floats so the Numba kernel can take them as scalars
+        threshold_db = float(self.anomaly_threshold_db)
+        min_duration = float(self.min_anomaly_duration)
+        baseline_lufs = round(baseline, 1)
 
-        return frames
+        run_starts, run_ends, directions = _anomaly_runs(
+            starts, boundaries, deviations, threshold_db, min_duration
+        )
 
-    def _find_anomalies(
-        self,
-        frames: List[LoudnessFrame],
-        baseline: float
-    ) -> List[AudioSegmentSignal]:
-        """Find regions where volume deviates significantly from baseline."""
         anomalies = []
-        in_anomaly = False
-        anomaly_start = 0.0
-        anomaly_type = ""
-        deviations = []
-
-        for frame in frames:
-            deviation = frame.loudness_lufs - baseline
-
-            if abs(deviation) > self.anomaly_threshold_db:
-                if not in_anomaly:
-                    # Start new anomaly
-                    in_anomaly = True
-                    anomaly_start = frame.start
-                    anomaly_type = "increase" if deviation > 0 else "decrease"
-                    deviations = []
-                deviations.append(abs(deviation))
-            else:
-                if in_anomaly:
-                    # End current anomaly
-                    anomaly_end = frame.start
-                    duration = anomaly_end - anomaly_start
-
-                    if duration >= self.min_anomaly_duration:
-                        avg_deviation = sum(deviations) / len(deviations)
-                        # Confidence based on deviation magnitude
-                        confidence = min(0.5 + (avg_deviation / 10), 0.95)
-
-                        signal_type = (
-                            SignalType.VOLUME_INCREASE.value
-                            if anomaly_type == "increase"
-                            else SignalType.VOLUME_DECREASE.value
-                        )
-
-                        anomalies.append(AudioSegmentSignal(
-                            start=anomaly_start,
-                            end=anomaly_end,
-                            signal_type=signal_type,
-                            confidence=confidence,
-                            details={
-                                'deviation_db': round(avg_deviation, 1),
-                                'baseline_lufs': round(baseline, 1),
-                                'direction': anomaly_type
-                            }
-                        ))
-
-                    in_anomaly = False
-
-        # Handle anomaly at end of audio
-        if in_anomaly and frames:
-            anomaly_end = frames[-1].end
-            duration = anomaly_end - anomaly_start
-
-            if duration >= self.min_anomaly_duration:
-                avg_deviation = sum(deviations) / len(deviations)
-                confidence = min(0.5 + (avg_deviation / 10), 0.95)
-
-                signal_type = (
-                    SignalType.VOLUME_INCREASE.value
-                    if anomaly_type == "increase"
-                    else SignalType.VOLUME_DECREASE.value
-                )
-
-                anomalies.append(AudioSegmentSignal(
-                    start=anomaly_start,
-                    end=anomaly_end,
-                    signal_type=signal_type,
-                    confidence=confidence,
-                    details={
-                        'deviation_db': round(avg_deviation, 1),
-                        'baseline_lufs': round(baseline, 1),
-                        'direction': anomaly_type
-                    }
-                ))
+        for s, e, direction in zip(run_starts, run_ends, directions):
+            anomaly_start = float(starts[s])
+            anomaly_end = float(boundaries[e])
+            avg_deviation = float(abs_deviations[s:e].mean())
+            # Confidence based on deviation magnitude
+            confidence = min(0.5 + (avg_deviation / 10), 0.95)
+            # Direction (+1/-1) is taken from the frame that opened the anomaly
+            signal_type, anomaly_type = ANOMALY_DIRECTIONS[int(direction)]
+
+            anomalies.append(AudioSegmentSignal(
+                start=anomaly_start,
+                end=anomaly_end,
+                signal_type=signal_type,
+                confidence=confidence,
+                details={
+                    'deviation_db': round(avg_deviation, 1),
+                    'baseline_lufs': baseline_lufs,
+                    'direction': anomaly_type
+                }
+            ))
 
         return anomalies
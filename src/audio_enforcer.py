@@ -41,15 +41,11 @@ class AudioEnforcer:
 
         lines = []
 
-        for signal in audio_analysis.signals:
+        for signal in audio_analysis.get_signals_in_range(window_start, window_end):
             # Skip low-confidence signals
             if signal.confidence < MIN_SIGNAL_CONFIDENCE:
                 continue
 
-            # Skip signals outside this window
-            if signal.end <= window_start or signal.start >= window_end:
-                continue
-
             if signal.signal_type == 'dai_transition_pair':
                 details = signal.details or {}
                 avg_db = details.get('avg_delta_db', 0)
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Tuple
 import json
 
-from utils.audio import get_audio_duration as _utils_get_audio_duration
+from utils.audio import AudioMetadata
 
 logger = logging.getLogger('podcast.fingerprint')
 
@@ -402,9 +402,9 @@ class AudioFingerprinter:
     def _get_audio_duration(self, audio_path: str) -> float:
         """Get duration of audio file in seconds.
 
-        Delegates to utils.audio.get_audio_duration for consistent implementation.
+        Cached in utils.audio.AudioMetadata, shared with other pipeline stages.
         """
-        duration = _utils_get_audio_duration(audio_path)
+        duration = AudioMetadata.get_duration(audio_path)
         return duration if duration is not None else 0.0
 
     def _merge_overlapping_matches(
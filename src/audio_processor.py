@@ -7,7 +7,7 @@ import shutil
 from pathlib import Path
 from typing import List, Dict, Optional
 
-from utils.audio import get_audio_duration as _get_audio_duration
+from utils.audio import AudioMetadata
 
 logger = logging.getLogger(__name__)
 
@@ -52,9 +52,10 @@ class AudioProcessor:
     def get_audio_duration(self, audio_path: str) -> Optional[float]:
         """Get duration of audio file in seconds.
 
-        Delegates to utils.audio.get_audio_duration for consistent implementation.
+        Cached in utils.audio.AudioMetadata, so the input and output files are
+        only probed once across the pipeline.
         """
-        return _get_audio_duration(audio_path)
+        return AudioMetadata.get_duration(audio_path)
 
     def get_beep_duration(self) -> float:
         """Get duration of beep audio (cached)."""
@@ -273,9 +274,14 @@ class AudioProcessor:
             logger.error(f"Audio processing failed: {e}")
             return False
 
-    def process_episode(self, input_path: str, ad_segments: List[Dict]) -> Optional[str]:
-        """Process episode audio to remove ads."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp:
+    def process_episode(self, input_path: str, ad_segments: List[Dict],
+                        output_dir: Optional[str] = None) -> Optional[str]:
+        """Process episode audio to remove ads.
+
+        Pass output_dir on the same filesystem as the final episode path so the
+        result can be moved into place with a rename instead of a copy.
+        """
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3', dir=output_dir) as tmp:
             temp_output = tmp.name
 
         try:
@@ -34,6 +34,7 @@ MAX_MERGED_DURATION = 300.0     # 5 minutes max for merged ads
 MAX_REALISTIC_SIGNAL = 180.0    # 3 minutes - anything longer is suspect
 MIN_OVERLAP_TOLERANCE = 120.0   # 2 min tolerance for boundary ads
 MAX_AD_DURATION_WINDOW = 420.0  # 7 min max (longest reasonable sponsor read)
+MIN_DETECTION_TRANSCRIPT_DURATION = 60.0  # Skip the LLM for transcripts shorter than this
 
 # ============================================================
 # Position Windows (as fraction of episode duration 0.0 - 1.0)
@@ -109,6 +110,15 @@ AD_CONTENT_PROMO_PHRASES = [
     'dot com', 'slash', 'coupon', 'discount', 'offer code',
 ]
 
+# ============================================================
+# Detection Window Pre-filter (AD_DETECTION_PREFILTER)
+# ============================================================
+# Sponsor cues checked in addition to AD_CONTENT_* before sending a window
+AD_PREFILTER_PHRASES = [
+    'brought to you by', 'sponsor', 'support for', 'advertis', 'partner',
+]
+PREFILTER_MAX_CANDIDATE_RATIO = 0.7  # Send every window if this share has cues
+
 # ============================================================
 # Ad Duration Estimation
 # ============================================================
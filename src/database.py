@@ -13,6 +13,7 @@ import nh3
 
 from utils.time import parse_timestamp
 from utils.text import extract_text_in_range
+from utils.json import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -457,6 +458,14 @@ CREATE TABLE IF NOT EXISTS token_usage (
     call_count INTEGER NOT NULL DEFAULT 0,
     updated_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
 );
+
+-- ad_detection_cache table (LLM responses keyed by prompt content hash)
+CREATE TABLE IF NOT EXISTS ad_detection_cache (
+    cache_key TEXT PRIMARY KEY,
+    model_id TEXT NOT NULL,
+    response_text TEXT NOT NULL,
+    created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+);
 """
 
 # Indexes that depend on columns added by migrations - created separately
@@ -478,6 +487,12 @@ DEFAULT_MODEL_PRICING = {
     'claude-haiku-4-5-20251001':  {'name': 'Claude Haiku 4.5',  'input': 1.0,  'output': 5.0},
 }
 
+# Prompt cache pricing relative to the base input rate
+CACHE_WRITE_COST_MULTIPLIER = 1.25
+CACHE_READ_COST_MULTIPLIER = 0.1
+# Message Batches API pricing relative to synchronous calls
+BATCH_COST_MULTIPLIER = 0.5
+
 
 class Database:
     """SQLite database manager with thread-safe connections."""
@@ -722,6 +737,16 @@ class Database:
             )
         """)
 
+        # Create ad_detection_cache table if not exists
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ad_detection_cache (
+                cache_key TEXT PRIMARY KEY,
+                model_id TEXT NOT NULL,
+                response_text TEXT NOT NULL,
+                created_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))
+            )
+        """)
+
         conn.commit()
         logger.info("Created new tables for cross-episode training and processing history")
 
@@ -799,6 +824,7 @@ class Database:
             ('audio_analysis_json', 'TEXT'),
             ('transcript_vtt', 'TEXT'),
             ('chapters_json', 'TEXT'),
+            ('transcript_segments_json', 'TEXT'),
         ]
         for col, definition in details_migrations:
             self._add_column_if_missing(conn, 'episode_details', col, definition, det_cols)
@@ -1432,6 +1458,57 @@ class Database:
         """)
         return [dict(row) for row in cursor.fetchall()]
 
+    def get_feed_list(self, base_url: str) -> List[Dict]:
+        """Get the API feed listing, projected entirely in SQL.
+
+        Episode counts are aggregated once per podcast in a subquery and the
+        row is shaped with the camelCase keys returned by GET /api/v1/feeds.
+        """
+        conn = self.get_connection()
+        cursor = conn.execute("""
+            SELECT p.slug,
+                   COALESCE(NULLIF(p.title, ''), p.slug) AS title,
+                   p.source_url AS sourceUrl,
+                   ? || '/' || p.slug AS feedUrl,
+                   CASE WHEN p.artwork_cached
+                        THEN '/api/v1/feeds/' || p.slug || '/artwork'
+                        ELSE p.artwork_url END AS artworkUrl,
+                   COALESCE(e.episode_count, 0) AS episodeCount,
+                   COALESCE(e.processed_count, 0) AS processedCount,
+                   p.last_checked_at AS lastRefreshed,
+                   p.created_at AS createdAt,
+                   e.last_episode_date AS lastEpisodeDate,
+                   p.network_id AS networkId,
+                   p.dai_platform AS daiPlatform
+            FROM podcasts p
+            LEFT JOIN (
+                SELECT podcast_id,
+                       COUNT(*) AS episode_count,
+                       SUM(status = 'processed') AS processed_count,
+                       MAX(created_at) AS last_episode_date
+                FROM episodes
+                GROUP BY podcast_id
+            ) e ON e.podcast_id = p.id
+            ORDER BY p.created_at DESC
+        """, (base_url,))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def get_podcast_last_checked(self, slug: str) -> Optional[float]:
+        """Get a podcast's last_checked_at as epoch seconds.
+
+        SQLite does the ISO parsing, so callers only need a subtraction.
+        Returns None if the podcast was never checked and 0.0 if the stored
+        value is not a valid timestamp.
+        """
+        conn = self.get_connection()
+        row = conn.execute(
+            "SELECT last_checked_at, CAST(strftime('%s', last_checked_at) AS REAL) "
+            "FROM podcasts WHERE slug = ?", (slug,)
+        ).fetchone()
+        if not row or row[0] is None:
+            return None
+        return row[1] or 0.0
+
     def get_podcast_by_slug(self, slug: str) -> Optional[Dict]:
         """Get podcast by slug with episode counts."""
         conn = self.get_connection()
@@ -1570,6 +1647,29 @@ class Database:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    # episode_details columns that get_episode_detail may read
+    EPISODE_DETAIL_COLUMNS = ('transcript_text', 'transcript_vtt', 'chapters_json',
+                              'transcript_segments_json')
+
+    def get_episode_detail(self, slug: str, episode_id: str, column: str) -> Optional[str]:
+        """Get a single episode_details column without loading the full episode row.
+
+        get_episode() pulls every large text column (transcript, VTT, raw LLM
+        responses); endpoints that serve one of them only need that one.
+        """
+        if column not in self.EPISODE_DETAIL_COLUMNS:
+            raise ValueError(f"Unsupported episode detail column: {column}")
+        conn = self.get_connection()
+        row = conn.execute(
+            f"""SELECT ed.{column}
+               FROM episodes e
+               JOIN podcasts p ON e.podcast_id = p.id
+               JOIN episode_details ed ON e.id = ed.episode_id
+               WHERE p.slug = ? AND e.episode_id = ?""",
+            (slug, episode_id)
+        ).fetchone()
+        return row[0] if row else None
+
     def get_episode_by_id(self, db_id: int) -> Optional[Dict]:
         """Get episode by database ID."""
         conn = self.get_connection()
@@ -1697,8 +1797,13 @@ class Database:
                             first_pass_response: str = None,
                             first_pass_prompt: str = None,
                             second_pass_prompt: str = None,
-                            second_pass_response: str = None):
-        """Save or update episode details (transcript, VTT, chapters, ad markers, pass data)."""
+                            second_pass_response: str = None,
+                            transcript_segments_json: str = None):
+        """Save or update episode details (transcript, VTT, chapters, ad markers, pass data).
+
+        transcript_segments_json is only stored together with transcript_text;
+        writing transcript_text without it clears any stale segments.
+        """
         conn = self.get_connection()
 
         # Get episode database ID
@@ -1715,7 +1820,7 @@ class Database:
         )
         row = cursor.fetchone()
 
-        ad_markers_json_str = json.dumps(ad_markers) if ad_markers is not None else None
+        ad_markers_json_str = json_dumps(ad_markers) if ad_markers is not None else None
 
         if row:
             # Update existing
@@ -1724,6 +1829,8 @@ class Database:
             if transcript_text is not None:
                 updates.append("transcript_text = ?")
                 values.append(transcript_text)
+                updates.append("transcript_segments_json = ?")
+                values.append(transcript_segments_json)
             if transcript_vtt is not None:
                 updates.append("transcript_vtt = ?")
                 values.append(transcript_vtt)
@@ -1758,11 +1865,12 @@ class Database:
                 """INSERT INTO episode_details
                    (episode_id, transcript_text, transcript_vtt, chapters_json,
                     ad_markers_json, first_pass_response, first_pass_prompt,
-                    second_pass_prompt, second_pass_response)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    second_pass_prompt, second_pass_response, transcript_segments_json)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
                 (db_episode_id, transcript_text, transcript_vtt, chapters_json,
                  ad_markers_json_str, first_pass_response, first_pass_prompt,
-                 second_pass_prompt, second_pass_response)
+                 second_pass_prompt, second_pass_response,
+                 transcript_segments_json if transcript_text is not None else None)
             )
 
         conn.commit()
@@ -2028,6 +2136,14 @@ class Database:
             for row in cursor
         ]
 
+    def feed_exists(self, slug: str) -> bool:
+        """Whether get_feeds_config would include slug (single indexed lookup)."""
+        conn = self.get_connection()
+        row = conn.execute(
+            "SELECT 1 FROM podcasts WHERE slug = ? AND source_url != ''", (slug,)
+        ).fetchone()
+        return row is not None
+
     # ========== Cumulative Stats Methods ==========
 
     def increment_total_time_saved(self, seconds: float):
@@ -2066,11 +2182,17 @@ class Database:
     # ========== Token Usage Methods ==========
 
     def _calculate_token_cost(self, conn, model_id: str,
-                              input_tokens: int, output_tokens: int) -> float:
+                              input_tokens: int, output_tokens: int,
+                              cache_creation_tokens: int = 0,
+                              cache_read_tokens: int = 0) -> float:
         """Calculate cost for a single LLM call based on model pricing.
 
         Tries exact match first, then prefix match for versioned model IDs.
         Returns 0.0 with a warning for unknown models.
+
+        input_tokens is the full prompt size; the cache_* counts are the
+        portions of it that were written to / read from the prompt cache and
+        are billed at the cache multipliers instead of the base input rate.
         """
         # Exact match
         cursor = conn.execute(
@@ -2093,18 +2215,29 @@ class Database:
             logger.warning(f"No pricing found for model '{model_id}', cost recorded as $0")
             return 0.0
 
-        input_cost = (input_tokens / 1_000_000) * row['input_cost_per_mtok']
+        uncached_tokens = max(input_tokens - cache_creation_tokens - cache_read_tokens, 0)
+        effective_input = (
+            uncached_tokens
+            + cache_creation_tokens * CACHE_WRITE_COST_MULTIPLIER
+            + cache_read_tokens * CACHE_READ_COST_MULTIPLIER
+        )
+        input_cost = (effective_input / 1_000_000) * row['input_cost_per_mtok']
         output_cost = (output_tokens / 1_000_000) * row['output_cost_per_mtok']
         return input_cost + output_cost
 
-    def record_token_usage(self, model_id: str, input_tokens: int, output_tokens: int) -> float:
+    def record_token_usage(self, model_id: str, input_tokens: int, output_tokens: int,
+                           cache_creation_tokens: int = 0, cache_read_tokens: int = 0,
+                           batch: bool = False) -> float:
         """Record token usage for an LLM call. Atomic upsert to per-model and global stats.
         Returns the calculated cost for this call."""
         if not model_id or (input_tokens <= 0 and output_tokens <= 0):
             return 0.0
 
         conn = self.get_connection()
-        cost = self._calculate_token_cost(conn, model_id, input_tokens, output_tokens)
+        cost = self._calculate_token_cost(conn, model_id, input_tokens, output_tokens,
+                                          cache_creation_tokens, cache_read_tokens)
+        if batch:
+            cost *= BATCH_COST_MULTIPLIER
 
         # Upsert per-model token_usage row
         conn.execute(
@@ -2219,6 +2352,50 @@ class Database:
         if inserted > 0:
             logger.info(f"Refreshed model pricing: {inserted} new models added")
 
+    # ========== Ad Detection Cache Methods ==========
+
+    def get_detection_cache(self, cache_key: str) -> Optional[str]:
+        """Return the cached LLM response text for a detection prompt hash."""
+        conn = self.get_connection()
+        row = conn.execute(
+            "SELECT response_text FROM ad_detection_cache WHERE cache_key = ?",
+            (cache_key,)
+        ).fetchone()
+        return row['response_text'] if row else None
+
+    def save_detection_cache(self, cache_key: str, model_id: str, response_text: str):
+        """Store an LLM response for a detection prompt hash."""
+        conn = self.get_connection()
+        conn.execute(
+            """INSERT OR REPLACE INTO ad_detection_cache (cache_key, model_id, response_text)
+               VALUES (?, ?, ?)""",
+            (cache_key, model_id, response_text)
+        )
+        conn.commit()
+
+    def delete_detection_cache(self, cache_key: str):
+        """Delete the cached response for a detection prompt hash."""
+        conn = self.get_connection()
+        conn.execute("DELETE FROM ad_detection_cache WHERE cache_key = ?", (cache_key,))
+        conn.commit()
+
+    def prune_detection_cache(self, max_age_days: int = 0) -> int:
+        """Delete cached detection responses older than max_age_days.
+
+        max_age_days <= 0 clears the whole cache. Returns rows deleted.
+        """
+        conn = self.get_connection()
+        if max_age_days <= 0:
+            cursor = conn.execute("DELETE FROM ad_detection_cache")
+        else:
+            cursor = conn.execute(
+                """DELETE FROM ad_detection_cache
+                   WHERE created_at < strftime('%Y-%m-%dT%H:%M:%SZ', 'now', ?)""",
+                (f'-{int(max_age_days)} days',)
+            )
+        conn.commit()
+        return cursor.rowcount
+
     # ========== System Settings Methods (for schema versioning) ==========
 
     def get_system_setting(self, key: str) -> Optional[str]:
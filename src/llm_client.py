@@ -19,6 +19,7 @@ Configuration via environment variables:
 import logging
 import os
 import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Any
@@ -74,6 +75,8 @@ class LLMClient(ABC):
 
     def __init__(self):
         self._usage_callback = None
+        # Guards lazy SDK client creation; detection windows call concurrently
+        self._client_lock = threading.Lock()
 
     def set_usage_callback(self, callback):
         """Set a callback to be invoked with (model, usage_dict) after each LLM call."""
@@ -96,7 +99,9 @@ class LLMClient(ABC):
         messages: List[Dict],
         temperature: float = 0.0,
         timeout: float = 120.0,
-        response_format: Optional[Dict[str, str]] = None
+        response_format: Optional[Dict[str, str]] = None,
+        cache_system: bool = False,
+        cache_prefix: Optional[str] = None
     ) -> LLMResponse:
         """Send a completion request (synchronous).
 
@@ -109,12 +114,53 @@ class LLMClient(ABC):
             timeout: Request timeout in seconds
             response_format: Optional format specification (e.g., {"type": "json_object"})
                            Used by OpenAI-compatible APIs to enforce JSON output
+            cache_system: Mark the system prompt as a cacheable prefix. Only honored
+                          by backends that support prompt caching (Anthropic).
+            cache_prefix: Leading text of the last user message to mark as a second
+                          cache breakpoint (e.g. per-episode context shared by
+                          every window). Only honored by Anthropic.
 
         Returns:
             LLMResponse with content, model, and usage info
         """
         pass
 
+    def supports_batches(self) -> bool:
+        """Whether this backend supports asynchronous batch submission."""
+        return False
+
+    def messages_batch_create(
+        self,
+        requests: List[Dict],
+        poll_interval: float = 15.0,
+        max_wait: float = 3600.0
+    ) -> Dict[str, Optional[LLMResponse]]:
+        """Submit several completion requests as one asynchronous batch.
+
+        Args:
+            requests: List of dicts with 'custom_id' plus the keyword arguments
+                      accepted by messages_create
+            poll_interval: Seconds between batch status checks
+            max_wait: Give up (and cancel the batch) after this many seconds
+
+        Backends without a batch API run the requests one at a time through
+        messages_create, so the result has the same shape either way.
+
+        Returns:
+            Dict mapping custom_id to LLMResponse, or None for requests that
+            did not succeed. Callers should fall back to messages_create.
+        """
+        results: Dict[str, Optional[LLMResponse]] = {}
+        for req in requests:
+            req = dict(req)
+            custom_id = req.pop('custom_id')
+            try:
+                results[custom_id] = self.messages_create(**req)
+            except Exception as e:
+                logger.warning(f"{self.get_provider_name()} request {custom_id} failed: {e}")
+                results[custom_id] = None
+        return results
+
     @abstractmethod
     def list_models(self) -> List[LLMModel]:
         """List available models.
@@ -139,26 +185,28 @@ class AnthropicClient(LLMClient):
         self._client = None
 
     def _ensure_client(self):
-        """Lazy initialize the Anthropic client."""
+        """Lazy initialize the Anthropic client (one pooled client per process)."""
         if self._client is None:
-            if not self.api_key:
-                raise ValueError("No Anthropic API key provided")
-            from anthropic import Anthropic
-            self._client = Anthropic(api_key=self.api_key)
-            logger.info("Anthropic client initialized")
-
-    def messages_create(
+            with self._client_lock:
+                if self._client is None:
+                    if not self.api_key:
+                        raise ValueError("No Anthropic API key provided")
+                    from anthropic import Anthropic
+                    self._client = Anthropic(api_key=self.api_key)
+                    logger.info("Anthropic client initialized")
+
+    def _build_params(
         self,
         model: str,
         max_tokens: int,
         system: str,
         messages: List[Dict],
         temperature: float = 0.0,
-        timeout: float = 120.0,
-        response_format: Optional[Dict[str, str]] = None
-    ) -> LLMResponse:
-        self._ensure_client()
-
+        response_format: Optional[Dict[str, str]] = None,
+        cache_system: bool = False,
+        cache_prefix: Optional[str] = None
+    ) -> Dict:
+        """Build Messages API parameters shared by single and batch requests."""
         # Anthropic API doesn't support response_format parameter natively,
         # so we add explicit JSON instructions to the system prompt when requested
         effective_system = system
@@ -176,29 +224,153 @@ class AnthropicClient(LLMClient):
                 effective_system = system + json_instruction
                 logger.debug("Added JSON format instructions to system prompt")
 
-        response = self._client.messages.create(
-            model=model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            system=effective_system,
-            messages=messages,
-            timeout=timeout
-        )
+        # Prompt caching: the system prompt is identical across every window and
+        # episode, so mark it as an ephemeral cache breakpoint. Anthropic serves
+        # the prefix from cache for 5 minutes after the last hit.
+        if cache_system and effective_system:
+            system_param = [{
+                "type": "text",
+                "text": effective_system,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        else:
+            system_param = effective_system
+
+        # Second breakpoint: split the shared leading part of the user message
+        # into its own cached block so later requests reuse system + prefix.
+        if cache_prefix and messages:
+            content = messages[-1].get('content')
+            if (isinstance(content, str) and len(content) > len(cache_prefix)
+                    and content.startswith(cache_prefix)):
+                messages = messages[:-1] + [{
+                    **messages[-1],
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": cache_prefix,
+                            "cache_control": {"type": "ephemeral"}
+                        },
+                        {"type": "text", "text": content[len(cache_prefix):]},
+                    ]
+                }]
+
+        return {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system_param,
+            "messages": messages,
+        }
 
+    def _to_llm_response(self, response, batch: bool = False) -> LLMResponse:
+        """Convert an Anthropic Message into an LLMResponse and record usage."""
         content = response.content[0].text if response.content else ""
 
+        usage = None
+        if response.usage:
+            cache_creation = getattr(response.usage, 'cache_creation_input_tokens', None) or 0
+            cache_read = getattr(response.usage, 'cache_read_input_tokens', None) or 0
+            # Anthropic reports uncached input separately from cached input;
+            # input_tokens stays the full prompt size so totals remain comparable.
+            usage = {
+                'input_tokens': response.usage.input_tokens + cache_creation + cache_read,
+                'output_tokens': response.usage.output_tokens,
+                'cache_creation_input_tokens': cache_creation,
+                'cache_read_input_tokens': cache_read,
+            }
+            if batch:
+                usage['batch'] = True
+            if cache_creation or cache_read:
+                logger.info(
+                    f"Prompt cache: read={cache_read} created={cache_creation} "
+                    f"uncached={response.usage.input_tokens}"
+                )
+
         llm_response = LLMResponse(
             content=content,
             model=response.model,
-            usage={
-                'input_tokens': response.usage.input_tokens,
-                'output_tokens': response.usage.output_tokens
-            } if response.usage else None,
+            usage=usage,
             raw_response=response
         )
         self._notify_usage(llm_response)
         return llm_response
 
+    def messages_create(
+        self,
+        model: str,
+        max_tokens: int,
+        system: str,
+        messages: List[Dict],
+        temperature: float = 0.0,
+        timeout: float = 120.0,
+        response_format: Optional[Dict[str, str]] = None,
+        cache_system: bool = False,
+        cache_prefix: Optional[str] = None
+    ) -> LLMResponse:
+        self._ensure_client()
+
+        params = self._build_params(
+            model, max_tokens, system, messages, temperature,
+            response_format, cache_system, cache_prefix
+        )
+        response = self._client.messages.create(**params, timeout=timeout)
+        return self._to_llm_response(response)
+
+    def supports_batches(self) -> bool:
+        return True
+
+    def messages_batch_create(
+        self,
+        requests: List[Dict],
+        poll_interval: float = 15.0,
+        max_wait: float = 3600.0
+    ) -> Dict[str, Optional[LLMResponse]]:
+        """Submit requests through the Message Batches API (50% input/output cost).
+
+        Blocks until the batch ends or max_wait elapses. Unfinished batches are
+        cancelled and their requests reported as None.
+        """
+        self._ensure_client()
+
+        batch_requests = []
+        for req in requests:
+            req = dict(req)
+            custom_id = req.pop('custom_id')
+            req.pop('timeout', None)
+            batch_requests.append({
+                "custom_id": custom_id,
+                "params": self._build_params(**req),
+            })
+
+        batch = self._client.messages.batches.create(requests=batch_requests)
+        logger.info(f"Submitted message batch {batch.id} ({len(batch_requests)} requests)")
+
+        results: Dict[str, Optional[LLMResponse]] = {
+            r['custom_id']: None for r in batch_requests
+        }
+        waited = 0.0
+        while batch.processing_status != 'ended':
+            if waited >= max_wait:
+                logger.warning(f"Message batch {batch.id} not finished after {max_wait:.0f}s, cancelling")
+                try:
+                    self._client.messages.batches.cancel(batch.id)
+                except Exception as e:
+                    logger.warning(f"Failed to cancel message batch {batch.id}: {e}")
+                return results
+            time.sleep(poll_interval)
+            waited += poll_interval
+            batch = self._client.messages.batches.retrieve(batch.id)
+
+        for entry in self._client.messages.batches.results(batch.id):
+            if entry.result.type == 'succeeded':
+                results[entry.custom_id] = self._to_llm_response(entry.result.message, batch=True)
+            else:
+                logger.warning(f"Message batch {batch.id} request {entry.custom_id}: {entry.result.type}")
+
+        succeeded = sum(1 for r in results.values() if r is not None)
+        logger.info(f"Message batch {batch.id} ended: {succeeded}/{len(results)} succeeded in {waited:.0f}s")
+        return results
+
     def list_models(self) -> List[LLMModel]:
         self._ensure_client()
 
@@ -249,12 +421,14 @@ class OpenAICompatibleClient(LLMClient):
     def _ensure_client(self):
         """Lazy initialize the OpenAI client."""
         if self._client is None:
-            from openai import OpenAI
-            self._client = OpenAI(
-                base_url=self.base_url,
-                api_key=self.api_key
-            )
-            logger.info(f"OpenAI-compatible client initialized (base_url: {self.base_url})")
+            with self._client_lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI(
+                        base_url=self.base_url,
+                        api_key=self.api_key
+                    )
+                    logger.info(f"OpenAI-compatible client initialized (base_url: {self.base_url})")
 
     def messages_create(
         self,
@@ -264,7 +438,9 @@ class OpenAICompatibleClient(LLMClient):
         messages: List[Dict],
         temperature: float = 0.0,
         timeout: float = 120.0,
-        response_format: Optional[Dict[str, str]] = None
+        response_format: Optional[Dict[str, str]] = None,
+        cache_system: bool = False,
+        cache_prefix: Optional[str] = None
     ) -> LLMResponse:
         self._ensure_client()
 
@@ -358,6 +534,7 @@ class OpenAICompatibleClient(LLMClient):
 # =============================================================================
 
 _cached_client: Optional[LLMClient] = None
+_cached_client_lock = threading.Lock()
 
 # Per-episode token accumulator using thread-local storage.
 # Each thread (background processor, HTTP handler) gets its own
@@ -397,6 +574,29 @@ def get_episode_token_totals() -> Dict:
     return totals
 
 
+def run_with_episode_tracking(fn, *args, **kwargs):
+    """Run fn with a fresh accumulator on the current (worker) thread.
+
+    Returns (result, token_totals). Pair with add_episode_token_totals() on
+    the thread that owns the episode so pooled LLM calls are still counted.
+    """
+    start_episode_token_tracking()
+    try:
+        result = fn(*args, **kwargs)
+    except Exception:
+        get_episode_token_totals()
+        raise
+    return result, get_episode_token_totals()
+
+
+def add_episode_token_totals(totals: Dict):
+    """Credit totals gathered on another thread to the current thread's accumulator."""
+    if _get_accumulator_active():
+        _episode_accumulator.input_tokens += totals.get('input_tokens', 0)
+        _episode_accumulator.output_tokens += totals.get('output_tokens', 0)
+        _episode_accumulator.cost += totals.get('cost', 0.0)
+
+
 def _record_token_usage(model: str, usage: Dict):
     """Module-level callback for recording token usage to the database."""
     input_tokens = usage.get('input_tokens', 0)
@@ -410,6 +610,9 @@ def _record_token_usage(model: str, usage: Dict):
             model_id=model,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cache_creation_tokens=usage.get('cache_creation_input_tokens', 0),
+            cache_read_tokens=usage.get('cache_read_input_tokens', 0),
+            batch=usage.get('batch', False),
         )
     except Exception as e:
         logger.warning(f"Failed to record token usage to DB: {e}")
@@ -451,19 +654,24 @@ def get_llm_client(force_new: bool = False) -> LLMClient:
     if _cached_client is not None and not force_new:
         return _cached_client
 
-    provider = os.environ.get('LLM_PROVIDER', 'anthropic').lower()
+    with _cached_client_lock:
+        if _cached_client is not None and not force_new:
+            return _cached_client
 
-    if provider == 'anthropic':
-        _cached_client = AnthropicClient()
-    elif provider in ('openai-compatible', 'openai', 'wrapper', 'ollama'):
-        _cached_client = OpenAICompatibleClient()
-    else:
-        logger.warning(f"Unknown LLM_PROVIDER '{provider}', defaulting to anthropic")
-        _cached_client = AnthropicClient()
+        provider = os.environ.get('LLM_PROVIDER', 'anthropic').lower()
+
+        if provider == 'anthropic':
+            client = AnthropicClient()
+        elif provider in ('openai-compatible', 'openai', 'wrapper', 'ollama'):
+            client = OpenAICompatibleClient()
+        else:
+            logger.warning(f"Unknown LLM_PROVIDER '{provider}', defaulting to anthropic")
+            client = AnthropicClient()
 
-    _cached_client.set_usage_callback(_record_token_usage)
-    logger.info(f"LLM client initialized: {_cached_client.get_provider_name()}")
-    return _cached_client
+        client.set_usage_callback(_record_token_usage)
+        _cached_client = client
+        logger.info(f"LLM client initialized: {client.get_provider_name()}")
+        return client
 
 
 def get_api_key() -> Optional[str]:
@@ -1,6 +1,10 @@
 """Main Flask web server for podcast ad removal with web UI."""
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import signal
 import sys
 import threading
@@ -13,12 +17,12 @@ from functools import wraps
 from flask import Flask, Response, send_file, abort, send_from_directory, request
 from flask_cors import CORS
 from slugify import slugify
-import shutil
 
-from utils.time import parse_timestamp
+from utils.text import parse_transcript_segments
 
 # Configure structured logging
 _logging_configured = False
+_log_listener = None
 import json as _json
 
 
@@ -51,14 +55,31 @@ class JSONFormatter(logging.Formatter):
         return _json.dumps(log_data)
 
 
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps exc_info on the record.
+
+    The stock prepare() pre-formats records for pickling, which would flatten
+    exceptions into the message and drop JSONFormatter's exception field. The
+    queue never leaves this process, so only the message args are merged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_logging():
     """Configure application logging.
 
+    Records are handed to a QueueListener thread that writes them to stdout,
+    so request and processing threads never block on the console pipe.
+
     Environment variables:
         LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR). Default: INFO
         LOG_FORMAT: Log output format ('text' or 'json'). Default: text
     """
-    global _logging_configured
+    global _logging_configured, _log_listener
     if _logging_configured:
         return
     _logging_configured = True
@@ -79,11 +100,16 @@ def setup_logging():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, console_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
     # Configure root logger - clear existing handlers first to prevent duplicates
     root = logging.getLogger()
     root.handlers.clear()
     root.setLevel(getattr(logging, log_level, logging.INFO))
-    root.addHandler(console_handler)
+    root.addHandler(_InProcessQueueHandler(log_queue))
 
     # Set specific logger levels
     logging.getLogger('werkzeug').setLevel(logging.INFO)
@@ -149,6 +175,14 @@ def log_request_detailed(f):
 # Maximum retry attempts for failed episodes before marking as permanently_failed
 MAX_EPISODE_RETRIES = 3
 
+# When set (e.g. "/internal/episodes"), processed episodes are handed to a fronting
+# nginx via X-Accel-Redirect as <prefix>/<slug>/episodes/<episode_id>.mp3, mirroring
+# the layout under data/podcasts/, instead of being streamed by the app
+EPISODE_ACCEL_REDIRECT_PREFIX = os.environ.get('EPISODE_ACCEL_REDIRECT_PREFIX', '').rstrip('/')
+
+# Episode IDs in request paths: word characters and hyphens only
+_EPISODE_ID_RE = re.compile(r'\A[\w-]+\Z')
+
 import requests.exceptions
 from llm_client import is_retryable_error, is_llm_api_error, start_episode_token_tracking, get_episode_token_totals
 
@@ -281,9 +315,12 @@ init_limiter(app)
 
 # Import components
 from storage import Storage
-from rss_parser import RSSParser
+from rss_parser import (
+    RSSParser, FeedRefreshSchedule, FEED_REFRESH_WORKERS,
+    FEED_REFRESH_MIN_INTERVAL, FEED_REFRESH_MAX_INTERVAL, FEED_REFRESH_MIN_WAIT
+)
 from transcriber import Transcriber
-from ad_detector import AdDetector, refine_ad_boundaries, snap_early_ads_to_zero, merge_same_sponsor_ads, extend_ad_boundaries_by_content
+from ad_detector import AdDetector, AD_DETECTION_CACHE_DAYS, refine_ad_boundaries, snap_early_ads_to_zero, merge_same_sponsor_ads, extend_ad_boundaries_by_content
 from ad_validator import AdValidator
 from audio_processor import AudioProcessor
 from database import Database
@@ -344,6 +381,8 @@ class TTLCache:
 _feed_cache = TTLCache(ttl_seconds=30)
 _settings_cache = TTLCache(ttl_seconds=60)
 _parsed_feeds_cache = TTLCache(ttl_seconds=60)
+_feed_list_cache = TTLCache(ttl_seconds=5)  # API /feeds listing
+_feed_refresh_schedule = FeedRefreshSchedule(FEED_REFRESH_MIN_INTERVAL, FEED_REFRESH_MAX_INTERVAL)
 
 
 # Backfill processing history from existing episodes (runs once on startup)
@@ -425,9 +464,24 @@ def get_feed_map():
     return result
 
 
+def get_feed_map_for(slug):
+    """Get feed map, re-reading it from the database if slug was just added.
+
+    Feeds only come from the database. An unknown slug is checked with a
+    single indexed lookup, and the shared map is only rebuilt when the feed
+    really exists, so probes for made-up slugs stay cheap for everyone.
+    """
+    feed_map = get_feed_map()
+    if slug not in feed_map and db.feed_exists(slug):
+        _feed_cache.invalidate('all_feeds')
+        feed_map = get_feed_map()
+    return feed_map
+
+
 def invalidate_feed_cache():
     """Invalidate feed cache after any feed modification."""
     _feed_cache.invalidate('all_feeds')
+    _feed_list_cache.invalidate()
 
 
 def get_parsed_feed(slug: str, source_url: str):
@@ -500,6 +554,12 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
                     return False
             else:
                 refresh_logger.info(f"[{slug}] Feed unchanged (304), skipping refresh")
+                # Still counts as a check, so serve_rss doesn't treat the cache as stale
+                db.update_podcast(
+                    slug,
+                    last_checked_at=datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+                )
+                _feed_refresh_schedule.record(slug, changed=False)
                 status_service.complete_feed_refresh(slug, 0)
                 return True
 
@@ -554,7 +614,7 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
             if artwork_url:
                 storage.download_artwork(slug, artwork_url)
 
-        episodes = rss_parser.extract_episodes(feed_content)
+        episodes = rss_parser.extract_episodes(feed_content, parsed_feed=parsed_feed)
 
         def _parse_published_to_utc_iso(published_str: str):
             """Parse RSS publish date to UTC ISO format."""
@@ -655,6 +715,8 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
         # Update last_checked timestamp
         db.update_podcast(slug, last_checked_at=datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'))
 
+        _feed_refresh_schedule.record(slug, changed=bool(newly_synced_episode_ids))
+
         refresh_logger.info(f"[{slug}] RSS refresh complete")
         status_service.complete_feed_refresh(slug, 0)
         return True
@@ -664,15 +726,25 @@ def refresh_rss_feed(slug: str, feed_url: str, force: bool = False):
         return False
 
 
-def refresh_all_feeds():
-    """Refresh all RSS feeds in parallel."""
-    try:
-        refresh_logger.info("Refreshing all RSS feeds")
+def refresh_all_feeds(due_only: bool = False):
+    """Refresh all RSS feeds in parallel.
 
+    With due_only, feeds whose adaptive background interval has not elapsed
+    are skipped.
+    """
+    try:
         feed_map = get_feed_map()
+        if due_only:
+            feed_map = {slug: info for slug, info in feed_map.items()
+                        if _feed_refresh_schedule.is_due(slug)}
+            if not feed_map:
+                refresh_logger.debug("No RSS feeds due for refresh")
+                return True
+
+        refresh_logger.info(f"Refreshing {'due' if due_only else 'all'} RSS feeds")
 
         # Parallelize feed refresh with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=5) as executor:
+        with ThreadPoolExecutor(max_workers=FEED_REFRESH_WORKERS) as executor:
             futures = {
                 executor.submit(refresh_rss_feed, slug, feed_info['in']): slug
                 for slug, feed_info in feed_map.items()
@@ -700,6 +772,22 @@ def run_cleanup():
     except Exception as e:
         refresh_logger.error(f"Cleanup failed: {e}")
 
+    # Evict stale ad detection cache entries
+    try:
+        evicted = db.prune_detection_cache(AD_DETECTION_CACHE_DAYS)
+        if evicted > 0:
+            refresh_logger.info(f"Cleanup: evicted {evicted} cached detection responses")
+    except Exception as e:
+        refresh_logger.error(f"Detection cache cleanup failed: {e}")
+
+    # Remove in-progress audio abandoned by killed workers
+    try:
+        removed = storage.cleanup_tmp_dir()
+        if removed > 0:
+            refresh_logger.info(f"Cleanup: removed {removed} abandoned temp files")
+    except Exception as e:
+        refresh_logger.error(f"Temp file cleanup failed: {e}")
+
     # Clean orphan podcast directories (podcasts deleted from DB but directories remain)
     try:
         valid_slugs = {p['slug'] for p in db.get_all_podcasts()}
@@ -710,7 +798,7 @@ def run_cleanup():
                     orphan_path = os.path.join(podcast_base, slug)
                     if os.path.isdir(orphan_path):
                         refresh_logger.warning(f"Removing orphan podcast directory: {slug}")
-                        shutil.rmtree(orphan_path, ignore_errors=True)
+                        storage.cleanup_podcast_dir(slug)
     except Exception as e:
         refresh_logger.error(f"Orphan cleanup failed: {e}")
 
@@ -726,16 +814,27 @@ def run_cleanup():
 
 
 def background_rss_refresh():
-    """Background task to refresh RSS feeds every 15 minutes.
+    """Background task to refresh RSS feeds as they come due.
 
-    Uses shutdown_event.wait() instead of time.sleep() to allow
-    graceful shutdown interruption.
+    Feeds that keep coming back unchanged are polled less often (see
+    FeedRefreshSchedule). Uses shutdown_event.wait() instead of time.sleep()
+    to allow graceful shutdown interruption.
     """
+    last_cleanup = 0.0
     while not shutdown_event.is_set():
-        refresh_all_feeds()
-        run_cleanup()
-        # Wait 15 minutes, but allow early exit on shutdown
-        shutdown_event.wait(timeout=900)
+        refresh_all_feeds(due_only=True)
+        if time.time() - last_cleanup >= FEED_REFRESH_MIN_INTERVAL:
+            run_cleanup()
+            last_cleanup = time.time()
+
+        # Sleep until the next feed is due, so backed-off intervals are kept
+        # exactly instead of being rounded up to the minimum interval. Feeds
+        # whose refresh failed are retried on the next wake.
+        wait = _feed_refresh_schedule.seconds_until_next_due()
+        if wait is None:
+            wait = FEED_REFRESH_MIN_INTERVAL
+        wait = min(max(wait, FEED_REFRESH_MIN_WAIT), FEED_REFRESH_MIN_INTERVAL)
+        shutdown_event.wait(timeout=wait)
 
 
 def background_queue_processor():
@@ -965,26 +1064,15 @@ def _download_and_transcribe(slug, episode_id, episode_url, podcast_name):
 
     Returns (audio_path, segments) or raises on failure.
     """
-    segments = None
-    transcript_text = storage.get_transcript(slug, episode_id)
-
-    if transcript_text:
+    # Segments stored with the transcript skip re-parsing the text lines
+    segments = storage.get_transcript_segments(slug, episode_id)
+    if segments is None:
+        transcript_text = storage.get_transcript(slug, episode_id)
+        if transcript_text:
+            segments = parse_transcript_segments(transcript_text)
+
+    if segments is not None:
         audio_logger.info(f"[{slug}:{episode_id}] Found existing transcript in database")
-        segments = []
-        for line in transcript_text.split('\n'):
-            if line.strip() and line.startswith('['):
-                try:
-                    time_part, text_part = line.split('] ', 1)
-                    time_range = time_part.strip('[')
-                    start_str, end_str = time_range.split(' --> ')
-                    segments.append({
-                        'start': parse_timestamp(start_str),
-                        'end': parse_timestamp(end_str),
-                        'text': text_part
-                    })
-                except (ValueError, TypeError):
-                    continue
-
         if segments:
             duration_min = segments[-1]['end'] / 60
             audio_logger.info(f"[{slug}:{episode_id}] Loaded {len(segments)} segments, {duration_min:.1f} min")
@@ -1016,7 +1104,7 @@ def _download_and_transcribe(slug, episode_id, episode_url, podcast_name):
         audio_logger.info(f"[{slug}:{episode_id}] Transcription complete: {len(segments)} segments, {duration_min:.1f} min")
 
         transcript_text = transcriber.segments_to_text(segments)
-        storage.save_transcript(slug, episode_id, transcript_text)
+        storage.save_transcript(slug, episode_id, transcript_text, segments)
 
     return audio_path, segments
 
@@ -1040,8 +1128,7 @@ def _run_audio_analysis(slug, episode_id, audio_path, segments):
             for err in result.errors:
                 audio_logger.warning(f"[{slug}:{episode_id}] Audio analysis warning: {err}")
 
-        import json as _json
-        db.save_episode_audio_analysis(slug, episode_id, _json.dumps(result.to_dict()))
+        db.save_episode_audio_analysis(slug, episode_id, result.to_json())
         return result
     except Exception as e:
         audio_logger.error(f"[{slug}:{episode_id}] Audio analysis failed: {e}")
@@ -1285,7 +1372,10 @@ def _run_verification_pass(slug, episode_id, processed_path, ads_to_remove,
                         ad['was_cut'] = False
 
                 if v_ads_to_cut:
-                    recut_path = local_audio_processor.process_episode(processed_path, v_ads_to_cut)
+                    recut_path = local_audio_processor.process_episode(
+                        processed_path, v_ads_to_cut,
+                        output_dir=os.path.dirname(processed_path)
+                    )
                     if recut_path:
                         if os.path.exists(processed_path):
                             os.unlink(processed_path)
@@ -1317,9 +1407,11 @@ def _generate_assets(slug, episode_id, segments, all_cuts, episode_description,
                 storage.save_transcript_vtt(slug, episode_id, vtt_content)
                 audio_logger.info(f"[{slug}:{episode_id}] Generated VTT transcript")
 
-        processed_text = transcript_gen.generate_text(segments, all_cuts)
+        # Keep the cut-adjusted segments with the text they were rendered from
+        processed_segments = transcript_gen.adjust_segments(segments, all_cuts)
+        processed_text = transcript_gen.segments_to_text(processed_segments)
         if processed_text:
-            db.save_episode_details(slug, episode_id, transcript_text=processed_text)
+            storage.save_transcript(slug, episode_id, processed_text, processed_segments)
 
         chapters_enabled = db.get_setting('chapters_enabled')
         if chapters_enabled is None or chapters_enabled.lower() == 'true':
@@ -1495,6 +1587,7 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
 
         # Stage 1: Download and transcribe
         audio_path, segments = _download_and_transcribe(slug, episode_id, episode_url, podcast_name)
+        processed_path = None
 
         try:
             # Stage 2: Audio analysis
@@ -1533,7 +1626,11 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
             bitrate = settings.get('audio_bitrate', {}).get('value', '128k')
             local_audio_processor = AudioProcessor(bitrate=bitrate)
 
-            processed_path = local_audio_processor.process_episode(audio_path, ads_to_remove)
+            # Write output to the data volume's scratch dir so the move is a rename
+            final_path = storage.get_episode_path(slug, episode_id)
+            processed_path = local_audio_processor.process_episode(
+                audio_path, ads_to_remove, output_dir=str(storage.tmp_dir)
+            )
             if not processed_path:
                 raise Exception("Failed to process audio with FFMPEG")
 
@@ -1557,8 +1654,7 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
             new_duration = local_audio_processor.get_audio_duration(processed_path)
 
             # Move processed file to final location
-            final_path = storage.get_episode_path(slug, episode_id)
-            shutil.move(processed_path, final_path)
+            os.replace(processed_path, final_path)
 
             # Stage 7: Generate assets
             all_cuts_for_assets = ads_to_remove + v_ads_for_ui
@@ -1576,6 +1672,9 @@ def process_episode(slug: str, episode_id: str, episode_url: str,
         finally:
             if os.path.exists(audio_path):
                 os.unlink(audio_path)
+            # Leftover output from a failed run would otherwise sit in the episodes dir
+            if processed_path and os.path.exists(processed_path):
+                os.unlink(processed_path)
 
     except Exception as e:
         _handle_processing_failure(slug, episode_id, episode_title, podcast_name,
@@ -1664,21 +1763,15 @@ def serve_openapi():
 @log_request_detailed
 def serve_rss(slug):
     """Serve modified RSS feed."""
-    feed_map = get_feed_map()
+    feed_map = get_feed_map_for(slug)
 
     if slug not in feed_map:
-        refresh_logger.info(f"[{slug}] Not found, refreshing feeds")
-        refresh_all_feeds()
-        feed_map = get_feed_map()
-
-        if slug not in feed_map:
-            feed_logger.warning(f"[{slug}] Feed not found")
-            abort(404)
+        feed_logger.warning(f"[{slug}] Feed not found")
+        abort(404)
 
     # Check if RSS cache exists or is stale
     cached_rss = storage.get_rss(slug)
-    data = storage.load_data_json(slug)
-    last_checked = data.get('last_checked')
+    last_checked = storage.get_last_checked(slug)
 
     should_refresh = False
     force_refresh = False  # Force full fetch bypasses 304 - use when cache is missing
@@ -1686,45 +1779,82 @@ def serve_rss(slug):
         should_refresh = True
         force_refresh = True  # No cache, must get full content (can't use 304)
         feed_logger.info(f"[{slug}] No RSS cache, refreshing")
-    elif last_checked:
-        try:
-            last_time = datetime.fromisoformat(last_checked.replace('Z', '+00:00'))
-            age_minutes = (datetime.now(timezone.utc) - last_time).total_seconds() / 60
-            if age_minutes > 15:
-                should_refresh = True
-                feed_logger.info(f"[{slug}] RSS cache stale ({age_minutes:.0f}min), refreshing")
-        except (ValueError, TypeError):
+    elif last_checked is not None:
+        age_minutes = (time.time() - last_checked) / 60
+        if age_minutes > 15:
             should_refresh = True
+            feed_logger.info(f"[{slug}] RSS cache stale ({age_minutes:.0f}min), refreshing")
 
     if should_refresh:
         refresh_rss_feed(slug, feed_map[slug]['in'], force=force_refresh)
         cached_rss = storage.get_rss(slug)
 
     if cached_rss:
-        feed_logger.info(f"[{slug}] Serving RSS feed")
+        feed_logger.debug(f"[{slug}] Serving RSS feed")
         return Response(cached_rss, mimetype='application/rss+xml')
     else:
         feed_logger.error(f"[{slug}] RSS feed not available")
         abort(503)
 
 
+def _stored_episode_source(slug: str, episode: dict):
+    """Build episode source info from its database row, or None if incomplete.
+
+    refresh_rss_feed syncs every upstream episode's URL and metadata into the
+    episodes table, so a first request normally needs no upstream fetch.
+    """
+    if not episode or not episode.get('original_url'):
+        return None
+    podcast = db.get_podcast_by_slug(slug)
+    return {
+        'url': episode['original_url'],
+        'title': episode.get('title') or 'Unknown',
+        'podcast_name': (podcast.get('title') if podcast else None) or 'Unknown',
+        'description': episode.get('description'),
+        'artwork_url': episode.get('artwork_url'),
+    }
+
+
+def _lookup_episode_source(slug: str, episode_id: str, feed_url: str) -> dict:
+    """Find an episode's original audio URL and metadata in the upstream feed.
+
+    Fetches and parses the upstream RSS once. Aborts with 503 if the feed
+    can't be fetched and 404 if the episode isn't in it.
+    """
+    original_feed = rss_parser.fetch_feed(feed_url)
+    if not original_feed:
+        feed_logger.error(f"[{slug}:{episode_id}] Could not fetch original RSS")
+        abort(503)
+
+    parsed_feed = rss_parser.parse_feed(original_feed)
+    podcast_name = parsed_feed.feed.get('title', 'Unknown') if parsed_feed else 'Unknown'
+
+    for ep in rss_parser.extract_episodes(original_feed, parsed_feed=parsed_feed):
+        if ep['id'] == episode_id:
+            return {
+                'url': ep['url'],
+                'title': ep.get('title', 'Unknown'),
+                'podcast_name': podcast_name,
+                'description': ep.get('description'),
+                'artwork_url': ep.get('artwork_url'),
+            }
+
+    feed_logger.error(f"[{slug}:{episode_id}] Episode not found in RSS")
+    abort(404)
+
+
 @app.route('/episodes/<slug>/<episode_id>.mp3')
 @log_request_detailed
 def serve_episode(slug, episode_id):
     """Serve processed episode audio (JIT processing)."""
-    feed_map = get_feed_map()
+    feed_map = get_feed_map_for(slug)
 
     if slug not in feed_map:
-        feed_logger.info(f"[{slug}] Not found for episode {episode_id}, refreshing")
-        refresh_all_feeds()
-        feed_map = get_feed_map()
-
-        if slug not in feed_map:
-            feed_logger.warning(f"[{slug}] Feed not found for episode {episode_id}")
-            abort(404)
+        feed_logger.warning(f"[{slug}] Feed not found for episode {episode_id}")
+        abort(404)
 
     # Validate episode ID
-    if not all(c.isalnum() or c in '-_' for c in episode_id):
+    if not _EPISODE_ID_RE.match(episode_id):
         feed_logger.warning(f"[{slug}] Invalid episode ID: {episode_id}")
         abort(400)
 
@@ -1735,8 +1865,15 @@ def serve_episode(slug, episode_id):
     if status == 'processed':
         file_path = storage.get_episode_path(slug, episode_id)
         if file_path.exists():
-            feed_logger.info(f"[{slug}:{episode_id}] Cache hit")
-            return send_file(file_path, mimetype='audio/mpeg')
+            feed_logger.debug(f"[{slug}:{episode_id}] Cache hit")
+            if EPISODE_ACCEL_REDIRECT_PREFIX:
+                return Response(headers={
+                    'X-Accel-Redirect': f"{EPISODE_ACCEL_REDIRECT_PREFIX}/{slug}/episodes/{episode_id}.mp3",
+                    'Content-Type': 'audio/mpeg',
+                })
+            # Range requests (seeking, resumed downloads) get 206 responses,
+            # and ETag/Last-Modified revalidation gets 304
+            return send_file(file_path, mimetype='audio/mpeg', conditional=True)
         else:
             feed_logger.error(f"[{slug}:{episode_id}] Processed file missing")
             status = None
@@ -1762,7 +1899,7 @@ def serve_episode(slug, episode_id):
         status = None
 
     elif status == 'processing':
-        feed_logger.info(f"[{slug}:{episode_id}] Currently processing")
+        feed_logger.debug(f"[{slug}:{episode_id}] Currently processing")
         return Response(
             "Episode is being processed",
             status=503,
@@ -1775,30 +1912,14 @@ def serve_episode(slug, episode_id):
         feed_logger.error(f"[{slug}:{episode_id}] No RSS available")
         abort(404)
 
-    original_feed = rss_parser.fetch_feed(feed_map[slug]['in'])
-    if not original_feed:
-        feed_logger.error(f"[{slug}:{episode_id}] Could not fetch original RSS")
-        abort(503)
-
-    parsed_feed = rss_parser.parse_feed(original_feed)
-    podcast_name = parsed_feed.feed.get('title', 'Unknown') if parsed_feed else 'Unknown'
-
-    episodes = rss_parser.extract_episodes(original_feed)
-    original_url = None
-    episode_title = "Unknown"
-    episode_description = None
-    episode_artwork_url = None
-    for ep in episodes:
-        if ep['id'] == episode_id:
-            original_url = ep['url']
-            episode_title = ep.get('title', 'Unknown')
-            episode_description = ep.get('description')
-            episode_artwork_url = ep.get('artwork_url')
-            break
-
-    if not original_url:
-        feed_logger.error(f"[{slug}:{episode_id}] Episode not found in RSS")
-        abort(404)
+    source = _stored_episode_source(slug, episode)
+    if source is None:
+        source = _lookup_episode_source(slug, episode_id, feed_map[slug]['in'])
+    original_url = source['url']
+    episode_title = source['title']
+    podcast_name = source['podcast_name']
+    episode_description = source['description']
+    episode_artwork_url = source['artwork_url']
 
     # Start background processing (non-blocking)
     started, reason = start_background_processing(
@@ -1843,7 +1964,7 @@ def serve_episode(slug, episode_id):
 def serve_transcript_vtt(slug, episode_id):
     """Serve VTT transcript for episode (Podcasting 2.0)."""
     # Validate episode ID
-    if not all(c.isalnum() or c in '-_' for c in episode_id):
+    if not _EPISODE_ID_RE.match(episode_id):
         feed_logger.warning(f"[{slug}] Invalid episode ID for VTT: {episode_id}")
         abort(400)
 
@@ -1852,7 +1973,7 @@ def serve_transcript_vtt(slug, episode_id):
         feed_logger.info(f"[{slug}:{episode_id}] VTT transcript not found")
         abort(404)
 
-    feed_logger.info(f"[{slug}:{episode_id}] Serving VTT transcript")
+    feed_logger.debug(f"[{slug}:{episode_id}] Serving VTT transcript")
     response = Response(vtt_content, mimetype='text/vtt')
     response.headers['Access-Control-Allow-Origin'] = '*'
     return response
@@ -1863,7 +1984,7 @@ def serve_transcript_vtt(slug, episode_id):
 def serve_chapters_json(slug, episode_id):
     """Serve chapters JSON for episode (Podcasting 2.0)."""
     # Validate episode ID
-    if not all(c.isalnum() or c in '-_' for c in episode_id):
+    if not _EPISODE_ID_RE.match(episode_id):
         feed_logger.warning(f"[{slug}] Invalid episode ID for chapters: {episode_id}")
         abort(400)
 
@@ -1873,7 +1994,7 @@ def serve_chapters_json(slug, episode_id):
         abort(404)
 
     import json
-    feed_logger.info(f"[{slug}:{episode_id}] Serving chapters JSON")
+    feed_logger.debug(f"[{slug}:{episode_id}] Serving chapters JSON")
     response = Response(json.dumps(chapters), mimetype='application/json+chapters')
     response.headers['Access-Control-Allow-Origin'] = '*'
     return response
@@ -19,6 +19,10 @@ from typing import Optional, Tuple
 # Must match StatusService.MAX_JOB_DURATION for consistency
 MAX_JOB_DURATION = 3600  # 60 minutes - auto-clear stuck jobs
 
+# How long get_current() may reuse its last answer. Status polling and health
+# checks call it constantly; acquire() still relies on flock, not this cache.
+CURRENT_STATE_TTL = 1.0
+
 logger = logging.getLogger('podcast.processing_queue')
 
 
@@ -52,15 +56,17 @@ class ProcessingQueue:
         self._state_file_path = data_dir / '.processing_queue_state.json'
         self._lock_fd = None
         self._fd_lock = threading.Lock()  # Protect _lock_fd access across threads
+        self._current_cache = None  # (monotonic expiry, get_current() result)
         self._initialized = True
 
     def _read_state(self) -> dict:
         """Read current processing state from shared file."""
         try:
-            if self._state_file_path.exists():
-                content = self._state_file_path.read_text()
-                if content.strip():
-                    return json.loads(content)
+            content = self._state_file_path.read_text()
+            if content.strip():
+                return json.loads(content)
+        except FileNotFoundError:
+            pass
         except (json.JSONDecodeError, OSError) as e:
             logger.debug(f"Could not read state file: {e}")
         return {'current_episode': None, 'acquired_at': None}
@@ -81,6 +87,8 @@ class ProcessingQueue:
             tmp_path.rename(self._state_file_path)
         except OSError as e:
             logger.warning(f"Could not write state file: {e}")
+        finally:
+            self._current_cache = None
 
     def _is_stale(self, state: dict) -> bool:
         """Check if current job has exceeded max duration."""
@@ -88,9 +96,11 @@ class ProcessingQueue:
             return False
         return (time.time() - state['acquired_at']) > MAX_JOB_DURATION
 
-    def _clear_stale_state(self) -> bool:
+    def _clear_stale_state(self, state: Optional[dict] = None) -> bool:
         """Clear stale or orphaned state. Returns True if cleared.
 
+        Pass an already-read state to avoid reading the state file again.
+
         Clears state in two cases:
         1. No process holds the flock (crashed worker left orphaned state)
         2. Job exceeded MAX_JOB_DURATION and lock is not held by this process
@@ -98,7 +108,8 @@ class ProcessingQueue:
         Uses a non-blocking flock probe to detect orphaned state without
         waiting for the time-based staleness threshold.
         """
-        state = self._read_state()
+        if state is None:
+            state = self._read_state()
         if state.get('current_episode') is None:
             return False
 
@@ -244,12 +255,18 @@ class ProcessingQueue:
         """Get currently processing episode (slug, episode_id) or None.
 
         Reads from shared state file so all workers see the same state.
-        Performs staleness check before returning.
+        Performs staleness check before returning. The answer is reused for
+        CURRENT_STATE_TTL seconds unless this process changes the state.
         """
-        self._clear_stale_state()
+        cached = self._current_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         state = self._read_state()
-        current = state.get('current_episode')
-        return tuple(current) if current else None
+        current = None if self._clear_stale_state(state) else state.get('current_episode')
+        result = tuple(current) if current else None
+        self._current_cache = (time.monotonic() + CURRENT_STATE_TTL, result)
+        return result
 
     def is_processing(self, slug: str, episode_id: str) -> bool:
         """Check if specific episode is currently being processed."""
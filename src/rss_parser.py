@@ -3,18 +3,88 @@ import feedparser
 import logging
 import hashlib
 import os
+import threading
+import time
 from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import APP_USER_AGENT
 from utils.url import validate_url, SSRFError
 
 logger = logging.getLogger(__name__)
 
+# Parallel feed fetches during refresh_all_feeds; also sizes the HTTP pool
+FEED_REFRESH_WORKERS = int(os.getenv('FEED_REFRESH_WORKERS', '8'))
+
+# Background refresh interval bounds (seconds). Unchanged feeds back off from
+# the minimum towards the maximum; a feed with new episodes resets to the minimum.
+FEED_REFRESH_MIN_INTERVAL = int(os.getenv('FEED_REFRESH_MIN_INTERVAL', '900'))
+FEED_REFRESH_MAX_INTERVAL = max(
+    FEED_REFRESH_MIN_INTERVAL, int(os.getenv('FEED_REFRESH_MAX_INTERVAL', '21600'))
+)
+# Shortest background sleep, so feeds falling due close together share a wake
+FEED_REFRESH_MIN_WAIT = 60
+
+
+class FeedRefreshSchedule:
+    """Thread-safe per-feed background refresh intervals.
+
+    Each feed starts at min_interval. A refresh that finds no new episodes
+    (including a 304) multiplies its interval by backoff, up to max_interval;
+    a refresh with new episodes resets it to min_interval. Kept in memory,
+    so a restart starts every feed at min_interval again.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float, backoff: float = 1.5):
+        self._schedule = {}  # slug -> (interval, next_due)
+        self._lock = threading.Lock()
+        self._min = min_interval
+        self._max = max_interval
+        self._backoff = backoff
+
+    def is_due(self, slug: str, now: float = None) -> bool:
+        """Whether slug should be refreshed by the background loop."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._schedule.get(slug)
+        return entry is None or now >= entry[1]
+
+    def record(self, slug: str, changed: bool, now: float = None):
+        """Record a completed refresh and schedule the next one."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._schedule.get(slug)
+            if changed or entry is None:
+                interval = self._min
+            else:
+                interval = min(entry[0] * self._backoff, self._max)
+            self._schedule[slug] = (interval, now + interval)
+
+    def seconds_until_next_due(self, now: float = None) -> Optional[float]:
+        """Seconds until the earliest upcoming refresh, or None if none is scheduled.
+
+        Feeds already overdue (e.g. their last refresh failed) are ignored, so
+        they are retried on the caller's next regular wake rather than in a
+        tight loop.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            upcoming = [due for _, due in self._schedule.values() if due > now]
+        return min(upcoming) - now if upcoming else None
+
+
 class RSSParser:
     def __init__(self, base_url: str = None):
         self.base_url = base_url or os.getenv('BASE_URL', 'http://localhost:8000')
+        # Shared session keeps connections alive across feeds on the same host
+        # (most feeds come from a handful of hosting providers)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=FEED_REFRESH_WORKERS,
+                              pool_maxsize=FEED_REFRESH_WORKERS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
     def fetch_feed(self, url: str, timeout: int = 30) -> Optional[str]:
         """Fetch RSS feed from URL."""
@@ -26,7 +96,7 @@ class RSSParser:
 
         try:
             logger.info(f"Fetching RSS feed from: {url}")
-            response = requests.get(url, timeout=timeout)
+            response = self.session.get(url, timeout=timeout)
             response.raise_for_status()
             logger.info(f"Successfully fetched RSS feed, size: {len(response.content)} bytes")
             return response.text
@@ -36,7 +106,7 @@ class RSSParser:
             logger.warning(f"Gzip decompression failed, retrying without compression: {e}")
             try:
                 headers = {'Accept-Encoding': 'identity'}
-                response = requests.get(url, timeout=timeout, headers=headers)
+                response = self.session.get(url, timeout=timeout, headers=headers)
                 response.raise_for_status()
                 logger.info(f"Successfully fetched RSS feed (uncompressed), size: {len(response.content)} bytes")
                 return response.text
@@ -79,7 +149,7 @@ class RSSParser:
             headers['If-Modified-Since'] = last_modified
 
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = self.session.get(url, headers=headers, timeout=timeout)
 
             if response.status_code == 304:
                 logger.info(f"Feed not modified (304): {url}")
@@ -98,7 +168,7 @@ class RSSParser:
             logger.warning(f"Gzip decompression failed, retrying: {e}")
             try:
                 headers['Accept-Encoding'] = 'identity'
-                response = requests.get(url, headers=headers, timeout=timeout)
+                response = self.session.get(url, headers=headers, timeout=timeout)
                 if response.status_code == 304:
                     return None, etag, last_modified
                 response.raise_for_status()
@@ -335,9 +405,13 @@ class RSSParser:
 
         return deduplicated
 
-    def extract_episodes(self, feed_content: str) -> List[Dict]:
-        """Extract episode information from feed."""
-        feed = self.parse_feed(feed_content)
+    def extract_episodes(self, feed_content: str, parsed_feed=None) -> List[Dict]:
+        """Extract episode information from feed.
+
+        Pass parsed_feed when the caller already ran parse_feed() on the
+        same content to avoid parsing the XML a second time.
+        """
+        feed = parsed_feed if parsed_feed is not None else self.parse_feed(feed_content)
         if not feed:
             return []
 
@@ -1,13 +1,16 @@
 """Storage management with SQLite database and file operations."""
 import json
 import logging
+import os
 import requests
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 import tempfile
 import shutil
 
 from config import BROWSER_USER_AGENT
+from utils.json import json_dumps, json_loads
 from utils.url import validate_url, SSRFError
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,11 @@ class Storage:
         self.podcasts_dir = self.data_dir / "podcasts"
         self.podcasts_dir.mkdir(exist_ok=True)
 
+        # Scratch space for in-progress audio, on the same filesystem as the
+        # episodes so finished files can be moved into place with a rename
+        self.tmp_dir = self.data_dir / "tmp"
+        self.tmp_dir.mkdir(exist_ok=True)
+
         # Initialize database
         from database import Database
         self.db = Database(str(self.data_dir))
@@ -33,11 +41,10 @@ class Storage:
     def get_podcast_dir(self, slug: str) -> Path:
         """Get podcast directory, creating if necessary."""
         podcast_dir = self.podcasts_dir / slug
-        podcast_dir.mkdir(exist_ok=True)
 
-        # Ensure episodes directory exists
-        episodes_dir = podcast_dir / "episodes"
-        episodes_dir.mkdir(exist_ok=True)
+        # One mkdir creates both the podcast and its episodes directory. Not
+        # memoized: other Storage instances and workers may delete the tree.
+        (podcast_dir / "episodes").mkdir(parents=True, exist_ok=True)
 
         return podcast_dir
 
@@ -79,6 +86,10 @@ class Storage:
             "last_checked": podcast.get('last_checked_at')
         }
 
+    def get_last_checked(self, slug: str) -> Optional[float]:
+        """Get when a podcast's feed was last fetched (epoch seconds), without loading its episodes."""
+        return self.db.get_podcast_last_checked(slug)
+
     def save_data_json(self, slug: str, data: Dict[str, Any]) -> None:
         """Save episode data to SQLite."""
         # Ensure podcast exists
@@ -124,7 +135,7 @@ class Storage:
             tmp.write(content)
             tmp_path = tmp.name
 
-        shutil.move(tmp_path, rss_file)
+        os.replace(tmp_path, rss_file)
         logger.debug(f"[{slug}] Saved modified RSS feed")
 
     def get_rss(self, slug: str) -> Optional[str]:
@@ -137,10 +148,23 @@ class Storage:
                 return f.read()
         return None
 
-    def save_transcript(self, slug: str, episode_id: str, transcript: str) -> None:
-        """Save episode transcript to database."""
+    def save_transcript(self, slug: str, episode_id: str, transcript: str,
+                        segments: Optional[List[Dict]] = None) -> None:
+        """Save episode transcript to database.
+
+        When segments are given they are stored alongside the text as parallel
+        start/end/text arrays, so reloading skips re-parsing every line.
+        """
+        segments_json = None
+        if segments:
+            segments_json = json_dumps({
+                'start': [s['start'] for s in segments],
+                'end': [s['end'] for s in segments],
+                'text': [s['text'] for s in segments],
+            })
         try:
-            self.db.save_episode_details(slug, episode_id, transcript_text=transcript)
+            self.db.save_episode_details(slug, episode_id, transcript_text=transcript,
+                                         transcript_segments_json=segments_json)
         except ValueError:
             logger.warning(f"[{slug}:{episode_id}] Episode not in DB, transcript not saved")
 
@@ -148,10 +172,22 @@ class Storage:
 
     def get_transcript(self, slug: str, episode_id: str) -> Optional[str]:
         """Get episode transcript from database."""
-        episode = self.db.get_episode(slug, episode_id)
-        if episode and episode.get('transcript_text'):
-            return episode['transcript_text']
-        return None
+        return self.db.get_episode_detail(slug, episode_id, 'transcript_text') or None
+
+    def get_transcript_segments(self, slug: str, episode_id: str) -> Optional[List[Dict]]:
+        """Get transcript segments stored by save_transcript, if any."""
+        segments_json = self.db.get_episode_detail(slug, episode_id, 'transcript_segments_json')
+        if not segments_json:
+            return None
+        try:
+            data = json_loads(segments_json)
+            return [
+                {'start': start, 'end': end, 'text': text}
+                for start, end, text in zip(data['start'], data['end'], data['text'])
+            ]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            logger.warning(f"[{slug}:{episode_id}] Invalid stored transcript segments, ignoring")
+            return None
 
     # ========== VTT Transcript Methods (Podcasting 2.0) ==========
 
@@ -165,22 +201,18 @@ class Storage:
 
     def get_transcript_vtt(self, slug: str, episode_id: str) -> Optional[str]:
         """Get VTT transcript from database."""
-        episode = self.db.get_episode(slug, episode_id)
-        if episode and episode.get('transcript_vtt'):
-            return episode['transcript_vtt']
-        return None
+        return self.db.get_episode_detail(slug, episode_id, 'transcript_vtt') or None
 
     def has_transcript_vtt(self, slug: str, episode_id: str) -> bool:
         """Check if VTT transcript exists in database."""
-        episode = self.db.get_episode(slug, episode_id)
-        return bool(episode and episode.get('transcript_vtt'))
+        return bool(self.db.get_episode_detail(slug, episode_id, 'transcript_vtt'))
 
     # ========== Chapters Methods (Podcasting 2.0) ==========
 
     def save_chapters_json(self, slug: str, episode_id: str, chapters: Dict) -> None:
         """Save chapters JSON to database."""
         try:
-            chapters_str = json.dumps(chapters)
+            chapters_str = json_dumps(chapters)
             self.db.save_episode_details(slug, episode_id, chapters_json=chapters_str)
             logger.debug(f"[{slug}:{episode_id}] Saved chapters JSON to database")
         except ValueError:
@@ -188,18 +220,17 @@ class Storage:
 
     def get_chapters_json(self, slug: str, episode_id: str) -> Optional[Dict]:
         """Get chapters JSON from database."""
-        episode = self.db.get_episode(slug, episode_id)
-        if episode and episode.get('chapters_json'):
+        chapters_json = self.db.get_episode_detail(slug, episode_id, 'chapters_json')
+        if chapters_json:
             try:
-                return json.loads(episode['chapters_json'])
+                return json_loads(chapters_json)
             except json.JSONDecodeError:
                 return None
         return None
 
     def has_chapters_json(self, slug: str, episode_id: str) -> bool:
         """Check if chapters JSON exists in database."""
-        episode = self.db.get_episode(slug, episode_id)
-        return bool(episode and episode.get('chapters_json'))
+        return bool(self.db.get_episode_detail(slug, episode_id, 'chapters_json'))
 
     def save_ads_json(self, slug: str, episode_id: str, ads_data: Any,
                       pass_number: int = 1) -> None:
@@ -310,8 +341,8 @@ class Storage:
             logger.error(f"[{slug}] Failed to save artwork: {e}")
             return False
 
-    def get_artwork(self, slug: str) -> Optional[Tuple[bytes, str]]:
-        """Get cached artwork. Returns (data, content_type) or None."""
+    def get_artwork(self, slug: str) -> Optional[Tuple[Path, str]]:
+        """Get cached artwork. Returns (path, content_type) or None."""
         podcast_dir = self.get_podcast_dir(slug)
 
         for ext, content_type in [('.jpg', 'image/jpeg'),
@@ -319,8 +350,7 @@ class Storage:
                                    ('.gif', 'image/gif')]:
             artwork_path = podcast_dir / f"artwork{ext}"
             if artwork_path.exists():
-                with open(artwork_path, 'rb') as f:
-                    return f.read(), content_type
+                return artwork_path, content_type
 
         return None
 
@@ -371,6 +401,25 @@ class Storage:
 
     # ========== Cleanup Methods ==========
 
+    def cleanup_tmp_dir(self, max_age_seconds: float = 7200) -> int:
+        """Delete scratch files left behind by killed workers.
+
+        Only files untouched for max_age_seconds are removed, so output still
+        being written by another worker survives. Returns the count removed.
+        """
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for path in self.tmp_dir.iterdir():
+            try:
+                if path.is_file() and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"Failed to delete temp file {path.name}: {e}")
+        return removed
+
     def delete_processed_file(self, slug: str, episode_id: str) -> bool:
         """Delete the processed audio file for an episode."""
         processed_path = self.get_episode_path(slug, episode_id, ".mp3")
@@ -5,11 +5,13 @@ import os
 import re
 import subprocess
 import hashlib
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
-from utils.audio import get_audio_duration as _get_audio_duration
+from utils.audio import AudioMetadata
 from utils.time import format_vtt_timestamp
 from utils.gpu import clear_gpu_memory, get_available_memory_gb, get_gpu_memory_info
 from utils.url import validate_url, SSRFError
@@ -30,6 +32,30 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
 OPENAI_TRANSCRIPTION_MODEL = os.getenv("OPENAI_TRANSCRIPTION_MODEL", "whisper-1")
 WHISPER_PROVIDER = os.getenv("WHISPER_PROVIDER", "local").lower()
+# Maximum OpenAI transcription chunks uploaded/transcribed in parallel
+TRANSCRIPTION_MAX_CONCURRENCY = max(1, int(os.getenv("TRANSCRIPTION_MAX_CONCURRENCY", "3")))
+
+# Episode downloads are written in 1 MiB chunks instead of 8 KiB ones
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Shared transcription API client, reused across chunks and episodes so
+# requests keep their pooled HTTPS connections instead of reconnecting
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client() -> OpenAI:
+    """Get the shared OpenAI transcription client, creating it on first use."""
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                if OPENAI_BASE_URL:
+                    _openai_client = OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
+                else:
+                    _openai_client = OpenAI(api_key=OPENAI_API_KEY)
+    return _openai_client
+
 
 # Suppress ONNX Runtime warnings before importing faster_whisper
 os.environ.setdefault('ORT_LOG_LEVEL', 'ERROR')
@@ -140,19 +166,29 @@ def split_long_segments(segments: List[Dict]) -> List[Dict]:
     return result
 
 
-def extract_audio_chunk(audio_path: str, start_time: float, end_time: float) -> Optional[str]:
+# Chunk output formats: name -> (file suffix, ffmpeg audio codec)
+CHUNK_FORMATS = {
+    'wav': ('.wav', 'pcm_s16le'),  # Uncompressed for faster local processing
+    'flac': ('.flac', 'flac'),     # Lossless, roughly half the bytes of WAV to upload
+}
+
+
+def extract_audio_chunk(audio_path: str, start_time: float, end_time: float,
+                        output_format: str = 'wav') -> Optional[str]:
     """Extract a time range from an audio file using ffmpeg.
 
     Args:
         audio_path: Path to source audio file
         start_time: Start time in seconds
         end_time: End time in seconds
+        output_format: Key of CHUNK_FORMATS ('wav' or 'flac')
 
     Returns:
         Path to temporary chunk file, or None on failure.
         Caller is responsible for cleaning up the temp file.
     """
-    output_path = tempfile.mktemp(suffix='.wav')
+    suffix, codec = CHUNK_FORMATS[output_format]
+    output_path = tempfile.mktemp(suffix=suffix)
 
     try:
         duration = end_time - start_time
@@ -163,7 +199,7 @@ def extract_audio_chunk(audio_path: str, start_time: float, end_time: float) ->
             '-t', str(duration),
             '-ar', '16000',  # Whisper native sample rate
             '-ac', '1',      # Mono
-            '-c:a', 'pcm_s16le',  # Uncompressed for faster processing
+            '-c:a', codec,
             output_path
         ]
 
@@ -332,8 +368,9 @@ def calculate_optimal_chunk_duration(
 
 class Transcriber:
     def __init__(self):
-        # Model is now managed by singleton
-        pass
+        # Shared session so the CDN availability check and the download reuse
+        # connections to the same redirect/tracking hosts and CDN
+        self.session = requests.Session()
 
     def get_initial_prompt(self, podcast_name: str = None) -> str:
         """Generate a podcast-aware initial prompt for Whisper."""
@@ -421,9 +458,9 @@ class Transcriber:
     def get_audio_duration(self, audio_path: str) -> Optional[float]:
         """Get audio duration in seconds using ffprobe.
 
-        Delegates to utils.audio.get_audio_duration for consistent implementation.
+        Cached in utils.audio.AudioMetadata, shared with later pipeline stages.
         """
-        duration = _get_audio_duration(audio_path)
+        duration = AudioMetadata.get_duration(audio_path)
         if duration is not None:
             logger.info(f"Audio duration: {duration:.1f}s ({duration/60:.1f} min)")
         return duration
@@ -513,7 +550,7 @@ class Transcriber:
             headers = {
                 'User-Agent': BROWSER_USER_AGENT,
             }
-            response = requests.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+            response = self.session.head(url, headers=headers, timeout=timeout, allow_redirects=True)
 
             if response.status_code == 200:
                 return True, None
@@ -549,23 +586,23 @@ class Transcriber:
                 'Accept': '*/*',
                 'Accept-Language': 'en-US,en;q=0.9',
             }
-            response = requests.get(url, headers=headers, stream=True, timeout=timeout)
-            response.raise_for_status()
-
-            # Check file size
-            content_length = response.headers.get('Content-Length')
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
-                if size_mb > 500:
-                    logger.error(f"Audio file too large: {size_mb:.1f}MB (max 500MB)")
-                    return None
-                logger.info(f"Audio file size: {size_mb:.1f}MB")
+            with self.session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+
+                # Check file size
+                content_length = response.headers.get('Content-Length')
+                if content_length:
+                    size_mb = int(content_length) / (1024 * 1024)
+                    if size_mb > 500:
+                        logger.error(f"Audio file too large: {size_mb:.1f}MB (max 500MB)")
+                        return None
+                    logger.info(f"Audio file size: {size_mb:.1f}MB")
 
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp:
-                for chunk in response.iter_content(chunk_size=8192):
-                    tmp.write(chunk)
-                temp_path = tmp.name
+                # Save to temp file
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        tmp.write(chunk)
+                    temp_path = tmp.name
 
             logger.info(f"Downloaded audio to: {temp_path}")
             return temp_path
@@ -636,7 +673,7 @@ class Transcriber:
             # Download with resume support
             mode = 'ab' if downloaded > 0 else 'wb'
             with open(temp_path, mode) as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
 
             logger.info(f"Downloaded audio to: {temp_path}")
@@ -657,10 +694,7 @@ class Transcriber:
             logger.error("❌ OPENAI_API_KEY fehlt! Bitte im Portainer Stack als Environment Variable hinzufügen.")
             return None
 
-        if OPENAI_BASE_URL:
-            client = OpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
-        else:
-            client = OpenAI(api_key=OPENAI_API_KEY)
+        client = _get_openai_client()
 
         try:
             logger.info(f"Starting OpenAI transcription: {os.path.basename(audio_path)}")
@@ -693,6 +727,25 @@ class Transcriber:
                 logger.error(f"OpenAI Whisper error: {e}")
             return None
 
+    def _transcribe_openai_chunk(self, audio_path: str, start_time: float, end_time: float,
+                                 podcast_name: str = None) -> Optional[List[Dict]]:
+        """Extract one chunk as FLAC and transcribe it via the OpenAI API.
+
+        Returns segments with chunk-relative timestamps, or None on failure.
+        """
+        chunk_path = extract_audio_chunk(audio_path, start_time, end_time, output_format='flac')
+        if not chunk_path:
+            logger.error(f"Failed to create chunk {start_time:.0f}s-{end_time:.0f}s")
+            return None
+
+        try:
+            return self.transcribe(chunk_path, podcast_name)
+        finally:
+            try:
+                os.unlink(chunk_path)
+            except Exception:
+                pass
+
     def transcribe_chunked(self, audio_path: str, podcast_name: str = None) -> List[Dict]:
         """Transcribe audio files with dynamic chunking to prevent OOM errors.
 
@@ -710,7 +763,8 @@ class Transcriber:
             List of transcript segments with timestamps, or None on failure
         """
         # OpenAI mode: chunk audio defensively to stay below request size limits.
-        # 10-minute WAV chunks at 16kHz mono are typically below 25MB.
+        # 10-minute chunks at 16kHz mono are ~19MB as WAV; FLAC is lossless and
+        # typically about half that, so each request uploads far fewer bytes.
         if WHISPER_PROVIDER == "openai":
             duration = self.get_audio_duration(audio_path)
             if duration is None:
@@ -719,51 +773,55 @@ class Transcriber:
 
             chunk_duration = 10 * 60
             overlap = CHUNK_OVERLAP_SECONDS
-            all_segments = []
+
+            # Plan every chunk range up front so chunks can be transcribed concurrently
+            chunk_ranges = []
             chunk_start = 0.0
-            chunk_num = 0
+            while chunk_start < duration:
+                chunk_end = min(chunk_start + chunk_duration, duration)
+                chunk_ranges.append((chunk_start, chunk_end))
+                if chunk_end >= duration:
+                    break
+                chunk_start = chunk_end - overlap
 
+            workers = max(1, min(TRANSCRIPTION_MAX_CONCURRENCY, len(chunk_ranges)))
             logger.info(
                 f"Starting OpenAI chunked transcription: {duration/60:.1f} min "
-                f"(chunk_size={chunk_duration/60:.0f}min, overlap={overlap}s)"
+                f"(chunk_size={chunk_duration/60:.0f}min, overlap={overlap}s, "
+                f"{len(chunk_ranges)} chunks, {workers} concurrent)"
             )
 
-            while chunk_start < duration:
-                chunk_end = min(chunk_start + chunk_duration, duration)
-                chunk_num += 1
-                chunk_path = extract_audio_chunk(audio_path, chunk_start, chunk_end)
-                if not chunk_path:
-                    logger.error(f"Failed to create chunk {chunk_num}")
-                    return None
-
-                try:
-                    chunk_segments = self.transcribe(chunk_path, podcast_name)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._transcribe_openai_chunk, audio_path, start, end, podcast_name)
+                    for start, end in chunk_ranges
+                ]
+                chunk_results = []
+                for chunk_num, future in enumerate(futures, 1):
+                    chunk_segments = future.result()
                     if chunk_segments is None:
                         logger.error(f"OpenAI transcription failed for chunk {chunk_num}")
+                        for pending in futures:
+                            pending.cancel()
                         return None
+                    chunk_results.append(chunk_segments)
 
-                    for segment in chunk_segments:
-                        adjusted_start = segment['start'] + chunk_start
-                        adjusted_end = segment['end'] + chunk_start
-
-                        # Skip overlap duplicates from previous chunk
-                        if all_segments and adjusted_start <= all_segments[-1]['start']:
-                            continue
-
-                        all_segments.append({
-                            'start': adjusted_start,
-                            'end': adjusted_end,
-                            'text': segment['text']
-                        })
-                finally:
-                    try:
-                        os.unlink(chunk_path)
-                    except Exception:
-                        pass
-
-                if chunk_end >= duration:
-                    break
-                chunk_start = chunk_end - overlap
+            # Stitch in order, offsetting timestamps to the full audio
+            all_segments = []
+            for (chunk_start, _), chunk_segments in zip(chunk_ranges, chunk_results):
+                for segment in chunk_segments:
+                    adjusted_start = segment['start'] + chunk_start
+                    adjusted_end = segment['end'] + chunk_start
+
+                    # Skip overlap duplicates from previous chunk
+                    if all_segments and adjusted_start <= all_segments[-1]['start']:
+                        continue
+
+                    all_segments.append({
+                        'start': adjusted_start,
+                        'end': adjusted_end,
+                        'text': segment['text']
+                    })
 
             logger.info(f"OpenAI chunked transcription complete: {len(all_segments)} segments")
             return all_segments
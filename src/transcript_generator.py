@@ -96,20 +96,18 @@ class TranscriptGenerator:
 
         return "\n".join(lines)
 
-    def generate_text(
+    def adjust_segments(
         self,
         segments: List[Dict],
         ads_removed: List[Dict]
-    ) -> str:
-        """Generate plain text transcript with adjusted timestamps.
+    ) -> List[Dict]:
+        """Drop segments inside removed ads and shift the rest onto the cut timeline.
 
-        Output format: [HH:MM:SS.sss --> HH:MM:SS.sss] text
+        Returns new segment dicts (start, end, text); empty and zero-length
+        segments are skipped.
         """
-        if not segments:
-            return ""
-
-        lines = []
-        for segment in segments:
+        adjusted = []
+        for segment in segments or []:
             if self.is_segment_in_ad(segment, ads_removed):
                 continue
 
@@ -117,19 +115,36 @@ class TranscriptGenerator:
             if not text:
                 continue
 
-            original_start = segment.get('start', 0)
-            original_end = segment.get('end', 0)
-
-            adjusted_start = adjust_timestamp(original_start, ads_removed)
-            adjusted_end = adjust_timestamp(original_end, ads_removed)
+            adjusted_start = adjust_timestamp(segment.get('start', 0), ads_removed)
+            adjusted_end = adjust_timestamp(segment.get('end', 0), ads_removed)
 
             if adjusted_end <= adjusted_start:
                 continue
 
-            start_ts = format_vtt_timestamp(adjusted_start)
-            end_ts = format_vtt_timestamp(adjusted_end)
+            adjusted.append({'start': adjusted_start, 'end': adjusted_end, 'text': text})
+
+        return adjusted
+
+    def generate_text(
+        self,
+        segments: List[Dict],
+        ads_removed: List[Dict]
+    ) -> str:
+        """Generate plain text transcript with adjusted timestamps.
+
+        Output format: [HH:MM:SS.sss --> HH:MM:SS.sss] text
+        """
+        return self.segments_to_text(self.adjust_segments(segments, ads_removed))
+
+    def segments_to_text(self, segments: List[Dict]) -> str:
+        """Format already-adjusted segments in the stored transcript format."""
+        if not segments:
+            return ""
 
-            lines.append(f"[{start_ts} --> {end_ts}] {text}")
+        lines = [
+            f"[{format_vtt_timestamp(s['start'])} --> {format_vtt_timestamp(s['end'])}] {s['text']}"
+            for s in segments
+        ]
 
         logger.info(f"Generated text transcript with {len(lines)} segments")
         return "\n".join(lines)
@@ -4,6 +4,7 @@ This module provides common utilities used across the codebase:
 - audio: Audio file operations (duration, metadata)
 - time: Timestamp parsing, formatting, and adjustment
 - text: Transcript text extraction
+- json: JSON encode/decode (orjson when installed)
 - gpu: GPU memory management
 - constants: Shared field names and classification values
 """
@@ -14,6 +15,7 @@ from utils.time import (
     adjust_timestamp, first_not_none,
 )
 from utils.text import extract_text_in_range, extract_text_from_segments
+from utils.json import json_dumps, json_loads
 from utils.gpu import clear_gpu_memory
 from utils.constants import (
     INVALID_SPONSOR_VALUES, STRUCTURAL_FIELDS,
@@ -33,6 +35,8 @@ __all__ = [
     'first_not_none',
     'extract_text_in_range',
     'extract_text_from_segments',
+    'json_dumps',
+    'json_loads',
     'clear_gpu_memory',
     'INVALID_SPONSOR_VALUES',
     'STRUCTURAL_FIELDS',
@@ -6,6 +6,7 @@ Provides shared audio file operations used across multiple modules.
 import logging
 import os
 import subprocess
+import threading
 from typing import Dict, Optional, Tuple
 
 from config import FFPROBE_TIMEOUT
@@ -50,11 +51,18 @@ def get_audio_duration(audio_path: str) -> Optional[float]:
 class AudioMetadata:
     """Cached audio file metadata to avoid redundant ffprobe calls.
 
+    Entries are keyed by path and validated against the file's mtime and
+    size, so a rewritten file is probed again. The cache is bounded because
+    most paths are per-episode temp files.
+
     Usage:
         duration = AudioMetadata.get_duration('/path/to/audio.mp3')
     """
 
-    _cache: Dict[str, Tuple[float, float]] = {}  # path -> (duration, mtime)
+    MAX_ENTRIES = 256
+
+    _cache: Dict[str, Tuple[float, Tuple[int, int]]] = {}  # path -> (duration, (mtime_ns, size))
+    _lock = threading.Lock()
 
     @classmethod
     def get_duration(cls, path: str) -> Optional[float]:
@@ -67,30 +75,37 @@ class AudioMetadata:
             Duration in seconds, or None if unable to determine
         """
         try:
-            mtime = os.path.getmtime(path)
+            st = os.stat(path)
         except OSError:
             # File doesn't exist or can't access - fall through to direct query
             return get_audio_duration(path)
+        version = (st.st_mtime_ns, st.st_size)
 
         # Check cache
-        if path in cls._cache:
-            cached_duration, cached_mtime = cls._cache[path]
-            if cached_mtime == mtime:
-                return cached_duration
+        with cls._lock:
+            cached = cls._cache.get(path)
+        if cached is not None and cached[1] == version:
+            return cached[0]
 
         # Query and cache
         duration = get_audio_duration(path)
         if duration is not None:
-            cls._cache[path] = (duration, mtime)
+            with cls._lock:
+                cls._cache.pop(path, None)
+                if len(cls._cache) >= cls.MAX_ENTRIES:
+                    cls._cache.pop(next(iter(cls._cache)))
+                cls._cache[path] = (duration, version)
 
         return duration
 
     @classmethod
     def clear_cache(cls) -> None:
         """Clear the duration cache."""
-        cls._cache.clear()
+        with cls._lock:
+            cls._cache.clear()
 
     @classmethod
     def invalidate(cls, path: str) -> None:
         """Remove a specific path from the cache."""
-        cls._cache.pop(path, None)
+        with cls._lock:
+            cls._cache.pop(path, None)
@@ -0,0 +1,41 @@
+"""JSON utility functions.
+
+Provides JSON encode/decode backed by orjson when it is installed, falling
+back to the standard library otherwise.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize to a JSON string, using orjson when it is installed.
+
+    orjson output is compact UTF-8 and writes NaN/Infinity as null. Values
+    orjson rejects (e.g. non-string keys) fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(data)
+
+
+def json_loads(data: Any) -> Any:
+    """Parse a JSON string or bytes, using orjson when it is installed.
+
+    Input orjson rejects, such as the NaN literals older json.dumps output
+    may contain, is retried with the stdlib decoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
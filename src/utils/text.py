@@ -4,10 +4,17 @@ Provides shared transcript text extraction functions.
 """
 
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from utils.time import parse_timestamp
 
+# Stored transcript line as written by Transcriber.segments_to_text:
+# [HH:MM:SS.mmm --> HH:MM:SS.mmm] text
+_TRANSCRIPT_LINE_RE = re.compile(
+    r'^\[(\d+):(\d\d):(\d\d(?:\.\d+)?) --> (\d+):(\d\d):(\d\d(?:\.\d+)?)\] (.*)$',
+    re.MULTILINE
+)
+
 
 def extract_text_in_range(
     transcript: str,
@@ -96,3 +103,47 @@ def extract_text_from_segments(
     if max_words:
         return ' '.join(words[:max_words])
     return ' '.join(words)
+
+
+def parse_transcript_segments(transcript: str) -> List[Dict]:
+    """Parse a stored "[start --> end] text" transcript back into segments.
+
+    Transcripts written by this app are parsed with one compiled-regex pass.
+    If any line starting with '[' is not in that exact form (older or edited
+    transcripts), the whole text goes through the lenient per-line parser,
+    which accepts every timestamp format parse_timestamp does and skips
+    lines it can't parse.
+
+    Returns:
+        List of segment dicts with start/end/text keys
+    """
+    if not transcript:
+        return []
+
+    segments = [
+        {
+            'start': int(m[1]) * 3600 + int(m[2]) * 60 + float(m[3]),
+            'end': int(m[4]) * 3600 + int(m[5]) * 60 + float(m[6]),
+            'text': m[7],
+        }
+        for m in _TRANSCRIPT_LINE_RE.finditer(transcript)
+    ]
+    bracket_lines = transcript.count('\n[') + transcript.startswith('[')
+    if len(segments) == bracket_lines:
+        return segments
+
+    segments = []
+    for line in transcript.split('\n'):
+        if line.strip() and line.startswith('['):
+            try:
+                time_part, text_part = line.split('] ', 1)
+                time_range = time_part.strip('[')
+                start_str, end_str = time_range.split(' --> ')
+                segments.append({
+                    'start': parse_timestamp(start_str),
+                    'end': parse_timestamp(end_str),
+                    'text': text_part
+                })
+            except (ValueError, TypeError):
+                continue
+    return segments
@@ -2,6 +2,7 @@
 import pytest
 import sys
 import os
+import time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
@@ -12,6 +13,15 @@ from ad_detector import (
     _extract_ad_keywords,
     validate_ad_timestamps,
     get_uncovered_portions,
+    iter_json_arrays,
+    create_windows,
+    format_transcript_lines,
+    AdDetector,
+)
+import ad_detector
+from llm_client import (
+    LLMResponse, _record_token_usage,
+    start_episode_token_tracking, get_episode_token_totals,
 )
 
 
@@ -396,3 +406,329 @@ class TestGetUncoveredPortions:
         assert len(result) == 1
         assert result[0]['start'] == 100
         assert result[0]['end'] == 200
+
+
+class TestIterJsonArrays:
+    """Tests for iter_json_arrays function."""
+
+    def test_finds_array_wrapped_in_prose(self):
+        """Array surrounded by explanation text is decoded."""
+        text = 'Found these ads: [{"start": 1.0, "end": 30.0}] -- done.'
+        assert list(iter_json_arrays(text)) == [[{"start": 1.0, "end": 30.0}]]
+
+    def test_skips_non_json_brackets(self):
+        """Timestamp-style brackets are skipped, later arrays still found."""
+        text = 'At [00:01:23] the host says [] then [{"start": 5}]'
+        assert list(iter_json_arrays(text)) == [[], [{"start": 5}]]
+
+    def test_deeply_nested_array_decoded_whole(self):
+        """Nesting depth does not limit what is decoded."""
+        text = '[{"start": 1, "x": [1, [2, [3, [4]]]]}]'
+        assert list(iter_json_arrays(text)) == [[{"start": 1, "x": [1, [2, [3, [4]]]]}]]
+
+    def test_no_arrays(self):
+        """Text without arrays yields nothing."""
+        assert list(iter_json_arrays('no ads here')) == []
+
+
+class TestFormatTranscriptLines:
+    """Tests for format_transcript_lines with create_windows indices."""
+
+    def test_window_indices_select_formatted_lines(self):
+        """Joining lines by segment_indices matches formatting window segments."""
+        segments = [
+            {'start': float(t), 'end': float(t + 60), 'text': f'seg {t}'}
+            for t in range(0, 1800, 60)
+        ]
+        lines = format_transcript_lines(segments)
+        assert lines[1] == '[60.0s - 120.0s] seg 60'
+
+        for window in create_windows(segments):
+            expected = [f"[{s['start']:.1f}s - {s['end']:.1f}s] {s['text']}"
+                        for s in window['segments']]
+            assert [lines[k] for k in window['segment_indices']] == expected
+
+
+class TestPrefilterWindows:
+    """Tests for AdDetector._prefilter_windows."""
+
+    class _NoSponsors:
+        def get_sponsor_names(self):
+            return []
+
+    def _detector(self):
+        detector = AdDetector(api_key='test')
+        detector._sponsor_service = self._NoSponsors()
+        return detector
+
+    def _windows(self, texts):
+        return [{'segments': [{'text': t}]} for t in texts]
+
+    def test_skips_windows_without_cues(self):
+        """Middle windows without cues are skipped; edges and cues are kept."""
+        texts = ['intro', 'chat', 'chat', 'chat', 'use code PODCAST', 'chat', 'chat', 'chat', 'chat', 'outro']
+        skipped = self._detector()._prefilter_windows(self._windows(texts), set())
+        assert skipped == {1, 2, 3, 5, 6, 7, 8}
+
+    def test_audio_signals_keep_window(self):
+        """Windows with audio signals are never skipped."""
+        texts = ['intro'] + ['chat'] * 8 + ['outro']
+        skipped = self._detector()._prefilter_windows(self._windows(texts), {4})
+        assert 4 not in skipped
+
+    def test_mostly_candidates_sends_everything(self):
+        """When most windows have cues, nothing is skipped."""
+        texts = ['intro', 'sponsored by acme', 'chat', 'visit acme.com', 'outro']
+        assert self._detector()._prefilter_windows(self._windows(texts), set()) == set()
+
+
+class TestDetectAdsShortTranscript:
+    """Tests for the short-transcript early return in detect_ads."""
+
+    def test_short_transcript_skips_llm(self):
+        """Transcripts under the minimum span return no ads without a client."""
+        detector = AdDetector(api_key='test')
+        segments = [{'start': 0.0, 'end': 20.0, 'text': 'Welcome to the show'},
+                    {'start': 20.0, 'end': 45.0, 'text': 'See you next time'}]
+
+        result = detector.detect_ads(segments)
+
+        assert result['status'] == 'success'
+        assert result['ads'] == []
+        assert detector._llm_client is None
+
+    def test_empty_transcript_skips_llm(self):
+        """No segments at all is treated as too short."""
+        result = AdDetector(api_key='test').detect_ads([])
+        assert result['status'] == 'success'
+        assert result['ads'] == []
+
+
+class TestExtractJsonAdsArray:
+    """Tests for AdDetector._extract_json_ads_array fallbacks."""
+
+    def test_direct_json_object(self):
+        """A bare JSON object with an ads key parses directly."""
+        ads, method = AdDetector(api_key='test')._extract_json_ads_array('{"ads": [{"start": 1, "end": 2}]}')
+        assert ads == [{"start": 1, "end": 2}]
+        assert method == "json_object_ads_key"
+
+    def test_bracket_fallback(self):
+        """Arrays the scan rejects still come back via first '[' to last ']'."""
+        ads, method = AdDetector(api_key='test')._extract_json_ads_array('Result: [{"begin": 1}] done')
+        assert ads == [{"begin": 1}]
+        assert method == "bracket_fallback"
+
+    def test_no_json(self):
+        """Text without any array returns (None, None)."""
+        assert AdDetector(api_key='test')._extract_json_ads_array('no ads found') == (None, None)
+
+
+
+class _FakeLLMClient:
+    """Records LLM calls; batch results come from a preset dict."""
+
+    def __init__(self, batch_results=None, batch_error=None):
+        self.batch_results = batch_results
+        self.batch_error = batch_error
+        self.batch_requests = None
+        self.calls = []
+
+    def supports_batches(self):
+        return True
+
+    def messages_batch_create(self, requests, max_wait=None):
+        self.batch_requests = requests
+        if self.batch_error:
+            raise self.batch_error
+        if self.batch_results is None:
+            return {r['custom_id']: LLMResponse(content='{"ads": []}', model=r['model'])
+                    for r in requests}
+        return {r['custom_id']: self.batch_results.get(r['custom_id']) for r in requests}
+
+    def messages_create(self, model, messages, **kwargs):
+        self.calls.append(messages[-1]['content'])
+        return LLMResponse(content='{"ads": []}', model=model)
+
+
+class TestDetectWindowsBatch:
+    """Tests for AdDetector._detect_windows_batch."""
+
+    def _detector(self, client):
+        detector = AdDetector(api_key='test')
+        detector._llm_client = client
+        return detector
+
+    def test_submits_only_requested_windows(self):
+        client = _FakeLLMClient()
+        results = self._detector(client)._detect_windows_batch(
+            ['p0', 'p1', 'p2'], 'model', 'sys', indices=[0, 2], cache_prefix='pre'
+        )
+
+        assert [r['custom_id'] for r in client.batch_requests] == ['window-0', 'window-2']
+        assert all(r['cache_prefix'] == 'pre' for r in client.batch_requests)
+        assert sorted(results) == [0, 2]
+
+    def test_partial_failure_returns_successes_only(self):
+        ok = LLMResponse(content='{"ads": []}', model='model')
+        client = _FakeLLMClient(batch_results={'window-1': ok})
+
+        results = self._detector(client)._detect_windows_batch(['p0', 'p1', 'p2'], 'model', 'sys')
+
+        assert results == {1: ok}
+
+    def test_timeout_returns_nothing(self):
+        """A cancelled batch reports every request as None."""
+        client = _FakeLLMClient(batch_results={})
+        assert self._detector(client)._detect_windows_batch(['p0', 'p1'], 'model', 'sys') == {}
+
+    def test_error_returns_nothing(self):
+        client = _FakeLLMClient(batch_error=RuntimeError("batch API down"))
+        assert self._detector(client)._detect_windows_batch(['p0', 'p1'], 'model', 'sys') == {}
+
+
+class TestDetectAdsBatchFallback:
+    """Windows missing from the batch result are fetched synchronously."""
+
+    def _segments(self, minutes=25):
+        return [{'start': float(t), 'end': float(t + 30), 'text': f'Talking at {t} seconds'}
+                for t in range(0, minutes * 60, 30)]
+
+    def test_missing_windows_use_sync_calls(self, temp_db, monkeypatch):
+        monkeypatch.setattr(ad_detector, 'LLM_BATCH_DETECTION', True)
+        monkeypatch.setattr(ad_detector, 'AD_DETECTION_CACHE_DAYS', 0)
+        segments = self._segments()
+        window_count = len(create_windows(segments))
+        assert window_count > 2
+
+        ok = LLMResponse(content='{"ads": []}', model='model')
+        client = _FakeLLMClient(batch_results={'window-0': ok})
+        detector = AdDetector(api_key='test')
+        detector._db = temp_db
+        detector._llm_client = client
+
+        result = detector.detect_ads(segments, slug='show', episode_id='ep-1')
+
+        assert result['status'] == 'success'
+        assert len(client.batch_requests) == window_count
+        assert len(client.calls) == window_count - 1
+        assert all(f"WINDOW 1/{window_count}:" not in prompt for prompt in client.calls)
+
+
+class TestCallWindowsConcurrently:
+    """Tests for AdDetector._call_windows_concurrently."""
+
+    class _Client:
+        """Answers 'p<i>' prompts; later windows answer first."""
+
+        def __init__(self, fail_on=None, usage=None):
+            self.fail_on = fail_on
+            self.usage = usage
+            self.calls = []
+
+        def messages_create(self, model, messages, **kwargs):
+            prompt = messages[-1]['content']
+            self.calls.append(prompt)
+            if prompt == self.fail_on:
+                raise ValueError(f"bad request for {prompt}")
+            time.sleep(0.05 - int(prompt[1:]) * 0.01)
+            if self.usage:
+                _record_token_usage(model, self.usage)
+            return LLMResponse(content=f"answer-{prompt}", model=model)
+
+    def _detector(self, client):
+        detector = AdDetector(api_key='test')
+        detector._llm_client = client
+        return detector
+
+    def test_responses_keyed_by_window(self, monkeypatch):
+        monkeypatch.setattr(ad_detector, 'LLM_MAX_CONCURRENCY', 4)
+        prompts = [f'p{i}' for i in range(4)]
+
+        responses, failure = self._detector(self._Client())._call_windows_concurrently(
+            [0, 1, 2, 3], prompts, 'model', 'sys'
+        )
+
+        assert failure is None
+        assert {i: r.content for i, r in responses.items()} == {
+            i: f'answer-p{i}' for i in range(4)
+        }
+
+    def test_failure_cancels_pending_windows(self, monkeypatch):
+        monkeypatch.setattr(ad_detector, 'LLM_MAX_CONCURRENCY', 1)
+        client = self._Client(fail_on='p0')
+        prompts = [f'p{i}' for i in range(5)]
+
+        responses, failure = self._detector(client)._call_windows_concurrently(
+            list(range(5)), prompts, 'model', 'sys'
+        )
+
+        assert failure[0] == 0
+        assert isinstance(failure[1], ValueError)
+        # At most the window already picked up by the worker still runs
+        assert len(client.calls) <= 2
+        assert 0 not in responses
+
+    def test_tokens_credited_to_calling_thread(self, temp_db, monkeypatch):
+        monkeypatch.setattr(ad_detector, 'LLM_MAX_CONCURRENCY', 3)
+        client = self._Client(usage={'input_tokens': 100, 'output_tokens': 20})
+        prompts = [f'p{i}' for i in range(3)]
+
+        start_episode_token_tracking()
+        self._detector(client)._call_windows_concurrently([0, 1, 2], prompts, 'model', 'sys')
+        totals = get_episode_token_totals()
+
+        assert totals['input_tokens'] == 300
+        assert totals['output_tokens'] == 60
+
+
+class TestDetectionCacheWrites:
+    """Only responses that held an ads array are cached."""
+
+    class _Client:
+        def __init__(self):
+            self.prompts = []
+
+        def messages_create(self, model, messages, **kwargs):
+            prompt = messages[-1]['content']
+            self.prompts.append(prompt)
+            if "WINDOW 1/" in prompt:
+                return LLMResponse(content="I'm sorry, I can't help with", model=model)
+            return LLMResponse(content='[]', model=model)
+
+    def _run(self, temp_db, monkeypatch):
+        monkeypatch.setattr(ad_detector, 'LLM_BATCH_DETECTION', False)
+        monkeypatch.setattr(ad_detector, 'AD_DETECTION_CACHE_DAYS', 7)
+        segments = [{'start': float(t), 'end': float(t + 30), 'text': f'Talking at {t} seconds'}
+                    for t in range(0, 25 * 60, 30)]
+        client = self._Client()
+        detector = AdDetector(api_key='test')
+        detector._db = temp_db
+        detector._llm_client = client
+        detector.detect_ads(segments, slug='show', episode_id='ep-1')
+        return detector, client
+
+    def _cached(self, temp_db):
+        rows = temp_db.get_connection().execute(
+            "SELECT response_text FROM ad_detection_cache"
+        ).fetchall()
+        return [r['response_text'] for r in rows]
+
+    def test_unparseable_response_not_cached(self, temp_db, monkeypatch):
+        _, client = self._run(temp_db, monkeypatch)
+
+        cached = self._cached(temp_db)
+        assert len(client.prompts) > 1
+        assert cached == ['[]'] * (len(client.prompts) - 1)
+
+    def test_unparseable_cached_response_is_evicted(self, temp_db, monkeypatch):
+        detector, client = self._run(temp_db, monkeypatch)
+        first = next(p for p in client.prompts if "WINDOW 1/" in p)
+        key = detector._detection_cache_key(
+            detector.get_model(), detector.get_system_prompt(), first
+        )
+        temp_db.save_detection_cache(key, 'model', 'not json')
+
+        self._run(temp_db, monkeypatch)
+
+        assert temp_db.get_detection_cache(key) is None
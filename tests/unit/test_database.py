@@ -94,6 +94,47 @@ class TestPodcastOperations:
         assert 'podcast-a' in slugs
         assert 'podcast-b' in slugs
 
+    def test_get_feed_list(self, temp_db):
+        """Feed list is projected in SQL with API field names and counts."""
+        temp_db.create_podcast('feed-a', 'https://a.com/feed.xml', 'Feed A')
+        temp_db.create_podcast('feed-b', 'https://b.com/feed.xml')
+        temp_db.update_podcast('feed-b', artwork_cached=1)
+        temp_db.upsert_episode('feed-a', 'ep-1', original_url='https://a.com/1.mp3', status='processed')
+        temp_db.upsert_episode('feed-a', 'ep-2', original_url='https://a.com/2.mp3')
+
+        feeds = {f['slug']: f for f in temp_db.get_feed_list('http://host:8000')}
+
+        assert feeds['feed-a']['title'] == 'Feed A'
+        assert feeds['feed-a']['feedUrl'] == 'http://host:8000/feed-a'
+        assert feeds['feed-a']['sourceUrl'] == 'https://a.com/feed.xml'
+        assert feeds['feed-a']['episodeCount'] == 2
+        assert feeds['feed-a']['processedCount'] == 1
+        assert feeds['feed-b']['title'] == 'feed-b'
+        assert feeds['feed-b']['artworkUrl'] == '/api/v1/feeds/feed-b/artwork'
+        assert feeds['feed-b']['episodeCount'] == 0
+        assert feeds['feed-b']['processedCount'] == 0
+
+    def test_feed_exists(self, temp_db):
+        """feed_exists matches the feeds listed by get_feeds_config."""
+        temp_db.create_podcast('real-feed', 'https://example.com/feed.xml', 'Real')
+        temp_db.create_podcast('no-source', '', 'No Source')
+
+        assert temp_db.feed_exists('real-feed')
+        assert not temp_db.feed_exists('no-source')
+        assert not temp_db.feed_exists('made-up-slug')
+
+    def test_get_podcast_last_checked_epoch(self, temp_db):
+        """last_checked_at is returned as epoch seconds."""
+        temp_db.create_podcast('checked', 'https://example.com/feed.xml', 'Checked')
+        assert temp_db.get_podcast_last_checked('checked') is None
+        assert temp_db.get_podcast_last_checked('missing') is None
+
+        temp_db.update_podcast('checked', last_checked_at='2024-01-01T00:00:00Z')
+        assert temp_db.get_podcast_last_checked('checked') == 1704067200.0
+
+        temp_db.update_podcast('checked', last_checked_at='not a date')
+        assert temp_db.get_podcast_last_checked('checked') == 0.0
+
 
 class TestEpisodeOperations:
     """Tests for episode CRUD operations."""
@@ -171,6 +212,36 @@ class TestEpisodeOperations:
         assert 'failed-ep' not in pending_ids
         assert 'failed-ep' not in processed_ids
 
+    def test_get_episode_detail(self, temp_db):
+        """Single detail columns are read without the full episode row."""
+        temp_db.create_podcast('detail-test', 'https://example.com/feed.xml', 'Test')
+        temp_db.upsert_episode('detail-test', 'ep-1', original_url='https://example.com/1.mp3')
+        assert temp_db.get_episode_detail('detail-test', 'ep-1', 'transcript_text') is None
+
+        temp_db.save_episode_details('detail-test', 'ep-1', transcript_text='[00:00:00.000 --> 00:00:01.000] hi')
+        assert temp_db.get_episode_detail('detail-test', 'ep-1', 'transcript_text') == \
+            '[00:00:00.000 --> 00:00:01.000] hi'
+        assert temp_db.get_episode_detail('detail-test', 'missing', 'transcript_text') is None
+
+        with pytest.raises(ValueError):
+            temp_db.get_episode_detail('detail-test', 'ep-1', 'first_pass_prompt')
+
+    def test_transcript_segments_cleared_with_new_transcript(self, temp_db):
+        """Stored segments never outlive the transcript text they came from."""
+        temp_db.create_podcast('seg-test', 'https://example.com/feed.xml', 'Test')
+        temp_db.upsert_episode('seg-test', 'ep-1', original_url='https://example.com/1.mp3')
+
+        temp_db.save_episode_details('seg-test', 'ep-1', transcript_text='raw',
+                                     transcript_segments_json='{"start": [0.0]}')
+        assert temp_db.get_episode_detail('seg-test', 'ep-1', 'transcript_segments_json') == \
+            '{"start": [0.0]}'
+
+        temp_db.save_episode_details('seg-test', 'ep-1', chapters_json='{}')
+        assert temp_db.get_episode_detail('seg-test', 'ep-1', 'transcript_segments_json') is not None
+
+        temp_db.save_episode_details('seg-test', 'ep-1', transcript_text='processed')
+        assert temp_db.get_episode_detail('seg-test', 'ep-1', 'transcript_segments_json') is None
+
 
 class TestAdPatternOperations:
     """Tests for ad pattern operations."""
@@ -594,6 +665,16 @@ class TestTokenUsage:
         cost = temp_db._calculate_token_cost(conn, 'claude-haiku-4-5-20251001-extra', 1_000_000, 0)
         assert abs(cost - 1.0) < 0.001
 
+    def test_calculate_token_cost_prompt_cache(self, temp_db):
+        """Cached prompt tokens are billed at the cache write/read multipliers."""
+        conn = temp_db.get_connection()
+        # Haiku: $1.0/Mtok in. 1M total input = 0.5M cache write + 0.5M cache read
+        cost = temp_db._calculate_token_cost(
+            conn, 'claude-haiku-4-5-20251001', 1_000_000, 0,
+            cache_creation_tokens=500_000, cache_read_tokens=500_000
+        )
+        assert abs(cost - (0.5 * 1.25 + 0.5 * 0.1)) < 0.001
+
     def test_calculate_token_cost_unknown_model(self, temp_db):
         """Unknown model returns 0 cost without crashing."""
         conn = temp_db.get_connection()
@@ -625,3 +706,18 @@ class TestTokenUsage:
         assert model['callCount'] == 1
         assert model['inputCostPerMtok'] == 1.0
         assert model['outputCostPerMtok'] == 5.0
+
+
+class TestDetectionCache:
+    """Tests for the ad detection response cache."""
+
+    def test_roundtrip_and_prune(self, temp_db):
+        """Cached responses are returned by key and cleared by prune."""
+        temp_db.save_detection_cache('abc', 'claude-haiku-4-5-20251001', '{"ads": []}')
+        assert temp_db.get_detection_cache('abc') == '{"ads": []}'
+        assert temp_db.get_detection_cache('missing') is None
+
+        # Fresh entries survive an age-based prune; a full prune clears them
+        assert temp_db.prune_detection_cache(7) == 0
+        assert temp_db.prune_detection_cache() == 1
+        assert temp_db.get_detection_cache('abc') is None
@@ -0,0 +1,97 @@
+"""Unit tests for llm_client request building and batch defaults."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from llm_client import AnthropicClient, LLMClient, LLMResponse
+
+
+class _EchoClient(LLMClient):
+    """Backend without a batch API; fails requests whose content is 'boom'."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def messages_create(self, model, max_tokens, system, messages, temperature=0.0,
+                        timeout=120.0, response_format=None, cache_system=False,
+                        cache_prefix=None):
+        content = messages[-1]['content']
+        self.calls.append(content)
+        if content == 'boom':
+            raise RuntimeError("backend error")
+        return LLMResponse(content=f"echo:{content}", model=model)
+
+    def list_models(self):
+        return []
+
+    def get_provider_name(self):
+        return "Echo"
+
+
+class TestDefaultBatch:
+    """Tests for the serial messages_batch_create fallback."""
+
+    def _request(self, custom_id, content):
+        return {
+            'custom_id': custom_id,
+            'model': 'test-model',
+            'max_tokens': 10,
+            'system': 'sys',
+            'messages': [{'role': 'user', 'content': content}],
+        }
+
+    def test_runs_requests_serially(self):
+        client = _EchoClient()
+        results = client.messages_batch_create([
+            self._request('a', 'first'),
+            self._request('b', 'second'),
+        ])
+
+        assert not client.supports_batches()
+        assert client.calls == ['first', 'second']
+        assert results['a'].content == 'echo:first'
+        assert results['b'].content == 'echo:second'
+
+    def test_failed_request_is_none(self):
+        client = _EchoClient()
+        results = client.messages_batch_create([
+            self._request('a', 'boom'),
+            self._request('b', 'ok'),
+        ])
+
+        assert results['a'] is None
+        assert results['b'].content == 'echo:ok'
+
+
+class TestAnthropicCachePrefix:
+    """Tests for the cache_prefix breakpoint in AnthropicClient._build_params."""
+
+    PREFIX = "Podcast: Show\nEpisode: One\n\nTranscript:\n"
+
+    def _params(self, content, cache_prefix):
+        return AnthropicClient(api_key='test')._build_params(
+            'test-model', 100, 'sys',
+            [{'role': 'user', 'content': content}],
+            cache_prefix=cache_prefix,
+        )
+
+    def test_prefix_match_splits_content(self):
+        params = self._params(self.PREFIX + "[0.0s - 5.0s] hello", self.PREFIX)
+
+        blocks = params['messages'][-1]['content']
+        assert [b['text'] for b in blocks] == [self.PREFIX, "[0.0s - 5.0s] hello"]
+        assert blocks[0]['cache_control'] == {'type': 'ephemeral'}
+        assert 'cache_control' not in blocks[1]
+        assert params['messages'][-1]['role'] == 'user'
+
+    def test_prefix_mismatch_leaves_message(self):
+        content = "Something else entirely"
+        params = self._params(content, self.PREFIX)
+        assert params['messages'] == [{'role': 'user', 'content': content}]
+
+    def test_content_equal_to_prefix_leaves_message(self):
+        params = self._params(self.PREFIX, self.PREFIX)
+        assert params['messages'] == [{'role': 'user', 'content': self.PREFIX}]
@@ -0,0 +1,56 @@
+"""Unit tests for rss_parser.py FeedRefreshSchedule."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from rss_parser import FeedRefreshSchedule
+
+
+@pytest.fixture
+def schedule():
+    return FeedRefreshSchedule(min_interval=900, max_interval=3000, backoff=1.5)
+
+
+class TestFeedRefreshSchedule:
+    """Tests for adaptive per-feed refresh intervals."""
+
+    def test_unknown_slug_is_due(self, schedule):
+        assert schedule.is_due('new-feed', now=0)
+        assert schedule.seconds_until_next_due(now=0) is None
+
+    def test_first_refresh_uses_min_interval(self, schedule):
+        schedule.record('feed', changed=False, now=0)
+
+        assert not schedule.is_due('feed', now=899)
+        assert schedule.is_due('feed', now=900)
+
+    def test_unchanged_refreshes_back_off(self, schedule):
+        schedule.record('feed', changed=False, now=0)
+        schedule.record('feed', changed=False, now=900)
+        assert schedule.seconds_until_next_due(now=900) == 1350
+
+        schedule.record('feed', changed=False, now=2250)
+        assert schedule.seconds_until_next_due(now=2250) == pytest.approx(2025)
+
+    def test_backoff_is_capped(self, schedule):
+        now = 0
+        for _ in range(10):
+            schedule.record('feed', changed=False, now=now)
+        assert schedule.seconds_until_next_due(now=now) == 3000
+
+    def test_change_resets_interval(self, schedule):
+        for now in (0, 900, 2250):
+            schedule.record('feed', changed=False, now=now)
+
+        schedule.record('feed', changed=True, now=5000)
+
+        assert schedule.seconds_until_next_due(now=5000) == 900
+
+    def test_next_due_ignores_overdue_feeds(self, schedule):
+        schedule.record('stale', changed=False, now=0)
+        schedule.record('fresh', changed=False, now=1000)
+
+        assert schedule.seconds_until_next_due(now=1200) == 700
+        assert schedule.seconds_until_next_due(now=2000) is None
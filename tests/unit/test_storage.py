@@ -0,0 +1,72 @@
+"""Unit tests for storage.py Storage file and transcript handling."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from database import Database
+from storage import Storage
+
+
+@pytest.fixture
+def storage(temp_dir):
+    """Storage over a fresh temporary database."""
+    Database._instance = None
+    yield Storage(data_dir=temp_dir)
+    Database._instance = None
+
+
+class TestPodcastDir:
+    """Tests for podcast directory creation."""
+
+    def test_recreated_after_delete_through_other_instance(self, storage, temp_dir):
+        other = Storage(data_dir=temp_dir)
+        storage.save_rss('show', '<rss/>')
+
+        assert other.cleanup_podcast_dir('show')
+        storage.save_rss('show', '<rss>again</rss>')
+
+        assert storage.get_rss('show') == '<rss>again</rss>'
+        assert (storage.get_podcast_dir('show') / 'episodes').is_dir()
+
+
+class TestCleanupTmpDir:
+    """Tests for sweeping abandoned scratch audio."""
+
+    def test_removes_only_stale_files(self, storage):
+        stale = storage.tmp_dir / 'tmpstale.mp3'
+        fresh = storage.tmp_dir / 'tmpfresh.mp3'
+        stale.write_bytes(b'x')
+        fresh.write_bytes(b'x')
+        os.utime(stale, (0, 0))
+
+        assert storage.cleanup_tmp_dir(max_age_seconds=3600) == 1
+        assert not stale.exists()
+        assert fresh.exists()
+
+
+class TestTranscriptSegments:
+    """Tests for segments stored alongside the transcript text."""
+
+    def test_round_trip(self, storage):
+        storage.db.create_podcast('show', 'https://example.com/feed.xml', 'Show')
+        storage.db.upsert_episode('show', 'ep-1', original_url='https://example.com/1.mp3')
+        segments = [
+            {'start': 0.0, 'end': 2.5, 'text': 'Welcome back'},
+            {'start': 2.5, 'end': 7.25, 'text': 'Café talk'},
+        ]
+
+        storage.save_transcript('show', 'ep-1', 'text', segments)
+
+        assert storage.get_transcript('show', 'ep-1') == 'text'
+        assert storage.get_transcript_segments('show', 'ep-1') == segments
+
+    def test_text_only_save_clears_segments(self, storage):
+        storage.db.create_podcast('show', 'https://example.com/feed.xml', 'Show')
+        storage.db.upsert_episode('show', 'ep-1', original_url='https://example.com/1.mp3')
+        storage.save_transcript('show', 'ep-1', 'old', [{'start': 0.0, 'end': 1.0, 'text': 'old'}])
+
+        storage.save_transcript('show', 'ep-1', 'new')
+
+        assert storage.get_transcript_segments('show', 'ep-1') is None
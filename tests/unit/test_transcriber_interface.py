@@ -12,3 +12,54 @@ def test_transcriber_exposes_callable_transcribe_method():
     transcriber = Transcriber()
     assert hasattr(transcriber, 'transcribe')
     assert callable(transcriber.transcribe)
+
+
+def test_openai_chunked_transcription_stitches_chunks_in_order(monkeypatch):
+    """Concurrent OpenAI chunks are merged in order with offset timestamps."""
+    import transcriber as transcriber_module
+
+    monkeypatch.setattr(transcriber_module, 'WHISPER_PROVIDER', 'openai')
+    monkeypatch.setattr(transcriber_module, 'TRANSCRIPTION_MAX_CONCURRENCY', 3)
+    monkeypatch.setattr(
+        transcriber_module, 'extract_audio_chunk',
+        lambda path, start, end, output_format='wav': f"chunk-{start:.0f}.{output_format}"
+    )
+
+    transcriber = Transcriber()
+    monkeypatch.setattr(transcriber, 'get_audio_duration', lambda path: 1500.0)
+    monkeypatch.setattr(
+        transcriber, 'transcribe',
+        lambda path, podcast_name=None: [
+            {'start': 0.0, 'end': 5.0, 'text': f"{path} first"},
+            {'start': 300.0, 'end': 305.0, 'text': f"{path} middle"},
+        ]
+    )
+
+    segments = transcriber.transcribe_chunked('episode.mp3')
+
+    starts = [s['start'] for s in segments]
+    assert starts == sorted(starts)
+    assert segments[0]['text'] == 'chunk-0.flac first'
+    assert segments[-1]['text'].startswith('chunk-')
+    assert len(segments) == 6
+
+
+def test_openai_chunked_transcription_fails_if_any_chunk_fails(monkeypatch):
+    import transcriber as transcriber_module
+
+    monkeypatch.setattr(transcriber_module, 'WHISPER_PROVIDER', 'openai')
+    monkeypatch.setattr(
+        transcriber_module, 'extract_audio_chunk',
+        lambda path, start, end, output_format='wav': f"chunk-{start:.0f}"
+    )
+
+    transcriber = Transcriber()
+    monkeypatch.setattr(transcriber, 'get_audio_duration', lambda path: 1500.0)
+    monkeypatch.setattr(
+        transcriber, 'transcribe',
+        lambda path, podcast_name=None: None if path != 'chunk-0' else [
+            {'start': 0.0, 'end': 5.0, 'text': 'ok'}
+        ]
+    )
+
+    assert transcriber.transcribe_chunked('episode.mp3') is None
@@ -0,0 +1,62 @@
+"""Unit tests for utils/audio.py AudioMetadata duration cache."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from utils import audio
+from utils.audio import AudioMetadata
+
+
+@pytest.fixture
+def probe_calls(monkeypatch):
+    """Replace ffprobe with a counter returning a fixed duration."""
+    calls = []
+
+    def fake_probe(path):
+        calls.append(path)
+        return 42.0
+
+    monkeypatch.setattr(audio, 'get_audio_duration', fake_probe)
+    AudioMetadata.clear_cache()
+    yield calls
+    AudioMetadata.clear_cache()
+
+
+class TestAudioMetadata:
+    """Tests for the stat-validated duration cache."""
+
+    def test_probes_unchanged_file_once(self, tmp_path, probe_calls):
+        path = tmp_path / 'episode.mp3'
+        path.write_bytes(b'abc')
+
+        assert AudioMetadata.get_duration(str(path)) == 42.0
+        assert AudioMetadata.get_duration(str(path)) == 42.0
+        assert len(probe_calls) == 1
+
+    def test_rewritten_file_is_probed_again(self, tmp_path, probe_calls):
+        path = tmp_path / 'episode.mp3'
+        path.write_bytes(b'abc')
+        AudioMetadata.get_duration(str(path))
+
+        path.write_bytes(b'abcdef')
+        AudioMetadata.get_duration(str(path))
+        assert len(probe_calls) == 2
+
+    def test_missing_file_is_not_cached(self, tmp_path, probe_calls):
+        path = str(tmp_path / 'missing.mp3')
+        AudioMetadata.get_duration(path)
+        AudioMetadata.get_duration(path)
+        assert len(probe_calls) == 2
+
+    def test_cache_is_bounded(self, tmp_path, probe_calls, monkeypatch):
+        monkeypatch.setattr(AudioMetadata, 'MAX_ENTRIES', 2)
+        paths = []
+        for name in ('a', 'b', 'c'):
+            path = tmp_path / f'{name}.mp3'
+            path.write_bytes(b'x')
+            paths.append(str(path))
+            AudioMetadata.get_duration(str(path))
+
+        assert list(AudioMetadata._cache) == paths[1:]
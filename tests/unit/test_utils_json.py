@@ -0,0 +1,45 @@
+"""Unit tests for utils/json.py encode/decode helpers."""
+import json
+import math
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import numpy as np
+
+from utils import json as json_utils
+from utils.json import json_dumps, json_loads
+
+
+class TestJsonHelpers:
+    """Tests for the orjson-backed helpers and their stdlib fallback."""
+
+    def test_round_trip(self):
+        data = {'ads': [{'start': 1.5, 'end': 30.0, 'sponsor': 'Café'}], 'count': 1}
+        assert json_loads(json_dumps(data)) == data
+        assert json.loads(json_dumps(data)) == data
+
+    def test_non_string_keys_fall_back_to_stdlib(self):
+        assert json_loads(json_dumps({1: 'a'})) == {'1': 'a'}
+
+    def test_numpy_values(self):
+        data = {'start': np.float64(2.5), 'frames': np.array([1.0, 2.0])}
+        if json_utils.orjson is None:
+            pytest.skip("stdlib json does not encode numpy arrays")
+        assert json_loads(json_dumps(data)) == {'start': 2.5, 'frames': [1.0, 2.0]}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(json_utils, 'orjson', None)
+        data = {'start': 1.0, 'text': 'hi'}
+        assert json_loads(json_dumps(data)) == data
+
+    def test_nan_becomes_null_with_orjson(self):
+        if json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+        assert json_loads(json_dumps({'confidence': math.nan})) == {'confidence': None}
+
+    def test_loads_accepts_stdlib_nan_literal(self):
+        parsed = json_loads(json.dumps({'confidence': math.nan}))
+        assert math.isnan(parsed['confidence'])
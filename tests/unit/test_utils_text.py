@@ -0,0 +1,49 @@
+"""Unit tests for utils/text.py parse_transcript_segments function."""
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from utils.text import parse_transcript_segments
+from utils.time import format_vtt_timestamp
+
+
+class TestParseTranscriptSegments:
+    """Tests for parsing stored transcript text back into segments."""
+
+    def test_empty(self):
+        assert parse_transcript_segments('') == []
+        assert parse_transcript_segments(None) == []
+
+    def test_round_trips_stored_format(self):
+        segments = [
+            {'start': 0.0, 'end': 2.5, 'text': 'Welcome back'},
+            {'start': 3723.125, 'end': 3730.0, 'text': 'brackets [sic] stay in text'},
+            {'start': 3730.0, 'end': 3731.0, 'text': ''},
+        ]
+        text = '\n'.join(
+            f"[{format_vtt_timestamp(s['start'])} --> {format_vtt_timestamp(s['end'])}] {s['text']}"
+            for s in segments
+        )
+
+        parsed = parse_transcript_segments(text)
+
+        assert [s['text'] for s in parsed] == [s['text'] for s in segments]
+        assert [s['start'] for s in parsed] == pytest.approx([s['start'] for s in segments])
+        assert [s['end'] for s in parsed] == pytest.approx([s['end'] for s in segments])
+
+    def test_lenient_formats_fall_back(self):
+        text = (
+            "[00:00:01.000 --> 00:00:02.000] canonical\n"
+            "[03:05.5 --> 03:07] short timestamps\n"
+            "[garbage] skipped\n"
+            "not a segment line"
+        )
+
+        parsed = parse_transcript_segments(text)
+
+        assert parsed == [
+            {'start': 1.0, 'end': 2.0, 'text': 'canonical'},
+            {'start': 185.5, 'end': 187.0, 'text': 'short timestamps'},
+        ]
@@ -0,0 +1,265 @@
+"""Unit tests for audio_analysis volume analysis and base data structures."""
+import json
+import random
+
+import numpy as np
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from audio_analysis.base import AudioAnalysisResult, AudioSegmentSignal, LoudnessFrame, LoudnessFrames
+from audio_analysis.volume_analyzer import VolumeAnalyzer, _anomaly_runs_loop, _anomaly_runs_numpy
+
+
+def _frames(values, frame_duration=5.0):
+    """Build contiguous frames from a list of loudness values."""
+    return LoudnessFrames.from_frames([
+        LoudnessFrame(start=i * frame_duration, end=(i + 1) * frame_duration, loudness_lufs=v)
+        for i, v in enumerate(values)
+    ])
+
+
+class TestParseEbur128Output:
+    """Tests for parsing ebur128 framelog lines from raw stderr bytes."""
+
+    def test_parses_measurements_and_peaks(self):
+        stderr = (
+            b"ffmpeg version 6.0 \xff\xfe\n"
+            b"[Parsed_ebur128_0 @ 0x55d0c] t: 0.5       TARGET:-23 LUFS    M: -23.4 S: -22.0"
+            b"     I: -23.0 LUFS       LRA:   0.0 LU  SPK:  -5.2  -5.4 dBFS\n"
+            b"[Parsed_ebur128_0 @ 0x55d0c] t: 0.6  M: -21.4 S: -20.0     I: -23.0 LUFS\n"
+            b"[Parsed_ebur128_0 @ 0x55d0c] Summary:\n"
+        )
+        measurements = VolumeAnalyzer()._parse_ebur128_output(stderr)
+
+        assert measurements == [(0.5, -23.4, -5.2), (0.6, -21.4, -1.0)]
+
+    def test_skips_lines_with_unparseable_peak(self):
+        stderr = (
+            b"[Parsed_ebur128_0 @ 0x1] t: 0.1  TARGET:-23 LUFS    M:-120.7 S:-120.7"
+            b"     I: -70.0 LUFS  LRA:   0.0 LU  SPK:  -inf  -inf dBFS\n"
+        )
+        assert VolumeAnalyzer()._parse_ebur128_output(stderr) == []
+
+
+class TestGroupIntoFrames:
+    """Tests for bucketing raw ebur128 measurements into frames."""
+
+    def test_empty_measurements(self):
+        analyzer = VolumeAnalyzer(frame_duration=5.0)
+        assert len(analyzer._group_into_frames([], 30.0)) == 0
+
+    def test_averages_loudness_and_keeps_max_peak(self):
+        analyzer = VolumeAnalyzer(frame_duration=5.0)
+        measurements = [
+            (0.1, -20.0, -3.0),
+            (2.5, -22.0, -1.0),
+            (5.0, -30.0, -6.0),
+            (9.9, -26.0, -5.0),
+        ]
+        frames = analyzer._group_into_frames(measurements, 10.0)
+
+        assert len(frames) == 2
+        assert (frames[0].start, frames[0].end) == (0.0, 5.0)
+        assert frames[0].loudness_lufs == pytest.approx(-21.0)
+        assert frames[0].peak_dbfs == -1.0
+        assert (frames[1].start, frames[1].end) == (5.0, 10.0)
+        assert frames[1].loudness_lufs == pytest.approx(-28.0)
+        assert frames[1].peak_dbfs == -5.0
+
+    def test_skips_empty_frames_and_clamps_last_frame(self):
+        analyzer = VolumeAnalyzer(frame_duration=5.0)
+        measurements = [(1.0, -20.0, -1.0), (11.0, -24.0, -2.0)]
+        frames = analyzer._group_into_frames(measurements, 12.0)
+
+        assert frames.start.tolist() == [0.0, 10.0]
+        assert frames[-1].end == 12.0
+
+    def test_ignores_measurements_past_duration(self):
+        analyzer = VolumeAnalyzer(frame_duration=5.0)
+        measurements = [(1.0, -20.0, -1.0), (12.5, -24.0, -2.0)]
+        frames = analyzer._group_into_frames(measurements, 10.0)
+
+        assert len(frames) == 1
+
+
+class TestFindAnomalies:
+    """Tests for detecting runs of frames that deviate from the baseline."""
+
+    def test_no_frames(self):
+        assert VolumeAnalyzer()._find_anomalies(LoudnessFrames.empty(), -20.0) == []
+
+    def test_detects_increase_run(self):
+        analyzer = VolumeAnalyzer(anomaly_threshold_db=3.0, min_anomaly_duration=15.0)
+        frames = _frames([-20, -20, -15, -15, -15, -20, -20])
+        anomalies = analyzer._find_anomalies(frames, -20.0)
+
+        assert len(anomalies) == 1
+        signal = anomalies[0]
+        assert (signal.start, signal.end) == (10.0, 25.0)
+        assert signal.signal_type == 'volume_increase'
+        assert signal.details['direction'] == 'increase'
+        assert signal.details['deviation_db'] == 5.0
+        assert signal.confidence == pytest.approx(0.95)
+
+    def test_short_run_is_ignored(self):
+        analyzer = VolumeAnalyzer(anomaly_threshold_db=3.0, min_anomaly_duration=15.0)
+        frames = _frames([-20, -26, -26, -20])
+        assert analyzer._find_anomalies(frames, -20.0) == []
+
+    def test_run_open_at_end_uses_last_frame_end(self):
+        analyzer = VolumeAnalyzer(anomaly_threshold_db=3.0, min_anomaly_duration=15.0)
+        frames = _frames([-20, -25, -25, -25])
+        anomalies = analyzer._find_anomalies(frames, -20.0)
+
+        assert len(anomalies) == 1
+        assert (anomalies[0].start, anomalies[0].end) == (5.0, 20.0)
+        assert anomalies[0].signal_type == 'volume_decrease'
+
+    def test_direction_follows_first_frame(self):
+        analyzer = VolumeAnalyzer(anomaly_threshold_db=3.0, min_anomaly_duration=10.0)
+        frames = _frames([-20, -15, -25, -20])
+        anomalies = analyzer._find_anomalies(frames, -20.0)
+
+        assert len(anomalies) == 1
+        assert anomalies[0].details['direction'] == 'increase'
+
+
+class TestAnomalyRunKernels:
+    """The scalar (Numba) kernel must agree with the NumPy kernel."""
+
+    def test_loop_matches_numpy(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            n = rng.randint(1, 60)
+            starts = np.arange(n, dtype=np.float64) * 5.0
+            boundaries = np.append(starts, n * 5.0 - rng.choice([0.0, 2.5]))
+            deviations = np.array([rng.choice([0.0, 1.0, -4.0, 5.5]) for _ in range(n)])
+            min_duration = rng.choice([5.0, 10.0, 15.0])
+
+            loop = _anomaly_runs_loop(starts, boundaries, deviations, 3.0, min_duration)
+            vectorized = _anomaly_runs_numpy(starts, boundaries, deviations, 3.0, min_duration)
+            assert loop[0].tolist() == vectorized[0].tolist()
+            assert loop[1].tolist() == vectorized[1].tolist()
+            assert loop[2].tolist() == vectorized[2].tolist()
+
+
+class TestComputeBaseline:
+    """Tests for the median loudness baseline."""
+
+    def test_upper_median_ignores_silence(self):
+        frames = _frames([-30, -80, -20, -25, -90, -22])
+        assert VolumeAnalyzer._compute_baseline(frames) == -22.0
+
+    def test_all_silent_returns_none(self):
+        frames = _frames([-80, -75])
+        assert VolumeAnalyzer._compute_baseline(frames) is None
+
+
+class TestLoudnessFrames:
+    """Tests for the struct-of-arrays loudness frame store."""
+
+    def test_round_trips_frame_views(self):
+        original = [
+            LoudnessFrame(start=0.0, end=5.0, loudness_lufs=-20.0, peak_dbfs=-1.0),
+            LoudnessFrame(start=5.0, end=10.0, loudness_lufs=-18.5, peak_dbfs=-0.5),
+        ]
+        frames = LoudnessFrames.from_frames(original)
+
+        assert len(frames) == 2
+        assert frames[1] == original[1]
+        assert frames[-1] == original[-1]
+        assert list(frames) == original
+
+    def test_empty_is_falsy(self):
+        assert not LoudnessFrames.empty()
+        assert len(LoudnessFrames.empty()) == 0
+
+
+class TestAudioSegmentSignal:
+    """Tests for signal serialization."""
+
+    def test_duration_and_dict_round_trip(self):
+        signal = AudioSegmentSignal(
+            start=10.0, end=42.5, signal_type='volume_increase',
+            confidence=0.8, details={'deviation_db': 4.2}
+        )
+        data = signal.to_dict()
+
+        assert signal.duration == 32.5
+        assert data['duration'] == 32.5
+        restored = AudioSegmentSignal.from_dict(data)
+        assert restored == signal
+        assert restored.duration == 32.5
+
+    def test_result_round_trip(self):
+        result = AudioAnalysisResult(
+            signals=[AudioSegmentSignal(0.0, 20.0, 'volume_decrease', 0.6)],
+            loudness_baseline=-19.5,
+            analysis_time_seconds=1.25,
+        )
+        restored = AudioAnalysisResult.from_dict(result.to_dict())
+
+        assert restored.signals == result.signals
+        assert restored.loudness_baseline == -19.5
+        assert restored.analysis_time_seconds == 1.25
+
+    def test_to_json_matches_to_dict(self):
+        result = AudioAnalysisResult(
+            signals=[AudioSegmentSignal(5.0, 25.0, 'volume_increase', 0.7, {'deviation_db': 3.5})],
+            loudness_baseline=-18.0,
+        )
+        assert json.loads(result.to_json()) == result.to_dict()
+
+
+class TestGetSignalsInRange:
+    """Tests for the bisect-backed overlap query."""
+
+    def _result(self):
+        return AudioAnalysisResult(signals=[
+            AudioSegmentSignal(300.0, 330.0, 'volume_increase', 0.9),
+            AudioSegmentSignal(10.0, 200.0, 'dai_transition_pair', 0.9),
+            AudioSegmentSignal(100.0, 120.0, 'volume_decrease', 0.9),
+        ])
+
+    def test_matches_linear_overlap_in_list_order(self):
+        result = self._result()
+        for start, end in [(0, 50), (110, 115), (150, 310), (200, 300), (330, 400), (0, 1000)]:
+            expected = [s for s in result.signals if s.start < end and s.end > start]
+            assert result.get_signals_in_range(start, end) == expected
+
+    def test_index_rebuilds_when_signals_change(self):
+        result = self._result()
+        assert result.get_signals_in_range(500, 600) == []
+
+        late = AudioSegmentSignal(550.0, 580.0, 'volume_increase', 0.9)
+        result.signals.append(late)
+        assert result.get_signals_in_range(500, 600) == [late]
+
+        result.signals = [late]
+        assert result.get_signals_in_range(0, 1000) == [late]
+
+
+class TestGetSignalsByType:
+    """Tests for the cached per-type signal lookup."""
+
+    def test_groups_and_tracks_appends(self):
+        increase = AudioSegmentSignal(0.0, 20.0, 'volume_increase', 0.9)
+        pair = AudioSegmentSignal(30.0, 90.0, 'dai_transition_pair', 0.9)
+        result = AudioAnalysisResult(signals=[increase, pair])
+
+        assert result.get_signals_by_type('volume_increase') == [increase]
+        assert result.get_signals_by_type('volume_decrease') == []
+
+        decrease = AudioSegmentSignal(100.0, 130.0, 'volume_decrease', 0.9)
+        result.signals.append(decrease)
+        assert result.get_signals_by_type('volume_decrease') == [decrease]
+
+    def test_returned_list_is_independent(self):
+        signal = AudioSegmentSignal(0.0, 20.0, 'volume_increase', 0.9)
+        result = AudioAnalysisResult(signals=[signal])
+
+        result.get_signals_by_type('volume_increase').clear()
+        assert result.get_signals_by_type('volume_increase') == [signal]